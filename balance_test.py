@@ -0,0 +1,103 @@
+from rpg.balance import simulate, simulate_monster, by_difficulty
+from rpg.combat import (
+    ATTACK, HEAL, WON, MONSTER_RULES, BOSS_RULES, TUTORIAL_RULES,
+    CombatState, resolve
+)
+import random
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+GOBLIN = {'name': 'Goblin', 'health': 30, 'damage': 5,
+          'difficulty': 'easy'}
+ORC = {'name': 'Orc', 'health': 80, 'damage': 15, 'difficulty': 'hard'}
+
+
+def engine_win_rate(monster: dict, health: int, damage: int,
+                    fights: int) -> float:
+    """
+    Play fights one turn at a time with the combat engine.
+    """
+    rng = random.Random(1)
+    wins = 0
+    for _ in range(fights):
+        state = CombatState(health, damage, 0, monster['health'],
+                            monster['damage'])
+        while state.outcome is None:
+            heal = state.action_count >= 3 and state.health < 50
+            state, _ = resolve(state, HEAL if heal else ATTACK,
+                               MONSTER_RULES, rng)
+        wins += state.outcome == WON
+    return wins / fights
+
+
+@unittest.skipUnless(np, "NumPy is not installed")
+class TestBalance(unittest.TestCase):
+
+    def test_matches_the_combat_engine(self):
+        """
+        Test that the vectorized fights agree with the combat engine.
+        """
+        result = simulate_monster(ORC, healths=(70,), damages=(10,),
+                                  fights=20000,
+                                  rng=np.random.default_rng(0))[0]
+        expected = engine_win_rate(ORC, 70, 10, 2000)
+        self.assertAlmostEqual(result['win_rate'], expected, delta=0.05)
+        self.assertAlmostEqual(
+            result['win_rate'] + result['loss_rate'] + result['flee_rate'],
+            1.0
+        )
+
+    def test_sure_win(self):
+        """
+        Test a fight that always ends with the first attack.
+        """
+        result = simulate_monster(GOBLIN, healths=(100,), damages=(30,),
+                                  fights=100)[0]
+        self.assertEqual(result['win_rate'], 1.0)
+        self.assertEqual(result['turns'], 1.0)
+        self.assertEqual(result['health_lost'], 0.0)
+
+    def test_running_away(self):
+        """
+        Test that a player who runs at once never wins or loses.
+        """
+        result = simulate_monster(ORC, healths=(40,), damages=(5,),
+                                  fights=100, run_below=101)[0]
+        self.assertEqual(result['flee_rate'], 1.0)
+        self.assertEqual(result['health_lost'], 20.0)
+
+    def test_by_difficulty(self):
+        """
+        Test that results are averaged per difficulty.
+        """
+        results = simulate([GOBLIN, ORC], healths=(100,), damages=(10, 20),
+                           fights=200, seed=3)
+        self.assertEqual(len(results), 4)
+        summary = by_difficulty(results)
+        self.assertEqual(
+            [(row['difficulty'], row['damage']) for row in summary],
+            [('easy', 10), ('easy', 20), ('hard', 10), ('hard', 20)]
+        )
+        self.assertEqual(summary[0]['win_rate'], 1.0)
+
+
+class TestSimulatedRules(unittest.TestCase):
+
+    def test_unsupported_rules(self):
+        """
+        Test that rules the simulator does not model are refused.
+        """
+        for rules in (BOSS_RULES, TUTORIAL_RULES):
+            with self.assertRaises(ValueError):
+                simulate_monster(GOBLIN, fights=1, rules=rules)
+
+
+if __name__ == '__main__':
+    unittest.main()
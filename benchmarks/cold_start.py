@@ -0,0 +1,85 @@
+"""
+Cold start benchmark for loading the game content.
+
+Every measurement runs in a fresh interpreter so nothing is cached in
+memory between runs. Three strategies are compared:
+
+    legacy    - the per-call JSON parsing the game did before the content
+                registry (descriptions once, the NPC file once per room
+                built and once for the traders, monsters once)
+    json      - parsing each JSON file once
+    snapshot  - reading the compiled binary content snapshot
+
+Usage:
+    python benchmarks/cold_start.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from rpg.content_snapshot import build_snapshot  # noqa: E402
+
+SETUP = "import time, json, os\nfrom rpg import content_snapshot as cs\n"
+
+STRATEGIES = {
+    'legacy': """
+start = time.perf_counter()
+for filename, times in (('descriptions.json', 1),
+                        ('npc_diaologues.json', 6),
+                        ('monsters.json', 1)):
+    for _ in range(times):
+        with open(os.path.join(cs.CONTENT_DIR, filename)) as f:
+            json.load(f)
+""",
+    'json': """
+start = time.perf_counter()
+cs.compile_content()
+""",
+    'snapshot': """
+start = time.perf_counter()
+cs.read_snapshot(cs.content_key(), cs.snapshot_path())
+""",
+}
+
+
+def run_once(body: str) -> float:
+    """
+    Run one strategy in a fresh interpreter.
+
+    Args:
+        body (str): The code to time.
+
+    Returns:
+        float: The load time in milliseconds.
+    """
+    code = SETUP + body + "print((time.perf_counter() - start) * 1000)\n"
+    output = subprocess.run(
+        [sys.executable, '-c', code], cwd=ROOT,
+        capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.strip())
+
+
+def main(runs: int = 20) -> None:
+    """
+    Build the snapshot and print the median load time of every strategy.
+
+    Args:
+        runs (int, optional): Fresh interpreters started per strategy.
+
+    Returns:
+        None
+    """
+    build_snapshot()
+    print(f"Median content load time over {runs} cold starts:")
+    for name, body in STRATEGIES.items():
+        timings = [run_once(body) for _ in range(runs)]
+        print(f"  {name:<9} {statistics.median(timings):8.3f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
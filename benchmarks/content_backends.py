@@ -0,0 +1,181 @@
+"""
+Benchmark of the JSON and SQLite content backends.
+
+For every catalog size the same synthetic items and monsters are written
+to JSON files and to a content database. Each backend is then timed on:
+
+    open          - time until the first loot draw and monster lookup can
+                    be served (parsing and indexing for JSON, opening the
+                    database for SQLite)
+    get           - looking up a monster by name
+    difficulty    - listing the monsters of one difficulty
+    sample        - sampling three undefeated monsters
+    draw          - drawing one loot item
+    find          - finding the rare damage items under a price
+
+Lookup timings are the median per call in microseconds.
+
+Usage:
+    python benchmarks/content_backends.py [size ...]
+"""
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from rpg.content import ContentRegistry  # noqa: E402
+from rpg.content_db import SQLiteRegistry, build_database  # noqa: E402
+from rpg.loot import RARITY_WEIGHTS  # noqa: E402
+
+SIZES = (100, 10_000, 1_000_000)
+DIFFICULTIES = ('easy', 'medium', 'hard')
+CALLS = 2000
+
+
+def write_content(directory: str, size: int) -> None:
+    """
+    Write synthetic content files with `size` items and monsters.
+
+    Args:
+        directory (str): Where to write the files.
+        size (int): The number of items and of monsters.
+
+    Returns:
+        None
+    """
+    rng = random.Random(size)
+    rarities = list(RARITY_WEIGHTS)
+    items = [
+        {"name": f"Item {i}", "rarity": rng.choice(rarities),
+         "effect_type": rng.choice(("health", "damage")),
+         "value": rng.randint(1, 50), "description": "Synthetic.",
+         "price": rng.randint(1, 100)}
+        for i in range(size)
+    ]
+    monsters = [
+        {"name": f"Monster {i}", "description": "Synthetic.",
+         "health": rng.randint(10, 100), "damage": rng.randint(1, 20),
+         "difficulty": rng.choice(DIFFICULTIES)}
+        for i in range(size)
+    ]
+    files = {
+        'items.json': {"items": items, "epic_rewards": []},
+        'monsters.json': {"monsters": monsters},
+        'npc_diaologues.json': {"npcs": [], "traders": []},
+        'descriptions.json': {"room_descriptions": [],
+                              "door_descriptions": []},
+    }
+    for filename, data in files.items():
+        with open(os.path.join(directory, filename), 'w') as f:
+            json.dump(data, f)
+
+
+def open_backend(name: str, directory: str) -> tuple:
+    """
+    Open a backend and build what the first draw and lookup need.
+
+    Args:
+        name (str): 'json' or 'sqlite'.
+        directory (str): The directory holding the content.
+
+    Returns:
+        tuple: The registry and the time it took, in milliseconds.
+    """
+    start = time.perf_counter()
+    if name == 'json':
+        registry = ContentRegistry(directory)
+    else:
+        registry = SQLiteRegistry(
+            os.path.join(directory, 'content.sqlite3'), directory
+        )
+    registry.loot_table
+    registry.monster_catalog
+    return registry, (time.perf_counter() - start) * 1000
+
+
+def time_calls(call, calls: int = CALLS) -> float:
+    """
+    Time a call repeatedly.
+
+    Args:
+        call: A function without arguments.
+        calls (int, optional): How many times to call it.
+
+    Returns:
+        float: The median time per call in microseconds.
+    """
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1_000_000
+
+
+def measure(registry: ContentRegistry, size: int) -> dict:
+    """
+    Time every lookup of a backend.
+
+    Args:
+        registry (ContentRegistry): The opened backend.
+        size (int): The number of items and of monsters.
+
+    Returns:
+        dict: The median time per call of every lookup.
+    """
+    rng = random.Random(0)
+    catalog = registry.monster_catalog
+    loot_table = registry.loot_table
+    defeated = {f"Monster {i}" for i in range(0, size, 2)}
+    return {
+        'get': time_calls(
+            lambda: catalog.get(f"Monster {rng.randrange(size)}")),
+        'difficulty': time_calls(
+            lambda: catalog.with_difficulty(rng.choice(DIFFICULTIES)),
+            calls=20),
+        'sample': time_calls(
+            lambda: catalog.sample_undefeated(3, defeated, rng)),
+        'draw': time_calls(lambda: loot_table.draw(rng)),
+        'find': time_calls(
+            lambda: registry.find_items('rare', 'damage', 5), calls=20),
+    }
+
+
+def main(sizes: tuple = SIZES) -> None:
+    """
+    Print the timings of both backends for every catalog size.
+
+    Args:
+        sizes (tuple, optional): The catalog sizes to compare.
+
+    Returns:
+        None
+    """
+    columns = ('open', 'get', 'difficulty', 'sample', 'draw', 'find')
+    print(f"{'size':>9} {'backend':<7} {'open ms':>9} "
+          + " ".join(f"{column + ' us':>13}" for column in columns[1:]))
+    for size in sizes:
+        directory = tempfile.mkdtemp()
+        try:
+            write_content(directory, size)
+            build_database(ContentRegistry(directory),
+                           os.path.join(directory, 'content.sqlite3'))
+            for name in ('json', 'sqlite'):
+                registry, opened = open_backend(name, directory)
+                timings = measure(registry, size)
+                print(f"{size:>9} {name:<7} {opened:9.1f} "
+                      + " ".join(f"{timings[column]:13.1f}"
+                                 for column in columns[1:]))
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main(tuple(int(size) for size in sys.argv[1:]) or SIZES)
@@ -0,0 +1,180 @@
+"""
+Benchmark of world generation throughput and memory.
+
+For every size a fresh interpreter builds that many rooms through the
+game's own generation path: the doors of each room are discovered
+(room.add_doors), then the room is built (room.__init__ and
+room.initialize_npcs) and its traders are looked at, as when a player
+walks in. Rooms are visited in the breadth first order they are
+discovered in. Reported per size:
+
+    rooms/s         - rooms built per second
+    peak RSS        - the peak resident memory of the interpreter, in MiB
+    bytes/room      - how much the peak grew while generating, per room
+    opens           - files opened while generating, content included
+    parses          - JSON documents parsed while generating
+
+The world keeps `--cache-size` rooms in memory (the rest are paged out),
+so the memory figures show the cost of the world itself rather than of
+keeping every room object alive.
+
+Usage:
+    python benchmarks/world_generation.py [--json] [--cache-size N]
+        [size ...]
+"""
+import argparse
+import builtins
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SIZES = (10_000, 100_000, 1_000_000)
+CACHE_SIZE = 1024
+
+
+def peak_rss() -> int:
+    """
+    Return the peak resident memory of this interpreter.
+
+    Args:
+        None
+
+    Returns:
+        int: The peak in bytes.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def count_io() -> dict:
+    """
+    Count file opens and JSON parses from now on.
+
+    Args:
+        None
+
+    Returns:
+        dict: The counters, updated as files are opened and parsed.
+    """
+    counters = {'opens': 0, 'parses': 0}
+
+    def counted(function, counter):
+        def wrapper(*args, **kwargs):
+            counters[counter] += 1
+            return function(*args, **kwargs)
+        return wrapper
+
+    builtins.open = counted(builtins.open, 'opens')
+    json.load = counted(json.load, 'parses')
+    json.loads = counted(json.loads, 'parses')
+    return counters
+
+
+def generate(size: int, cache_size: int) -> dict:
+    """
+    Build `size` rooms of a new world and measure it.
+
+    Meant to run in a fresh interpreter, so the counters and the peak
+    memory only cover one size.
+
+    Args:
+        size (int): The number of rooms to build.
+        cache_size (int): The most rooms kept in memory.
+
+    Returns:
+        dict: The measurements.
+    """
+    counters = count_io()
+    from rpg.content import get_registry
+    from rpg.world import World
+
+    # The content is loaded before measuring memory, its files are still
+    # counted
+    get_registry()
+    start_peak = peak_rss()
+    start = time.perf_counter()
+    world = World(seed=size, cache_size=cache_size)
+    for room_id in range(size):
+        world.discover(room_id)
+        world.room(room_id).traders
+    elapsed = time.perf_counter() - start
+    end_peak = peak_rss()
+
+    return {
+        'size': size,
+        'cache_size': cache_size,
+        'seconds': elapsed,
+        'rooms_per_second': size / elapsed,
+        'peak_rss_bytes': end_peak,
+        'bytes_per_room': (end_peak - start_peak) / size,
+        'known_rooms': len(world),
+        'file_opens': counters['opens'],
+        'json_parses': counters['parses'],
+    }
+
+
+def run_once(size: int, cache_size: int) -> dict:
+    """
+    Measure one size in a fresh interpreter.
+
+    Args:
+        size (int): The number of rooms to build.
+        cache_size (int): The most rooms kept in memory.
+
+    Returns:
+        dict: The measurements.
+    """
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child',
+         '--cache-size', str(cache_size), str(size)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def main(argv: list = None) -> None:
+    """
+    Print the measurements of every size, as a table or as JSON.
+
+    Args:
+        argv (list, optional): The command line arguments
+        (default is sys.argv[1:]).
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('sizes', nargs='*', type=int, default=SIZES)
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE)
+    parser.add_argument('--json', action='store_true',
+                        help="print one JSON document with every result")
+    parser.add_argument('--child', action='store_true',
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(generate(args.sizes[0], args.cache_size)))
+        return
+
+    results = [run_once(size, args.cache_size) for size in args.sizes]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'size':>9} {'rooms/s':>10} {'peak MiB':>9} {'bytes/room':>11} "
+          f"{'opens':>6} {'parses':>7}")
+    for result in results:
+        print(f"{result['size']:>9} {result['rooms_per_second']:10.0f} "
+              f"{result['peak_rss_bytes'] / 2 ** 20:9.1f} "
+              f"{result['bytes_per_room']:11.1f} "
+              f"{result['file_opens']:>6} {result['json_parses']:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+from rpg.calibration import (
+    Arrival, fight_monster, simulate_run, fight_boss, boss_rules, calibrate
+)
+from rpg.combat import WON, LOST, FLED, BOSS_RULES
+import random
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+GOBLIN = {'name': 'Goblin', 'health': 30, 'damage': 5,
+          'difficulty': 'easy'}
+DRAGON = {'name': 'Dragon', 'health': 100, 'damage': 60,
+          'difficulty': 'hard'}
+
+
+class TestRuns(unittest.TestCase):
+
+    def test_fight_monster_won(self):
+        """
+        Test that a weak monster is beaten by attacking.
+        """
+        state = fight_monster(100, 10, 0, GOBLIN, random.Random(1))
+        self.assertEqual(state.outcome, WON)
+        self.assertEqual((state.health, state.action_count), (90, 3))
+
+    def test_fight_monster_runs_away(self):
+        """
+        Test that the player runs away before a deadly attack.
+        """
+        state = fight_monster(100, 10, 0, DRAGON, random.Random(1))
+        self.assertEqual(state.outcome, FLED)
+        self.assertEqual(state.health, 20)
+
+    def test_fight_monster_lost(self):
+        """
+        Test that a fight can still be lost when running is too late.
+        """
+        state = fight_monster(100, 10, 3, DRAGON, random.Random(1),
+                              heal_below=0)
+        self.assertIn(state.outcome, (FLED, LOST))
+
+    def test_simulate_run_without_searching(self):
+        """
+        Test that a player who never looks for items only gains damage
+        from Cornelia.
+        """
+        for seed in range(20):
+            arrival = simulate_run(random.Random(seed), search_rate=0.0)
+            if arrival is None:
+                continue
+            self.assertEqual(arrival.potions, ())
+            self.assertIn(arrival.damage, (10, 25, 28, 30))
+
+    def test_simulate_run_is_seeded(self):
+        """
+        Test that a run only depends on its random number source.
+        """
+        self.assertEqual(simulate_run(random.Random(7)),
+                         simulate_run(random.Random(7)))
+
+    @patch('rpg.calibration.FINAL_ROOMS', (2, 2))
+    def test_simulate_run_length(self):
+        """
+        Test that the run stops at the final room.
+        """
+        arrival = simulate_run(random.Random(1), search_rate=0.0)
+        self.assertEqual(arrival.damage, 10)
+
+
+class TestBossFight(unittest.TestCase):
+
+    def test_one_hit(self):
+        """
+        Test that a boss with less health than the player's damage is
+        beaten.
+        """
+        self.assertTrue(fight_boss(Arrival(1, 300, 0, ()), 250, BOSS_RULES,
+                                   random.Random(1)))
+
+    def test_hopeless(self):
+        """
+        Test that a player without damage to speak of loses.
+        """
+        self.assertFalse(fight_boss(Arrival(100, 1, 0, ()), 300, BOSS_RULES,
+                                    random.Random(1)))
+
+    def test_potions_help(self):
+        """
+        Test that health items carried in win more fights.
+        """
+        rng = random.Random(1)
+        without = sum(fight_boss(Arrival(100, 40, 0, ()), 300, BOSS_RULES,
+                                 rng) for _ in range(300))
+        with_potions = sum(fight_boss(Arrival(100, 40, 0, (50, 50)), 300,
+                                      BOSS_RULES, rng) for _ in range(300))
+        self.assertGreater(with_potions, without)
+
+    def test_boss_rules(self):
+        """
+        Test that only the boss damage range is replaced.
+        """
+        rules = boss_rules((5, 10))
+        self.assertEqual(rules.enemy_damage_range, (5, 10))
+        self.assertFalse(rules.item_is_action)
+        self.assertEqual(BOSS_RULES.enemy_damage_range, (20, 40))
+
+
+class TestCalibrate(unittest.TestCase):
+
+    def test_curves(self):
+        """
+        Test that a weaker boss is beaten more often.
+        """
+        results = calibrate(runs=60, health_ranges=((100, 150), (400, 450)),
+                            damage_ranges=((20, 40),), fights=2,
+                            search_rate=0.3, workers=1)
+        easy, hard = results['curves']
+        self.assertEqual((easy['health'], easy['damage']),
+                         ((100, 150), (20, 40)))
+        self.assertEqual(easy['fights'], 2 * len(results['arrivals']))
+        self.assertGreater(easy['win_rate'], hard['win_rate'])
+        self.assertEqual(results['reach_rate'],
+                         len(results['arrivals']) / 60)
+
+    @patch('rpg.calibration.CHUNK_RUNS', 10)
+    def test_workers_do_not_change_results(self):
+        """
+        Test that the results are the same with one or several workers.
+        """
+        settings = dict(runs=25, health_ranges=((250, 300),),
+                        damage_ranges=((20, 40),), fights=1, seed=3)
+        self.assertEqual(calibrate(workers=1, **settings),
+                         calibrate(workers=2, **settings))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,255 @@
+from rpg.combat import (
+    ATTACK, DEFEND, HEAL, ITEM, RUN, PASS, WON, LOST, FLED, MONSTER_RULES,
+    BOSS_RULES, TUTORIAL_RULES, CombatState, resolve, Attacked, Braced,
+    Healed, HealRefused, EnemyAttacked, Rescued, Fled, EnemyDefeated,
+    PlayerDefeated, GroupState, group_state, resolve_group, TargetAttacked,
+    TargetDefeated, EnemiesAttacked
+)
+import random
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestCombat(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a fight against an enemy with 30 health and 8 damage.
+        """
+        self.state = CombatState(health=100, damage=10, action_count=0,
+                                 enemy_health=30, enemy_damage=8)
+
+    def test_attack(self):
+        """
+        Test that an attack is answered by the enemy.
+        """
+        state, events = resolve(self.state, ATTACK, MONSTER_RULES)
+        self.assertEqual(events, [Attacked(10, 20),
+                                  EnemyAttacked(8, False, 92)])
+        self.assertEqual((state.health, state.enemy_health,
+                          state.action_count), (92, 20, 1))
+        self.assertIsNone(state.outcome)
+        self.assertEqual(self.state.enemy_health, 30)
+
+    def test_enemy_defeated(self):
+        """
+        Test that a defeated enemy does not answer.
+        """
+        state, events = resolve(self.state._replace(enemy_health=10),
+                                ATTACK, MONSTER_RULES)
+        self.assertEqual(events, [Attacked(10, 0), EnemyDefeated()])
+        self.assertEqual(state.outcome, WON)
+        self.assertEqual(state.health, 100)
+
+    def test_defend_against_monsters(self):
+        """
+        Test that bracing against a monster takes half its damage at once.
+        """
+        state, events = resolve(self.state, DEFEND, MONSTER_RULES)
+        self.assertEqual(events, [Braced(4, 96), EnemyAttacked(8, False, 88)])
+        self.assertFalse(state.defending)
+
+    def test_defend_against_the_boss(self):
+        """
+        Test that defending halves the boss's next attack.
+        """
+        rng = MagicMock()
+        rng.randint.return_value = 30
+        state, events = resolve(self.state, DEFEND, BOSS_RULES, rng)
+        self.assertEqual(events, [Braced(0, 100),
+                                  EnemyAttacked(15, True, 85)])
+        rng.randint.assert_called_once_with(20, 40)
+        self.assertFalse(state.defending)
+
+    def test_heal(self):
+        """
+        Test that healing waits for the cooldown and caps the health.
+        """
+        rng = MagicMock()
+        rng.randint.return_value = 25
+        state, events = resolve(self.state, HEAL, MONSTER_RULES, rng)
+        self.assertEqual(events[0], HealRefused())
+        rng.randint.assert_not_called()
+
+        ready = self.state._replace(health=90, action_count=3)
+        state, events = resolve(ready, HEAL, MONSTER_RULES, rng)
+        self.assertEqual(events[0], Healed(25, 100, True))
+        self.assertEqual((state.health, state.action_count), (92, 0))
+
+    def test_item_takes_no_time_against_the_boss(self):
+        """
+        Test that the boss does not answer an item.
+        """
+        state, events = resolve(self.state, ITEM, BOSS_RULES)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(state, self.state)
+
+    def test_run(self):
+        """
+        Test both ways of running away.
+        """
+        state, events = resolve(self.state._replace(health=45), RUN,
+                                MONSTER_RULES)
+        self.assertEqual(events, [Fled(22.5, 22.5)])
+        self.assertEqual(state.outcome, FLED)
+        state, events = resolve(self.state._replace(health=1), RUN,
+                                TUTORIAL_RULES)
+        self.assertEqual(events, [Fled(0, 1)])
+
+    def test_tutorial_rescue(self):
+        """
+        Test that the tutorial heals a losing player.
+        """
+        state, events = resolve(self.state._replace(health=55), PASS,
+                                TUTORIAL_RULES)
+        self.assertEqual(events, [EnemyAttacked(8, False, 47),
+                                  Rescued(100)])
+        self.assertEqual(state.health, 100)
+
+    def test_player_defeated(self):
+        """
+        Test that the fight is lost when the player's health runs out.
+        """
+        state, events = resolve(self.state._replace(health=8), PASS,
+                                MONSTER_RULES)
+        self.assertEqual(events[-1], PlayerDefeated())
+        self.assertEqual(state.outcome, LOST)
+
+    def test_fights_end(self):
+        """
+        Test that random fights always end in a known outcome.
+        """
+        rng = random.Random(3)
+        actions = [ATTACK, DEFEND, HEAL, ITEM, PASS]
+        for rules in (MONSTER_RULES, BOSS_RULES, TUTORIAL_RULES):
+            for _ in range(100):
+                state = self.state
+                while state.outcome is None:
+                    state, _ = resolve(state, rng.choice(actions), rules, rng)
+                self.assertIn(state.outcome, (WON, LOST))
+
+
+class TestGroupCombat(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a fight against three enemies with 8, 6 and 5 damage.
+        """
+        self.state = group_state(100, 10, 0, [30, 10, 25], [8, 6, 5])
+
+    def test_group_state(self):
+        """
+        Test that the totals only count living enemies.
+        """
+        state = group_state(100, 10, 0, [30, 0, 25], [8, 6, 5])
+        self.assertEqual((state.strike, state.braced, state.alive),
+                         (13, 6, 2))
+
+    def test_enemies_strike_together(self):
+        """
+        Test that every living enemy answers an attack at once.
+        """
+        state, events = resolve_group(self.state, ATTACK, MONSTER_RULES, 0)
+        self.assertEqual(events, [TargetAttacked(0, 10, 20),
+                                  EnemiesAttacked(19, 3, False, 81)])
+        self.assertEqual(state.enemy_health, (20, 10, 25))
+        self.assertEqual(self.state.enemy_health, (30, 10, 25))
+
+    def test_defeated_enemy_stops_attacking(self):
+        """
+        Test that a defeated enemy no longer counts in the strike.
+        """
+        state, events = resolve_group(self.state, ATTACK, MONSTER_RULES, 1)
+        self.assertEqual(events, [TargetAttacked(1, 10, 0),
+                                  TargetDefeated(1),
+                                  EnemiesAttacked(13, 2, False, 87)])
+        self.assertEqual((state.strike, state.alive), (13, 2))
+
+    def test_default_target(self):
+        """
+        Test that attacks without a living target hit the first living
+        enemy.
+        """
+        state, _ = resolve_group(self.state, ATTACK, MONSTER_RULES, 1)
+        for target in (None, 1, 7):
+            _, events = resolve_group(state, ATTACK, MONSTER_RULES, target)
+            self.assertEqual(events[0], TargetAttacked(0, 10, 20))
+
+    def test_all_defeated(self):
+        """
+        Test that the fight is won when the last enemy falls.
+        """
+        state = group_state(50, 10, 0, [0, 10], [8, 6])
+        state, events = resolve_group(state, ATTACK, MONSTER_RULES, 1)
+        self.assertEqual(events, [TargetAttacked(1, 10, 0),
+                                  TargetDefeated(1), EnemyDefeated()])
+        self.assertEqual((state.outcome, state.health), (WON, 50))
+
+    def test_brace_immediately(self):
+        """
+        Test that defending against monsters takes half of every attack
+        at once, then every attack.
+        """
+        state, events = resolve_group(self.state, DEFEND, MONSTER_RULES)
+        self.assertEqual(events, [Braced(9, 91),
+                                  EnemiesAttacked(19, 3, False, 72)])
+
+    def test_defend_halves_every_hit(self):
+        """
+        Test that defending against the boss halves every enemy's hit.
+        """
+        rng = MagicMock()
+        rng.randint.side_effect = [21, 30, 40]
+        state, events = resolve_group(self.state, DEFEND, BOSS_RULES,
+                                      rng=rng)
+        self.assertEqual(events, [Braced(0, 100),
+                                  EnemiesAttacked(45, 3, True, 55)])
+        self.assertFalse(state.defending)
+
+    def test_run(self):
+        """
+        Test that running away ends the fight without an answer.
+        """
+        state, events = resolve_group(self.state, RUN, MONSTER_RULES)
+        self.assertEqual(events, [Fled(50.0, 50.0)])
+        self.assertEqual(state.outcome, FLED)
+
+    def test_matches_single_fight(self):
+        """
+        Test that a group of one plays like a one on one fight.
+        """
+        rng = random.Random(5)
+        single_rng = random.Random(5)
+        actions = [ATTACK, DEFEND, HEAL, ITEM, PASS]
+        for rules in (MONSTER_RULES, BOSS_RULES, TUTORIAL_RULES):
+            group = group_state(100, 10, 0, [60], [8])
+            single = CombatState(100, 10, 0, 60, 8)
+            while single.outcome is None:
+                action = rng.choice(actions)
+                single_rng.choice(actions)
+                group, _ = resolve_group(group, action, rules, rng=rng)
+                single, _ = resolve(single, action, rules, single_rng)
+                self.assertEqual(
+                    (group.health, group.action_count,
+                     group.enemy_health[0], group.outcome),
+                    (single.health, single.action_count,
+                     single.enemy_health, single.outcome)
+                )
+
+    def test_large_group(self):
+        """
+        Test that a large group keeps its totals as enemies fall.
+        """
+        state = group_state(10 ** 6, 10, 0, [10] * 50, list(range(50)))
+        self.assertIsInstance(state, GroupState)
+        for target in range(49):
+            state, _ = resolve_group(state, ATTACK, MONSTER_RULES, target)
+        self.assertEqual((state.strike, state.braced, state.alive),
+                         (49, 24, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
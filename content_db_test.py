@@ -0,0 +1,168 @@
+from rpg.content import ContentRegistry
+from rpg.content_db import SQLiteRegistry, build_database, open_registry
+from rpg.content_snapshot import CONTENT_DIR, CONTENT_FILES, load_content
+import json
+import random
+import sqlite3
+import unittest
+from unittest.mock import patch
+import shutil
+import tempfile
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestSQLiteRegistry(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Store the game content in a temporary database.
+        """
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, 'content.sqlite3')
+        cls.json = ContentRegistry.from_data(load_content())
+        build_database(cls.json, cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        self.database = SQLiteRegistry(self.path)
+
+    def tearDown(self):
+        self.database.connection.close()
+
+    def test_sections_match(self):
+        """
+        Test that the database serves the same sections as the JSON files.
+        """
+        self.assertEqual(self.database.monsters, self.json.monsters)
+        self.assertEqual(self.database.epic_rewards, self.json.epic_rewards)
+        self.assertEqual([item.template for item in self.database.items],
+                         [item.template for item in self.json.items])
+        self.assertEqual(self.database.traders, self.json.traders)
+
+    def test_monster_lookups(self):
+        """
+        Test that monsters are found by name and difficulty.
+        """
+        database = self.database.monster_catalog
+        catalog = self.json.monster_catalog
+        self.assertEqual(len(database), len(catalog))
+        self.assertEqual(database.get("Goblin"), catalog.get("Goblin"))
+        self.assertIsNone(database.get("Nobody"))
+        self.assertEqual(database.with_difficulty("hard"),
+                         catalog.with_difficulty("hard"))
+
+    def test_sample_undefeated(self):
+        """
+        Test that sampling draws the same monsters as the JSON catalog.
+        """
+        defeated = {"Goblin", "Orc"}
+        self.assertEqual(
+            self.database.monster_catalog.sample_undefeated(
+                3, defeated, random.Random(7)),
+            self.json.monster_catalog.sample_undefeated(
+                3, defeated, random.Random(7))
+        )
+
+    def test_loot_draws_match(self):
+        """
+        Test that loot draws give the same items as the JSON loot table.
+        """
+        database = self.database.loot_table.draw_many(50, random.Random(3))
+        catalog = self.json.loot_table.draw_many(50, random.Random(3))
+        self.assertEqual(
+            [item and item.template for item in database],
+            [item and item.template for item in catalog]
+        )
+
+    def test_item_templates(self):
+        """
+        Test that templates are looked up by id and shared with the JSON
+        registry.
+        """
+        for template_id, template in self.json.item_templates.items():
+            self.assertIs(self.database.item_templates.get(template_id),
+                          template)
+        self.assertIsNone(self.database.item_templates.get('items/Nothing'))
+        self.assertEqual(len(self.database.item_templates),
+                         len(self.json.item_templates))
+
+    def test_find_items(self):
+        """
+        Test that indexed queries agree with the JSON registry.
+        """
+        for criteria in ({}, {'rarity': 'rare'}, {'effect_type': 'damage'},
+                         {'rarity': 'common', 'max_price': 10}):
+            self.assertEqual(self.database.find_items(**criteria),
+                             self.json.find_items(**criteria))
+
+    def test_pack_over_database(self):
+        """
+        Test that content packs can be laid over the database.
+        """
+        modded = self.database.with_pack(self.directory)
+        self.assertIs(modded.loot_table, self.database.loot_table)
+        self.assertEqual(modded.monsters, self.json.monsters)
+
+    @patch('builtins.print')
+    def test_missing_database_falls_back(self, mock_print):
+        """
+        Test that a missing database falls back to the JSON content.
+        """
+        registry = open_registry(os.path.join(self.directory, 'none.db'),
+                                 CONTENT_DIR)
+        self.assertNotIsInstance(registry, SQLiteRegistry)
+        self.assertEqual(registry.monsters, self.json.monsters)
+        mock_print.assert_called_once()
+
+
+class TestStaleDatabase(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Copy the game content and build a database from the copy.
+        """
+        self.directory = tempfile.mkdtemp()
+        for filename in CONTENT_FILES:
+            shutil.copy(os.path.join(CONTENT_DIR, filename), self.directory)
+        self.path = os.path.join(self.directory, 'content.sqlite3')
+        build_database(ContentRegistry(self.directory), self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @patch('builtins.print')
+    def test_edited_source_is_served(self, mock_print):
+        """
+        Test that a source file edited after the database was built is
+        served instead of the stale database.
+        """
+        database = SQLiteRegistry(self.path, self.directory)
+        database.connection.close()
+
+        monsters_file = os.path.join(self.directory, 'monsters.json')
+        with open(monsters_file) as f:
+            data = json.load(f)
+        data['monsters'].append({
+            "name": "Newbie", "description": "Fresh from the editor.",
+            "health": 10, "damage": 1, "difficulty": "easy"
+        })
+        with open(monsters_file, 'w') as f:
+            json.dump(data, f)
+
+        with self.assertRaises(sqlite3.Error):
+            SQLiteRegistry(self.path, self.directory)
+        registry = open_registry(self.path, self.directory)
+        self.assertNotIsInstance(registry, SQLiteRegistry)
+        self.assertEqual(len(registry.monsters), len(data['monsters']))
+        self.assertIsNotNone(registry.monster_catalog.get("Newbie"))
+        mock_print.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
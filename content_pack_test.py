@@ -0,0 +1,156 @@
+from rpg.content import ContentRegistry
+from rpg.content_pack import ContentPack, merge_section
+from rpg.items import Item
+import unittest
+from unittest.mock import patch
+import json
+import shutil
+import tempfile
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+GOBLIN = {"name": "Goblin", "description": "Sneaky.", "health": 30,
+          "damage": 5, "difficulty": "easy"}
+POTION = {"name": "Health Potion", "rarity": "common",
+          "effect_type": "health", "value": 20, "description": "Heals.",
+          "price": 5}
+MILA = {"name": "Mila", "description": "Herbalist.",
+        "dialogues": {"Hello!": {"options": {"Hi.": ["Welcome."]}}}}
+
+
+class TestMergeSection(unittest.TestCase):
+
+    def test_override_and_add(self):
+        """
+        Test that named entries replace or extend the base section.
+        """
+        stronger = dict(GOBLIN, health=60)
+        orc = dict(GOBLIN, name="Orc")
+        merged = merge_section([GOBLIN], [stronger, orc])
+        self.assertEqual(merged, [stronger, orc])
+
+    def test_plain_entries_are_appended(self):
+        """
+        Test that descriptions are added to the base ones.
+        """
+        self.assertEqual(merge_section(["Dark."], ["Damp."]),
+                         ["Dark.", "Damp."])
+
+    def test_empty_overlay_shares_base(self):
+        """
+        Test that an empty overlay returns the base list itself.
+        """
+        base = [GOBLIN]
+        self.assertIs(merge_section(base, []), base)
+
+
+class TestContentPacks(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a base registry and an empty pack directory.
+        """
+        self.base = ContentRegistry.from_data({
+            'items.json': {'items': [POTION], 'epic_rewards': []},
+            'monsters.json': {'monsters': [GOBLIN]},
+            'npc_diaologues.json': {'npcs': [MILA], 'traders': []},
+            'descriptions.json': {'room_descriptions': ["Dark."],
+                                  'door_descriptions': ["Oak."]}
+        })
+        self.pack_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.pack_dir)
+
+    def write_pack(self, filename, data):
+        with open(os.path.join(self.pack_dir, filename), 'w') as f:
+            json.dump(data, f)
+
+    def test_overlay_overrides_and_adds(self):
+        """
+        Test that a pack replaces and adds monsters without changing the
+        base content.
+        """
+        self.write_pack('monsters.json', {'monsters': [
+            dict(GOBLIN, health=60), dict(GOBLIN, name="Orc")
+        ]})
+        modded = self.base.with_pack(self.pack_dir)
+        self.assertEqual(modded.monster_catalog.get("Goblin")['health'], 60)
+        self.assertIsNotNone(modded.monster_catalog.get("Orc"))
+        self.assertEqual(self.base.monster_catalog.get("Goblin")['health'],
+                         30)
+        self.assertIsNone(self.base.monster_catalog.get("Orc"))
+
+    @patch('builtins.print')
+    def test_pack_is_loaded_lazily(self, mock_print):
+        """
+        Test that a pack is not read until its content is requested, and
+        that its missing files are not errors.
+        """
+        modded = self.base.with_pack(self.pack_dir)
+        self.assertEqual(modded.pack._files, {})
+        self.assertEqual(modded.room_descriptions, ["Dark."])
+        self.assertEqual(list(modded.pack._files), ['descriptions.json'])
+        mock_print.assert_not_called()
+
+    def test_untouched_indexes_are_shared(self):
+        """
+        Test that indexes over sections a pack leaves alone come from the
+        base registry.
+        """
+        self.write_pack('descriptions.json', {'room_descriptions': ["Damp."]})
+        modded = self.base.with_pack(self.pack_dir)
+        self.assertEqual(modded.room_descriptions, ["Dark.", "Damp."])
+        self.assertIs(modded.loot_table, self.base.loot_table)
+        self.assertIs(modded.monster_catalog, self.base.monster_catalog)
+        self.assertIs(modded.dialogue_graph(MILA),
+                      self.base.dialogue_graph(MILA))
+
+    def test_item_templates_are_layered(self):
+        """
+        Test that a pack's items are found by id next to the base items.
+        """
+        self.write_pack('items.json', {'items': [
+            dict(POTION, value=40), dict(POTION, name="Elixir")
+        ]})
+        modded = self.base.with_pack(self.pack_dir)
+        templates = modded.item_templates
+        self.assertEqual(templates['items/Health Potion'].value, 40)
+        self.assertIn('items/Elixir', templates)
+        self.assertEqual(self.base.item_templates['items/Health Potion']
+                         .value, 20)
+        self.assertEqual(len(modded.items), 2)
+        self.assertIsInstance(modded.items[0], Item)
+
+    def test_packs_stack_in_order(self):
+        """
+        Test that the last pack takes precedence.
+        """
+        second_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, second_dir)
+        self.write_pack('monsters.json', {'monsters': [
+            dict(GOBLIN, health=60)
+        ]})
+        with open(os.path.join(second_dir, 'monsters.json'), 'w') as f:
+            json.dump({'monsters': [dict(GOBLIN, health=90)]}, f)
+        modded = self.base.with_packs([self.pack_dir, second_dir])
+        self.assertEqual(modded.monster_catalog.get("Goblin")['health'], 90)
+        self.assertEqual(len(modded.packs), 3)
+        self.assertIs(self.base.with_packs([]), self.base)
+
+    def test_base_pack_reports_missing_files(self):
+        """
+        Test that only the base pack treats a missing file as an error.
+        """
+        with patch('builtins.print') as mock_print:
+            ContentPack(self.pack_dir).load_file('monsters.json')
+        mock_print.assert_called_once()
+        with patch('builtins.print') as mock_print:
+            ContentPack(self.pack_dir, overlay=True).load_file('monsters.json')
+        mock_print.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
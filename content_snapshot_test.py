@@ -0,0 +1,110 @@
+from rpg import content_snapshot
+from rpg.content_snapshot import (
+    CONTENT_FILES, build_snapshot, content_key, load_content,
+    read_snapshot, snapshot_path, validate_content
+)
+import unittest
+from unittest.mock import patch
+import json
+import shutil
+import tempfile
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestContentSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Copy the game content into a temporary directory.
+        """
+        self.base_dir = tempfile.mkdtemp()
+        for filename in CONTENT_FILES:
+            shutil.copy(
+                os.path.join(content_snapshot.CONTENT_DIR, filename),
+                self.base_dir
+            )
+
+    def tearDown(self):
+        shutil.rmtree(self.base_dir)
+
+    def rewrite_monsters(self, monsters):
+        path = os.path.join(self.base_dir, 'monsters.json')
+        with open(path, 'w') as f:
+            json.dump({"monsters": monsters}, f)
+        # Make sure the stamp changes even on coarse filesystem clocks
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_build_and_read(self):
+        """
+        Test that a built snapshot holds every content file.
+        """
+        path = build_snapshot(self.base_dir)
+        data = read_snapshot(content_key(self.base_dir), path)
+        self.assertEqual(set(data), set(CONTENT_FILES))
+        with open(os.path.join(self.base_dir, 'monsters.json')) as f:
+            self.assertEqual(data['monsters.json'], json.load(f))
+
+    def test_load_content_builds_cache(self):
+        """
+        Test that the first load writes the snapshot and later loads use it.
+        """
+        load_content(self.base_dir)
+        self.assertTrue(os.path.exists(snapshot_path(self.base_dir)))
+
+        with patch.object(content_snapshot, 'compile_content') as compile:
+            data = load_content(self.base_dir)
+            compile.assert_not_called()
+        self.assertIn('items.json', data)
+
+    def test_source_change_invalidates(self):
+        """
+        Test that editing a source file invalidates the snapshot.
+        """
+        load_content(self.base_dir)
+        self.rewrite_monsters([{"name": "Slime", "description": "Wobbly.",
+                                "health": 5, "damage": 1,
+                                "difficulty": "easy"}])
+        data = load_content(self.base_dir)
+        self.assertEqual(data['monsters.json']['monsters'][0]['name'],
+                         "Slime")
+
+    def test_corrupt_snapshot_is_ignored(self):
+        """
+        Test that a damaged snapshot is rebuilt instead of loaded.
+        """
+        path = build_snapshot(self.base_dir)
+        with open(path, 'r+b') as f:
+            f.truncate(40)
+        self.assertIsNone(read_snapshot(content_key(self.base_dir), path))
+        self.assertIn('monsters.json', load_content(self.base_dir))
+
+    @patch('builtins.print')
+    def test_invalid_content_is_rejected(self, mock_print):
+        """
+        Test that content missing required fields is not compiled.
+        """
+        self.rewrite_monsters([{"name": "Slime"}])
+        self.assertEqual(load_content(self.base_dir), {})
+        self.assertFalse(os.path.exists(snapshot_path(self.base_dir)))
+        with self.assertRaises(ValueError):
+            build_snapshot(self.base_dir)
+
+    def test_validate_content(self):
+        """
+        Test that validation reports malformed sections and entries.
+        """
+        problems = validate_content({
+            'items.json': {'items': [], 'epic_rewards': []},
+            'monsters.json': {'monsters': [{"name": "Slime"}]},
+            'npc_diaologues.json': {'npcs': [], 'traders': {}},
+            'descriptions.json': {'room_descriptions': [1],
+                                  'door_descriptions': []},
+        })
+        self.assertEqual(len(problems), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+from rpg.content import ContentRegistry, get_registry, set_registry
+from rpg.items import Item
+import unittest
+from unittest.mock import patch, mock_open
+import json
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestContentRegistry(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a registry backed by in-memory content.
+        """
+        self.registry = ContentRegistry.from_data({
+            'items.json': {
+                'items': [{"name": "Health Potion", "rarity": "common",
+                           "effect_type": "health", "value": 20,
+                           "description": "Heals.", "price": 5}],
+                'epic_rewards': [{"name": "Epic Sword"}]
+            },
+            'monsters.json': {
+                'monsters': [{"name": "Goblin", "description": "Sneaky.",
+                              "health": 30, "damage": 5,
+                              "difficulty": "easy"}]
+            }
+        })
+
+    def test_items_are_built_once(self):
+        """
+        Test that items are converted to Item objects only once.
+        """
+        items = self.registry.items
+        self.assertEqual(len(items), 1)
+        self.assertIsInstance(items[0], Item)
+        self.assertIs(self.registry.items, items)
+
+    def test_sections(self):
+        """
+        Test that sections of preloaded files are served directly.
+        """
+        self.assertEqual(self.registry.monsters[0]['name'], "Goblin")
+        self.assertEqual(self.registry.epic_rewards[0]['name'], "Epic Sword")
+
+    @patch('builtins.open', new_callable=mock_open, read_data=json.dumps({
+        "npcs": [{"name": "Mila", "description": "Herbalist.",
+                  "dialogues": {}}],
+        "traders": []
+    }))
+    def test_file_parsed_once(self, mock_file):
+        """
+        Test that a content file is opened once for all its sections.
+        """
+        registry = ContentRegistry(base_dir='.')
+        self.assertEqual(registry.npcs[0]['name'], "Mila")
+        self.assertEqual(registry.npcs[0]['name'], "Mila")
+        self.assertEqual(registry.traders, [])
+        mock_file.assert_called_once_with(
+            os.path.join('.', 'npc_diaologues.json'), 'r'
+        )
+
+    @patch('builtins.open', side_effect=FileNotFoundError)
+    @patch('builtins.print')
+    def test_missing_file(self, mock_print, mock_file):
+        """
+        Test that a missing content file yields empty sections.
+        """
+        registry = ContentRegistry(base_dir='.')
+        self.assertEqual(registry.monsters, [])
+        self.assertEqual(registry.room_descriptions, [])
+
+    def test_shared_registry(self):
+        """
+        Test that get_registry returns the same instance until replaced.
+        """
+        previous = get_registry()
+        try:
+            self.assertIs(get_registry(), previous)
+            set_registry(self.registry)
+            self.assertIs(get_registry(), self.registry)
+        finally:
+            set_registry(previous)
+
+
+if __name__ == '__main__':
+    unittest.main()
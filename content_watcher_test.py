@@ -0,0 +1,104 @@
+from rpg import content_snapshot
+from rpg.content import get_registry, set_registry
+from rpg.content_watcher import ContentWatcher
+from rpg.player import player
+import unittest
+from unittest.mock import patch, MagicMock
+import json
+import shutil
+import tempfile
+import time
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestContentWatcher(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Copy the game content into a temporary directory to edit.
+        """
+        self.previous = get_registry()
+        self.base_dir = tempfile.mkdtemp()
+        for filename in content_snapshot.CONTENT_FILES:
+            shutil.copy(
+                os.path.join(content_snapshot.CONTENT_DIR, filename),
+                self.base_dir
+            )
+        self.watcher = ContentWatcher(self.base_dir, interval=0.01)
+
+    def tearDown(self):
+        self.watcher.stop()
+        set_registry(self.previous)
+        shutil.rmtree(self.base_dir)
+
+    def write_monsters(self, monsters):
+        path = os.path.join(self.base_dir, 'monsters.json')
+        with open(path, 'w') as f:
+            json.dump({"monsters": monsters}, f)
+        # Make sure the stamp changes even on coarse filesystem clocks
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_no_change(self):
+        """
+        Test that nothing is reloaded while the files are unchanged.
+        """
+        self.assertFalse(self.watcher.check())
+        self.assertIs(get_registry(), self.previous)
+
+    def test_reload_swaps_registry(self):
+        """
+        Test that edited content replaces the shared registry.
+        """
+        self.write_monsters([{"name": "Slime", "description": "Wobbly.",
+                              "health": 5, "damage": 1,
+                              "difficulty": "easy"}])
+        self.assertTrue(self.watcher.check())
+        registry = get_registry()
+        self.assertIsNot(registry, self.previous)
+        self.assertEqual(registry.version, self.previous.version + 1)
+        self.assertIsNotNone(registry.monster_catalog.get("Slime"))
+
+    @patch('builtins.print')
+    def test_invalid_content_is_skipped(self, mock_print):
+        """
+        Test that invalid content leaves the current registry in place.
+        """
+        self.write_monsters([{"name": "Slime"}])
+        self.assertFalse(self.watcher.check())
+        self.assertIs(get_registry(), self.previous)
+        self.assertFalse(self.watcher.check())
+        self.assertEqual(mock_print.call_count, 1)
+
+    def test_background_reload(self):
+        """
+        Test that the background thread picks up a change on its own.
+        """
+        self.watcher.start()
+        self.write_monsters([{"name": "Slime", "description": "Wobbly.",
+                              "health": 5, "damage": 1,
+                              "difficulty": "easy"}])
+        deadline = time.monotonic() + 5
+        while get_registry() is self.previous and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertIsNotNone(get_registry().monster_catalog.get("Slime"))
+
+    def test_pinned_player_keeps_version(self):
+        """
+        Test that a pinned player keeps its content across a reload.
+        """
+        starting_room = MagicMock()
+        pinned = player(starting_room, content=self.previous)
+        following = player(starting_room)
+        self.write_monsters([{"name": "Slime", "description": "Wobbly.",
+                              "health": 5, "damage": 1,
+                              "difficulty": "easy"}])
+        self.watcher.check()
+        self.assertIs(pinned.content, self.previous)
+        self.assertIs(following.content, get_registry())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -144,6 +144,28 @@ class TestCornelia(unittest.TestCase):
             "Invalid card choice. You lost your chance!"
             )
 
+    @patch('rpg.cornelia.get_registry')
+    @patch('builtins.input', side_effect=['0', '1'])
+    @patch('builtins.print')
+    def test_reward_from_player_content(self, mock_print, mock_input,
+                                        mock_get_registry):
+        """
+        Test that the reward comes from the player's content, with its
+        content packs, rather than the base content.
+        """
+        self.player.content.epic_rewards = [{
+            "name": "Moon Blade",
+            "description": "Glows.",
+            "effect_type": "damage",
+            "value": 25,
+            "price": 0
+        }]
+
+        self.cornelia.interact(self.player)
+
+        self.assertEqual(self.player.inventory[0].name, "Moon Blade")
+        mock_get_registry.assert_not_called()
+
     @patch('rpg.cornelia.random.choice')
     def test_get_random_epic_item(self, mock_random_choice):
         """
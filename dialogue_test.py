@@ -0,0 +1,87 @@
+from rpg.dialogue import DialogueGraph, NO_DIALOGUE
+from rpg.content import ContentRegistry
+from rpg.npc import npc
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+DIALOGUES = {
+    "Hello!": {
+        "options": {
+            "Hi.": ["Nice to meet you."],
+            "Bye.": ["Farewell.", "See you."]
+        }
+    },
+    "Still here?": {
+        "options": {
+            "Yes.": ["Good."]
+        }
+    }
+}
+
+
+class TestDialogueGraph(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Compile a dialogue with two nodes.
+        """
+        self.graph = DialogueGraph.compile(DIALOGUES)
+
+    def test_compile(self):
+        """
+        Test that prompts and options keep their order.
+        """
+        self.assertEqual(len(self.graph), 2)
+        self.assertEqual(self.graph.prompts, ("Hello!", "Still here?"))
+        self.assertEqual(self.graph.option_count(0), 2)
+        self.assertEqual(self.graph.option_count(1), 1)
+        self.assertEqual(self.graph.option_text(0, 1), "Bye.")
+        self.assertEqual(self.graph.responses(0, 1), ("Farewell.", "See you."))
+        self.assertEqual(self.graph.option_text(1, 0), "Yes.")
+
+    def test_immutable(self):
+        """
+        Test that a compiled graph cannot be changed.
+        """
+        with self.assertRaises(AttributeError):
+            self.graph.prompts = ()
+
+    def test_npc_without_dialogues(self):
+        """
+        Test that NPCs without dialogues share the empty graph.
+        """
+        character = npc("Mute", "Says nothing.")
+        self.assertIs(character.dialogues, NO_DIALOGUE)
+        with patch('builtins.print') as mock_print:
+            character.interact(None)
+        mock_print.assert_called_with("\nMute has nothing to say.")
+
+    def test_registry_shares_graphs(self):
+        """
+        Test that every instance of an NPC shares one compiled graph.
+        """
+        entry = {"name": "Mila", "description": "Herbalist.",
+                 "dialogues": DIALOGUES}
+        registry = ContentRegistry.from_data(
+            {'npc_diaologues.json': {'npcs': [entry], 'traders': []}}
+        )
+        first = npc("Mila", "Herbalist.", registry.dialogue_graph(entry))
+        second = npc("Mila", "Herbalist.", registry.dialogue_graph(entry))
+        self.assertIs(first.dialogues, second.dialogues)
+
+    @patch('builtins.input', side_effect=['5'])
+    @patch('builtins.print')
+    def test_interact_out_of_range(self, mock_print, mock_input):
+        """
+        Test that an out of range response is rejected.
+        """
+        npc("Mila", "Herbalist.", self.graph).interact(None)
+        mock_print.assert_called_with("Invalid choice.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -100,6 +100,23 @@ class TestDoor(unittest.TestCase):
             "The Iron Door is locked. You cannot go through it."
             )
 
+    @patch('builtins.print')
+    def test_interact_builds_stub_destination(self, mock_print):
+        """
+        Test that a door leading to a room stub builds the room once.
+        """
+        stub = MagicMock(spec=['materialize', 'explored'])
+        stub.explored = False
+        stub.materialize.return_value = self.destination_room
+        stub_door = door(name='New Door', description='Unexplored.',
+                         destination=stub)
+        self.assertFalse(stub_door.explored)
+        stub_door.interact(self.mock_player)
+        stub_door.interact(self.mock_player)
+        self.assertEqual(self.mock_player.current_room, self.destination_room)
+        self.assertTrue(stub_door.explored)
+        stub.materialize.assert_called_once()
+
     @patch('builtins.print')
     def test_inspect_unlocked_door(self, mock_print):
         """
@@ -1,4 +1,6 @@
-from rpg.enemy import Enemy
+from rpg.enemy import Enemy, MonsterCatalog
+from rpg.content import ContentRegistry
+import random
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
 import json
@@ -7,6 +9,13 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 
+def fresh_registry():
+    """
+    Return a registry that reads every content file when first used.
+    """
+    return ContentRegistry.from_data({})
+
+
 class TestEnemy(unittest.TestCase):
 
     def setUp(self):
@@ -116,11 +125,11 @@ class TestEnemy(unittest.TestCase):
             }
         ]
     }))
-    @patch('os.path.dirname', return_value='.')
-    def test_load_monsters_success(self, mock_dirname, mock_file):
+    @patch('rpg.content.get_registry', new=fresh_registry)
+    def test_load_monsters_success(self, mock_file):
         """
         Test that load_monsters correctly
-        loads a list of Enemy objects from a JSON file.
+        loads a list of Enemy objects from the game content.
         """
         monsters = Enemy.load_monsters()
         self.assertEqual(len(monsters), 2)
@@ -130,25 +139,21 @@ class TestEnemy(unittest.TestCase):
         self.assertEqual(monsters[1].damage, 50)
 
     @patch('builtins.open', side_effect=FileNotFoundError)
-    @patch('os.path.dirname', return_value='.')
+    @patch('rpg.content.get_registry', new=fresh_registry)
     @patch('builtins.print')
-    def test_load_monsters_file_not_found(
-        self, mock_print, mock_dirname, mock_open
-    ):
+    def test_load_monsters_file_not_found(self, mock_print, mock_open):
         """
         Test that load_monsters handles a FileNotFoundError
         gracefully and returns an empty list.
         """
         monsters = Enemy.load_monsters()
         self.assertEqual(monsters, [])
-        mock_print.assert_called_with("Error loading monsters: ")
+        mock_print.assert_called_with("Error loading monsters.json: ")
 
     @patch('builtins.open', new_callable=mock_open, read_data='Invalid JSON')
-    @patch('os.path.dirname', return_value='.')
+    @patch('rpg.content.get_registry', new=fresh_registry)
     @patch('builtins.print')
-    def test_load_monsters_json_decode_error(
-        self, mock_print, mock_dirname, mock_file
-    ):
+    def test_load_monsters_json_decode_error(self, mock_print, mock_file):
         """
         Test that load_monsters handles a JSONDecodeError
         gracefully and returns an empty list.
@@ -156,9 +161,64 @@ class TestEnemy(unittest.TestCase):
         monsters = Enemy.load_monsters()
         self.assertEqual(monsters, [])
         mock_print.assert_called_with(
-            "Error loading monsters: Expecting value: line 1 column 1 (char 0)"
+            "Error loading monsters.json: "
+            "Expecting value: line 1 column 1 (char 0)"
         )
 
 
+class TestMonsterCatalog(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a catalog of a thousand monsters.
+        """
+        self.catalog = MonsterCatalog([
+            {"name": f"Monster {i}", "description": "A monster.",
+             "health": 10 + i, "damage": 5,
+             "difficulty": ("easy", "medium", "hard")[i % 3]}
+            for i in range(1000)
+        ])
+
+    def test_indexes(self):
+        """
+        Test lookups by name and difficulty.
+        """
+        self.assertEqual(len(self.catalog), 1000)
+        self.assertEqual(self.catalog.get("Monster 7")['health'], 17)
+        self.assertIsNone(self.catalog.get("Nobody"))
+        self.assertEqual(len(self.catalog.with_difficulty("hard")), 333)
+        self.assertEqual(self.catalog.with_difficulty("unknown"), ())
+
+    def test_sample_skips_defeated(self):
+        """
+        Test that sampled monsters are distinct and undefeated.
+        """
+        defeated = {f"Monster {i}" for i in range(0, 1000, 2)}
+        rng = random.Random(1)
+        for _ in range(200):
+            sample = self.catalog.sample_undefeated(2, defeated, rng)
+            self.assertEqual(len(sample), 2)
+            self.assertNotEqual(sample[0]['name'], sample[1]['name'])
+            for monster in sample:
+                self.assertNotIn(monster['name'], defeated)
+
+    def test_sample_when_almost_all_defeated(self):
+        """
+        Test that the last undefeated monster is still found.
+        """
+        defeated = {f"Monster {i}" for i in range(999)}
+        sample = self.catalog.sample_undefeated(2, defeated)
+        self.assertEqual([monster['name'] for monster in sample],
+                         ["Monster 999"])
+        defeated.add("Monster 999")
+        self.assertEqual(self.catalog.sample_undefeated(2, defeated), [])
+
+    def test_sample_empty_catalog(self):
+        """
+        Test that an empty catalog yields no monsters.
+        """
+        self.assertEqual(MonsterCatalog([]).sample_undefeated(1, set()), [])
+
+
 if __name__ == '__main__':
     unittest.main()
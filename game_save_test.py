@@ -1,9 +1,16 @@
 # test_game_save.py
 from rpg.game_save import save_game, load_game
 from rpg.items import Item
+from rpg.content import ContentRegistry
+from rpg.player import player
+from rpg.room import room
+from rpg.travel import TravelIndex
+from rpg.world import World, START_ROOM_ID
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
 import json
+import shutil
+import tempfile
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -24,6 +31,11 @@ class TestGameSave(unittest.TestCase):
         self.player_instance.action_count = 5
         self.player_instance.defeated_enemy = ['Enemy1']
         self.player_instance.coins = 50
+        self.player_instance.fought_in_room = {3: True, 'Room1': False}
+        self.player_instance.current_room = MagicMock(spec=room)
+        self.player_instance.explored = TravelIndex()
+        self.player_instance.explored.visit('Room1')
+        self.player_instance.explored.visit('Room2', 'Room1')
 
         # Mock inventory with items having to_dict method
         item1 = MagicMock(spec=Item)
@@ -59,6 +71,11 @@ class TestGameSave(unittest.TestCase):
         self.assertEqual(player_data['health'], 100)
         self.assertEqual(player_data['damage'], 10)
         self.assertEqual(player_data['visited_rooms'], ['Room1', 'Room2'])
+        self.assertEqual(player_data['fought_in_room'], [3])
+        self.assertEqual(player_data['explored'], [
+            ['Room1', None, 'Room1'], ['Room2', 'Room1', 'Room2']
+        ])
+        self.assertNotIn('world', player_data)
         self.assertEqual(player_data['heal_used'], 0)
         self.assertEqual(player_data['action_count'], 5)
         self.assertEqual(player_data['defeated_enemy'], ['Enemy1'])
@@ -133,7 +150,8 @@ TestPlayer saved successfully!')
                 {'name': 'Sword', 'damage': 10},
                 {'name': 'Shield', 'defense': 5}
             ],
-            'coins': 60
+            'coins': 60,
+            'fought_in_room': [3]
         }
     }))
     def test_load_game_success(self, mock_file, mock_print, mock_item_class):
@@ -167,6 +185,7 @@ TestPlayer saved successfully!')
         self.assertEqual(player_instance.action_count, 3)
         self.assertEqual(player_instance.defeated_enemy, ['Enemy1', 'Enemy2'])
         self.assertEqual(player_instance.coins, 60)
+        self.assertEqual(player_instance.fought_in_room, {3: True})
 
         # Check that the success message was printed
         mock_print.assert_called_with('Game for player \
@@ -209,5 +228,109 @@ for player TestPlayer.')
         self.assertFalse(player_instance.method_calls)
 
 
+class TestPackItemsSave(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a base registry with a content pack that overrides an item
+        and adds one.
+        """
+        potion = {"name": "Health Potion", "rarity": "common",
+                  "effect_type": "health", "value": 20,
+                  "description": "Heals.", "price": 5}
+        self.base = ContentRegistry.from_data({
+            'items.json': {'items': [potion], 'epic_rewards': []},
+            'monsters.json': {'monsters': []},
+            'npc_diaologues.json': {'npcs': [], 'traders': []},
+            'descriptions.json': {'room_descriptions': ["Dark."],
+                                  'door_descriptions': ["Oak."]}
+        })
+        self.temp_dir = tempfile.mkdtemp()
+        pack_dir = os.path.join(self.temp_dir, 'pack')
+        os.mkdir(pack_dir)
+        with open(os.path.join(pack_dir, 'items.json'), 'w') as f:
+            json.dump({'items': [
+                dict(potion, value=40),
+                {"name": "Moon Blade", "rarity": "epic",
+                 "effect_type": "damage", "value": 25,
+                 "description": "Glows.", "price": 50}
+            ]}, f)
+        self.content = self.base.with_pack(pack_dir)
+        self.filename = os.path.join(self.temp_dir, 'save.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    @patch('builtins.print')
+    def test_round_trip(self, mock_print):
+        """
+        Test that items of a content pack are saved and loaded with the
+        pack's data.
+        """
+        saved = player(None, name='TestPlayer', content=self.content)
+        saved.inventory = list(self.content.items)
+        save_game(saved, filename=self.filename)
+
+        loaded = player(None, name='Other', content=self.content)
+        load_game(loaded, 'TestPlayer', filename=self.filename)
+
+        self.assertEqual(
+            [(item.name, item.value) for item in loaded.inventory],
+            [("Health Potion", 40), ("Moon Blade", 25)]
+        )
+        mock_print.assert_called_with(
+            'Game for player TestPlayer loaded successfully!')
+
+
+class TestWorldSave(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.temp_dir, 'save.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    @patch('random.randint', return_value=2)
+    @patch('builtins.print')
+    def test_round_trip(self, mock_print, mock_randint):
+        """
+        Test that the saved room ids lead to the same rooms after loading,
+        including rooms whose changes were paged out.
+        """
+        world = World(seed=9, cache_size=1, region_size=1)
+        world.discover(START_ROOM_ID)
+        saved = player(world.room(START_ROOM_ID), name='TestPlayer')
+        with patch('builtins.input', return_value='0'):
+            saved.interact()
+        first = saved.current_room
+        saved.look_for_items()
+        with patch('builtins.input', return_value='-1'):
+            saved.look_for_fight()
+        with patch('builtins.input', return_value='1'):
+            saved.interact()
+        saved.fought_in_room[saved.room_key] = True
+        self.assertNotIn(first.room_id, world.rooms)
+        save_game(saved, filename=self.filename)
+
+        other = World(seed=1)
+        loaded = player(other.room(START_ROOM_ID), name='Other')
+        load_game(loaded, 'TestPlayer', filename=self.filename)
+
+        self.assertEqual(other.seed, 9)
+        self.assertEqual(len(other), len(world))
+        self.assertEqual(loaded.room_key, saved.room_key)
+        self.assertEqual(loaded.current_room.description,
+                         saved.current_room.description)
+        self.assertEqual(other.changes(first.room_id),
+                         world.changes(first.room_id))
+        self.assertIn('monsters', other.changes(first.room_id))
+        self.assertEqual(loaded.fought_in_room, {saved.room_key: True})
+        self.assertEqual(
+            loaded.explored.route(loaded.room_key, START_ROOM_ID),
+            [loaded.room_key, first.room_id, START_ROOM_ID]
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
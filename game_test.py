@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 from rpg.game import Game
 from rpg.enemy import Enemy
+from rpg.content import ContentRegistry, get_registry, set_registry
 
 
 class TestGame(unittest.TestCase):
@@ -100,6 +101,45 @@ class TestGame(unittest.TestCase):
         self.assertEqual(loaded_monsters, self.game.monsters)
         mock_load_monsters.assert_called_once()
 
+    def test_refresh_content(self):
+        """
+        Test that the game moves to a reloaded content version.
+        """
+        previous = get_registry()
+        self.assertIs(self.game.player_instance.content, previous)
+        world = self.game.world
+        start = self.game.current_room.room_id
+        description = self.game.current_room.description
+        doors = {name: built.description
+                 for name, built in self.game.current_room.doors.items()}
+        reloaded = ContentRegistry.from_data({
+            'descriptions.json': {'room_descriptions': ["Reloaded room."],
+                                  'door_descriptions': ["Reloaded door."]}
+        }, version=previous.version + 1)
+        set_registry(reloaded)
+        try:
+            self.game.refresh_content()
+        finally:
+            set_registry(previous)
+        self.assertIs(self.game.content, reloaded)
+        self.assertIs(self.game.player_instance.content, reloaded)
+        # Rooms created before the reload keep their version, even when
+        # they are rebuilt
+        self.assertIs(self.game.current_room.content, previous)
+        world.release(start)
+        rebuilt = world.room(start)
+        self.assertEqual(rebuilt.description, description)
+        self.assertEqual({name: built.description
+                          for name, built in rebuilt.doors.items()}, doors)
+        # Rooms created after it use the new one
+        behind = next(iter(rebuilt.doors.values())).destination
+        world.discover(behind.room_id)
+        new_room = world.room(next(iter(world.neighbours(behind.room_id))))
+        self.assertEqual(new_room.description, "Reloaded room.")
+        self.assertEqual({built.description
+                          for built in behind.doors.values()},
+                         {"Reloaded door."})
+
 
 if __name__ == '__main__':
     unittest.main()
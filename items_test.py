@@ -1,4 +1,6 @@
-from rpg.items import Item
+from rpg.items import Item, ItemTemplate
+from rpg.content import ContentRegistry, get_registry
+import gc
 import io
 import unittest
 from unittest.mock import patch, mock_open
@@ -8,6 +10,13 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 
+def fresh_registry():
+    """
+    Return a registry that reads every content file when first used.
+    """
+    return ContentRegistry.from_data({})
+
+
 class TestItem(unittest.TestCase):
 
     def setUp(self):
@@ -77,6 +86,7 @@ class TestItem(unittest.TestCase):
         self.assertEqual(self.default_item.price, 10)
 
     @patch('builtins.open', new_callable=mock_open, read_data='{"items": []}')
+    @patch('rpg.content.get_registry', new=fresh_registry)
     @patch('sys.stdout', new_callable=io.StringIO)  # Suppress print output
     def test_load_items_empty_file(self, mock_stdout, mock_file):
         """
@@ -105,11 +115,11 @@ class TestItem(unittest.TestCase):
             }
         ]
     }))
-    @patch('os.path.dirname', return_value='.')
-    def test_load_items_success(self, mock_dirname, mock_file):
+    @patch('rpg.content.get_registry', new=fresh_registry)
+    def test_load_items_success(self, mock_file):
         """
         Test that load_items correctly
-        loads a list of Item objects from a JSON file.
+        loads a list of Item objects from the game content.
         """
         items = Item.load_items()
 
@@ -118,10 +128,9 @@ class TestItem(unittest.TestCase):
         self.assertEqual(items[1].name, "Sword of Power")
 
     @patch('builtins.open', side_effect=FileNotFoundError)
-    @patch('os.path.dirname', return_value='.')
+    @patch('rpg.content.get_registry', new=fresh_registry)
     @patch('sys.stdout', new_callable=io.StringIO)  # Suppress print output
-    def test_load_items_file_not_found(self,
-                                       mock_stdout, mock_dirname, mock_open):
+    def test_load_items_file_not_found(self, mock_stdout, mock_open):
         """
         Test that load_items handles a FileNotFoundError
         gracefully and returns an empty list.
@@ -130,11 +139,9 @@ class TestItem(unittest.TestCase):
         self.assertEqual(items, [])
 
     @patch('builtins.open', new_callable=mock_open, read_data='Invalid JSON')
-    @patch('os.path.dirname', return_value='.')
+    @patch('rpg.content.get_registry', new=fresh_registry)
     @patch('sys.stdout', new_callable=io.StringIO)  # Suppress print output
-    def test_load_items_json_decode_error(self,
-                                          mock_stdout,
-                                          mock_dirname, mock_file):
+    def test_load_items_json_decode_error(self, mock_stdout, mock_file):
         """
         Test that load_items handles a
         JSONDecodeError and returns an empty list.
@@ -143,5 +150,78 @@ class TestItem(unittest.TestCase):
         self.assertEqual(items, [])
 
 
+class TestItemTemplate(unittest.TestCase):
+
+    def test_templates_are_shared(self):
+        """
+        Test that items with the same data share one template.
+        """
+        first = Item("Pebble", "common", "damage", 1, "A pebble.", 1)
+        second = Item("Pebble", "common", "damage", 1, "A pebble.", 1)
+        self.assertIsNot(first, second)
+        self.assertIs(first.template, second.template)
+        self.assertFalse(hasattr(first, '__dict__'))
+
+    def test_templates_are_immutable(self):
+        """
+        Test that template data cannot be changed.
+        """
+        item = Item("Pebble", "common", "damage", 1, "A pebble.", 1)
+        with self.assertRaises(AttributeError):
+            item.template.value = 100
+        with self.assertRaises(AttributeError):
+            item.value = 100
+
+    def test_load_items_shares_content_templates(self):
+        """
+        Test that loaded items point at the current content's templates.
+        """
+        content_items = get_registry().items
+        with patch('builtins.open') as mock_file:
+            items = Item.load_items()
+        mock_file.assert_not_called()
+        self.assertEqual([item.template for item in items],
+                         [item.template for item in content_items])
+
+    def test_unused_templates_are_dropped(self):
+        """
+        Test that a template leaves the interning table with its last item.
+        """
+        item = Item("Driftwood", "common", "damage", 1, "Wet wood.", 1)
+        key = ("Driftwood", "common", "damage", 1, "Wet wood.", 1, None)
+        self.assertIs(ItemTemplate._interned[key], item.template)
+        del item
+        gc.collect()
+        self.assertNotIn(key, ItemTemplate._interned)
+
+    def test_content_items_saved_by_id(self):
+        """
+        Test that items from the game content round trip through their id.
+        """
+        for template_id, template in get_registry().item_templates.items():
+            item = Item.from_template(template)
+            self.assertEqual(item.to_dict(), {'id': template_id})
+            self.assertIs(Item.from_dict(item.to_dict()).template, template)
+
+    def test_trader_items_have_distinct_ids(self):
+        """
+        Test that same-named items of different sources stay distinct.
+        """
+        templates = get_registry().item_templates
+        self.assertIsNot(
+            templates['items/Health Potion'],
+            templates['traders/Selena *Trader*/Health Potion']
+        )
+
+    def test_unknown_id(self):
+        """
+        Test that an unknown template id is rejected.
+        """
+        with self.assertRaises(ValueError):
+            Item.from_dict({'id': 'items/Nothing'})
+        with self.assertRaises(ValueError):
+            ItemTemplate.lookup('items/Nothing')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,81 @@
+from rpg.loot import LootTable, RARITY_WEIGHTS
+from rpg.items import Item
+import random
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+def make_item(name, rarity):
+    return Item(name, rarity, "health", 10, "An item.", 1)
+
+
+class TestLootTable(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a loot table with one empty rarity.
+        """
+        self.items = [
+            make_item("Potion", "common"),
+            make_item("Big Potion", "common"),
+            make_item("Elixir", "rare"),
+            make_item("Epic Elixir", "epic"),
+            make_item("Legend", "legendary"),
+        ]
+        self.table = LootTable(self.items)
+
+    def test_buckets(self):
+        """
+        Test that items are grouped by rarity.
+        """
+        common = self.table.buckets[self.table.rarities.index("common")]
+        self.assertEqual([item.name for item in common],
+                         ["Potion", "Big Potion"])
+        super_rare = self.table.rarities.index("super rare")
+        self.assertEqual(self.table.buckets[super_rare], ())
+
+    def test_alias_table_matches_weights(self):
+        """
+        Test that the alias table reproduces the rarity weights exactly.
+        """
+        count = len(self.table.rarities)
+        chance = [0.0] * count
+        for column in range(count):
+            chance[column] += self.table.probability[column] / count
+            chance[self.table.alias[column]] += (
+                1 - self.table.probability[column]
+            ) / count
+        for rarity, value in zip(self.table.rarities, chance):
+            self.assertAlmostEqual(value, RARITY_WEIGHTS[rarity])
+
+    def test_draw_frequencies(self):
+        """
+        Test that draws follow the rarity weights.
+        """
+        rng = random.Random(7)
+        rolls = [self.table.roll_rarity(rng) for _ in range(20000)]
+        common = rolls.count(self.table.rarities.index("common")) / 20000
+        self.assertAlmostEqual(common, 0.5, delta=0.02)
+
+    def test_empty_rarity_draws_nothing(self):
+        """
+        Test that rolling a rarity without items finds nothing.
+        """
+        table = LootTable(self.items, {"super rare": 1.0})
+        self.assertIsNone(table.draw())
+
+    def test_draw_many(self):
+        """
+        Test that batched draws return one result per roll.
+        """
+        results = self.table.draw_many(500, random.Random(3))
+        self.assertEqual(len(results), 500)
+        for item in results:
+            self.assertTrue(item is None or item in self.items)
+        self.assertIn(None, results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,8 +3,10 @@ OOP assignment 2.
 
 Marcell Szokedencsi (s5173191) & Artiom Matveiciuc(s548805)
 """
+import sys
 from rpg.game import Game
 
 if __name__ == "__main__":
-    game_instance = Game()  # Create an instance of the Game class
+    # Any arguments are content pack directories laid over the base content
+    game_instance = Game(content_packs=sys.argv[1:])
     game_instance.run()  # Start the game
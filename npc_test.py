@@ -1,4 +1,5 @@
 from rpg.npc import npc, Enemy, Trader, Item
+from rpg.content import ContentRegistry
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
 import json
@@ -7,6 +8,13 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 
+def fresh_registry():
+    """
+    Return a registry that reads every content file when first used.
+    """
+    return ContentRegistry.from_data({})
+
+
 class TestNPC(unittest.TestCase):
 
     def setUp(self):
@@ -51,10 +59,10 @@ An old man with a wise look.")
              "description": "A friendly trader.", "dialogues": {}}
         ]
     }))
-    @patch('os.path.dirname', return_value='.')
-    def test_load_npcs_success(self, mock_dirname, mock_file):
+    @patch('rpg.npc.get_registry', new=fresh_registry)
+    def test_load_npcs_success(self, mock_file):
         """
-        Test loading NPCs from a JSON file.
+        Test loading NPCs from the game content.
         """
         npcs = npc.load_npcs()
         self.assertEqual(len(npcs), 1)
@@ -157,10 +165,10 @@ class TestTrader(unittest.TestCase):
             }
         ]
     }))
-    @patch('os.path.dirname', return_value='.')
-    def test_load_traders_success(self, mock_dirname, mock_file):
+    @patch('rpg.npc.get_registry', new=fresh_registry)
+    def test_load_traders_success(self, mock_file):
         """
-        Test loading Traders from a JSON file.
+        Test loading Traders from the game content.
         """
         traders = Trader.load_traders()
         self.assertEqual(len(traders), 1)
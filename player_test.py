@@ -1,7 +1,8 @@
 from unittest.mock import patch, MagicMock
 from rpg.player import player
 from rpg.items import Item
-from rpg.enemy import Enemy
+from rpg.loot import LootTable
+from rpg.enemy import Enemy, MonsterCatalog
 from rpg.room import room as Room
 from rpg.door import door as Door
 from rpg.base_model import Interactable
@@ -124,9 +125,9 @@ Please select a valid door number.")
 Please select a valid character number.")
 
     @patch('builtins.print')
-    @patch('rpg.enemy.Enemy.load_monsters')
-    def test_look_for_fight_no_monsters(self, mock_load_monsters, mock_print):
-        mock_load_monsters.return_value = []
+    @patch('rpg.player.get_registry')
+    def test_look_for_fight_no_monsters(self, mock_get_registry, mock_print):
+        mock_get_registry.return_value.monster_catalog = MonsterCatalog([])
 
         with patch('random.randint', return_value=0):
             self.player.look_for_fight()
@@ -135,16 +136,19 @@ Please select a valid character number.")
 to fight right now.")
 
     @patch('builtins.print')
-    @patch('rpg.enemy.Enemy.load_monsters')
-    def test_look_for_fight_with_monster(self, mock_load_monsters, mock_print):
-        monster = MagicMock(spec=Enemy)
-        monster.name = 'Goblin'
-        monster.description = 'A nasty goblin.'
-        monster.health = 10
-        monster.damage = 5
-        monster.difficulty = 'easy'
-
-        mock_load_monsters.return_value = [monster]
+    @patch('rpg.player.get_registry')
+    def test_look_for_fight_with_monster(self, mock_get_registry, mock_print):
+        monster = {
+            'name': 'Goblin',
+            'description': 'A nasty goblin.',
+            'health': 10,
+            'damage': 5,
+            'difficulty': 'easy'
+        }
+
+        mock_get_registry.return_value.monster_catalog = MonsterCatalog(
+            [monster]
+        )
 
         with patch('random.randint', return_value=1):
             with patch('builtins.input',
@@ -155,16 +159,19 @@ to fight right now.")
         self.assertEqual(self.player.coins, 7)
 
     @patch('builtins.print')
-    @patch('rpg.enemy.Enemy.load_monsters')
-    def test_look_for_fight_run_away(self, mock_load_monsters, mock_print):
-        monster = MagicMock(spec=Enemy)
-        monster.name = 'Orc'
-        monster.description = 'A fierce orc.'
-        monster.health = 50
-        monster.damage = 10
-        monster.difficulty = 'medium'
-
-        mock_load_monsters.return_value = [monster]
+    @patch('rpg.player.get_registry')
+    def test_look_for_fight_run_away(self, mock_get_registry, mock_print):
+        monster = {
+            'name': 'Orc',
+            'description': 'A fierce orc.',
+            'health': 50,
+            'damage': 10,
+            'difficulty': 'medium'
+        }
+
+        mock_get_registry.return_value.monster_catalog = MonsterCatalog(
+            [monster]
+        )
 
         with patch('random.randint', return_value=1):
             with patch('builtins.input', side_effect=['0', '4']):
@@ -176,18 +183,21 @@ to fight right now.")
 but lost {50.0} health. Your current health is 50.0.")
 
     @patch('builtins.print')
-    @patch('rpg.enemy.Enemy.load_monsters')
+    @patch('rpg.player.get_registry')
     def test_look_for_fight_heal_before_action_count(self,
-                                                     mock_load_monsters,
+                                                     mock_get_registry,
                                                      mock_print):
-        monster = MagicMock(spec=Enemy)
-        monster.name = 'Skeleton'
-        monster.description = 'A creepy skeleton.'
-        monster.health = 20
-        monster.damage = 5
-        monster.difficulty = 'easy'
-
-        mock_load_monsters.return_value = [monster]
+        monster = {
+            'name': 'Skeleton',
+            'description': 'A creepy skeleton.',
+            'health': 20,
+            'damage': 5,
+            'difficulty': 'easy'
+        }
+
+        mock_get_registry.return_value.monster_catalog = MonsterCatalog(
+            [monster]
+        )
 
         with patch('random.randint', side_effect=[1, 15]):
             with patch('builtins.input',
@@ -198,21 +208,24 @@ but lost {50.0} health. Your current health is 50.0.")
 3 actions before healing again.")
 
     @patch('builtins.print')
-    @patch('rpg.enemy.Enemy.load_monsters')
-    def test_look_for_fight_heal_after_action_count(self, mock_load_monsters,
+    @patch('rpg.player.get_registry')
+    def test_look_for_fight_heal_after_action_count(self, mock_get_registry,
                                                     mock_print):
         """
         Test healing during combat after action count reaches 3.
         """
         # Create a mock monster
-        monster = MagicMock(spec=Enemy)
-        monster.name = 'Zombie'
-        monster.description = 'A slow-moving zombie.'
-        monster.health = 20
-        monster.damage = 5
-        monster.difficulty = 'easy'
-
-        mock_load_monsters.return_value = [monster]
+        monster = {
+            'name': 'Zombie',
+            'description': 'A slow-moving zombie.',
+            'health': 20,
+            'damage': 5,
+            'difficulty': 'easy'
+        }
+
+        mock_get_registry.return_value.monster_catalog = MonsterCatalog(
+            [monster]
+        )
 
         # Set action_count to 3 to allow healing
         self.player.action_count = 3
@@ -232,16 +245,19 @@ but lost {50.0} health. Your current health is 50.0.")
 Your current health is 95.")
 
     @patch('builtins.print')
-    @patch('rpg.enemy.Enemy.load_monsters')
-    def test_look_for_fight_use_item(self, mock_load_monsters, mock_print):
-        monster = MagicMock(spec=Enemy)
-        monster.name = 'Bandit'
-        monster.description = 'A sneaky bandit.'
-        monster.health = 30
-        monster.damage = 7
-        monster.difficulty = 'medium'
-
-        mock_load_monsters.return_value = [monster]
+    @patch('rpg.player.get_registry')
+    def test_look_for_fight_use_item(self, mock_get_registry, mock_print):
+        monster = {
+            'name': 'Bandit',
+            'description': 'A sneaky bandit.',
+            'health': 30,
+            'damage': 7,
+            'difficulty': 'medium'
+        }
+
+        mock_get_registry.return_value.monster_catalog = MonsterCatalog(
+            [monster]
+        )
 
         damage_item = MagicMock(spec=Item)
         damage_item.name = 'Sharp Dagger'
@@ -259,17 +275,20 @@ Your current health is 95.")
         self.assertEqual(len(self.player.inventory), 0)
 
     @patch('builtins.print')
-    @patch('rpg.enemy.Enemy.load_monsters')
+    @patch('rpg.player.get_registry')
     def test_look_for_fight_invalid_action(self,
-                                           mock_load_monsters, mock_print):
-        monster = MagicMock(spec=Enemy)
-        monster.name = 'Troll'
-        monster.description = 'A big troll.'
-        monster.health = 40
-        monster.damage = 8
-        monster.difficulty = 'hard'
-
-        mock_load_monsters.return_value = [monster]
+                                           mock_get_registry, mock_print):
+        monster = {
+            'name': 'Troll',
+            'description': 'A big troll.',
+            'health': 40,
+            'damage': 8,
+            'difficulty': 'hard'
+        }
+
+        mock_get_registry.return_value.monster_catalog = MonsterCatalog(
+            [monster]
+        )
 
         with patch('random.randint', return_value=1):
             with patch('builtins.input',
@@ -280,17 +299,20 @@ Your current health is 95.")
 Please select a valid action.")
 
     @patch('builtins.print')
-    @patch('rpg.enemy.Enemy.load_monsters')
+    @patch('rpg.player.get_registry')
     def test_look_for_fight_player_defeated(self,
-                                            mock_load_monsters, mock_print):
-        monster = MagicMock(spec=Enemy)
-        monster.name = 'Dragon'
-        monster.description = 'A fearsome dragon.'
-        monster.health = 200
-        monster.damage = 100
-        monster.difficulty = 'hard'
-
-        mock_load_monsters.return_value = [monster]
+                                            mock_get_registry, mock_print):
+        monster = {
+            'name': 'Dragon',
+            'description': 'A fearsome dragon.',
+            'health': 200,
+            'damage': 100,
+            'difficulty': 'hard'
+        }
+
+        mock_get_registry.return_value.monster_catalog = MonsterCatalog(
+            [monster]
+        )
 
         with patch('random.randint', return_value=1):
             with patch('builtins.input', side_effect=['0', '0']):
@@ -302,37 +324,69 @@ Please select a valid action.")
         mock_print.assert_any_call("Game Over!")
 
     @patch('builtins.print')
-    @patch('rpg.enemy.Enemy.load_monsters')
+    @patch('rpg.player.get_registry')
     def test_look_for_fight_monster_defeated(self,
-                                             mock_load_monsters, mock_print):
-        monster = MagicMock(spec=Enemy)
-        monster.name = 'Rat'
-        monster.description = 'A small rat.'
-        monster.health = 5
-        monster.damage = 1
-        monster.difficulty = 'easy'
-
-        mock_load_monsters.return_value = [monster]
+                                             mock_get_registry, mock_print):
+        monster = {
+            'name': 'Rat',
+            'description': 'A small rat.',
+            'health': 5,
+            'damage': 1,
+            'difficulty': 'easy'
+        }
+
+        mock_get_registry.return_value.monster_catalog = MonsterCatalog(
+            [monster]
+        )
 
         with patch('random.randint', return_value=1):
             with patch('builtins.input', side_effect=['0', '0']):
                 self.player.look_for_fight()
 
         self.assertIn('Rat', self.player.defeated_enemy)
-        mock_print.assert_any_call(f"     \nYou defeated {monster.name}!")
+        mock_print.assert_any_call(f"     \nYou defeated {monster['name']}!")
 
     @patch('builtins.print')
-    @patch('rpg.enemy.Enemy.load_monsters')
-    def test_look_for_fight_no_more_monsters(self,
-                                             mock_load_monsters, mock_print):
-        monster = MagicMock(spec=Enemy)
-        monster.name = 'Spider'
-        monster.description = 'A giant spider.'
-        monster.health = 15
-        monster.damage = 3
-        monster.difficulty = 'easy'
+    @patch('rpg.player.get_registry')
+    def test_look_for_fight_group(self, mock_get_registry, mock_print):
+        monsters = [
+            {'name': 'Rat', 'description': 'A small rat.', 'health': 5,
+             'damage': 1, 'difficulty': 'easy'},
+            {'name': 'Bat', 'description': 'A small bat.', 'health': 5,
+             'damage': 2, 'difficulty': 'easy'},
+        ]
+
+        mock_get_registry.return_value.monster_catalog = MonsterCatalog(
+            monsters
+        )
+
+        with patch('random.randint', return_value=2):
+            with patch('builtins.input', side_effect=['a', '0', '0', '0']):
+                self.player.look_for_fight()
+
+        self.assertIn('Rat', self.player.defeated_enemy)
+        self.assertIn('Bat', self.player.defeated_enemy)
+        self.assertEqual(self.player.coins, 9)
+        self.assertIn(self.player.health, (98, 99))
+        mock_print.assert_any_call("(a) Fight them all at once")
+        mock_print.assert_any_call("     \nYou defeated every monster!")
+        self.assertTrue(self.player.fought_in_room[self.player.room_key])
 
-        mock_load_monsters.return_value = [monster]
+    @patch('builtins.print')
+    @patch('rpg.player.get_registry')
+    def test_look_for_fight_no_more_monsters(self,
+                                             mock_get_registry, mock_print):
+        monster = {
+            'name': 'Spider',
+            'description': 'A giant spider.',
+            'health': 15,
+            'damage': 3,
+            'difficulty': 'easy'
+        }
+
+        mock_get_registry.return_value.monster_catalog = MonsterCatalog(
+            [monster]
+        )
 
         self.player.defeated_enemy.append('Spider')
 
@@ -343,9 +397,16 @@ Please select a valid action.")
 monsters to fight in this room.")
 
     @patch('builtins.print')
-    @patch('rpg.enemy.Enemy.load_monsters')
+    def test_fast_travel_nothing_explored(self, mock_print):
+        self.player.fast_travel()
+
+        mock_print.assert_called_once_with(
+            "\nYou have not explored any other rooms yet.")
+
+    @patch('builtins.print')
+    @patch('rpg.player.get_registry')
     def test_look_for_fight_already_fought_in_room(self,
-                                                   mock_load_monsters,
+                                                   mock_get_registry,
                                                    mock_print):
         room_name = self.player.current_room.name
         self.player.fought_in_room[room_name] = True
@@ -430,7 +491,8 @@ Please answer with '0' (Yes) or '1' (No).")
 
     @patch('builtins.print')
     def test_look_for_items_no_items_found(self, mock_print):
-        with patch('rpg.items.Item.load_items', return_value=[]):
+        with patch('rpg.player.get_registry') as mock_get_registry:
+            mock_get_registry.return_value.loot_table = LootTable([])
             with patch('random.randint', return_value=1):
                 self.player.look_for_items()
 
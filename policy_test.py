@@ -0,0 +1,218 @@
+from rpg.policy import (
+    solve, load_policy, read_policy, write_policy, policy_key, PolicyTable
+)
+from rpg.combat import (
+    ATTACK, DEFEND, HEAL, RUN, WON, MONSTER_RULES, BOSS_RULES,
+    TUTORIAL_RULES, CombatRules, CombatState, resolve
+)
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# A short boss fight, so the tests solve it quickly
+SMALL_BOSS_RULES = CombatRules(heal_range=(10, 30), max_health=60,
+                               enemy_damage_range=(10, 20),
+                               item_is_action=False)
+
+
+def play(table: PolicyTable, rules: CombatRules, state: CombatState,
+         fights: int) -> float:
+    """
+    Play fights with the combat engine, following the table.
+    """
+    rng = random.Random(1)
+    wins = 0
+    for _ in range(fights):
+        current = state
+        while current.outcome is None:
+            action, _ = table.lookup(current.health, current.enemy_health,
+                                     current.action_count)
+            current, _ = resolve(current, action, rules, rng)
+        wins += current.outcome == WON
+    return wins / fights
+
+
+class TestSolve(unittest.TestCase):
+
+    def test_one_hit(self):
+        """
+        Test that an enemy that dies in one hit is always attacked and won.
+        """
+        table = solve(10, 10, 50)
+        for health in (1, 50, 100):
+            self.assertEqual(table.lookup(health, 10, 0), (ATTACK, 1.0))
+
+    def test_certain_loss(self):
+        """
+        Test that a fight that cannot be survived is lost.
+        """
+        table = solve(5, 30, 100)
+        self.assertEqual(table.lookup(100, 30, 3)[1], 0.0)
+
+    def test_exact_monster_fight(self):
+        """
+        Test the win probability of a fight without randomness.
+        """
+        table = solve(10, 30, 15)
+        # Three attacks take two strikes
+        self.assertEqual(table.lookup(31, 30, 0), (ATTACK, 1.0))
+        self.assertEqual(table.lookup(30, 30, 0)[1], 0.0)
+
+    def test_heal_when_it_saves_the_fight(self):
+        """
+        Test that the player heals when attacking would lose the fight.
+        """
+        table = solve(10, 20, 15)
+        action, value = table.lookup(10, 20, 3)
+        self.assertEqual(action, HEAL)
+        self.assertGreater(value, 0.0)
+        self.assertEqual(table.lookup(10, 20, 0)[1], 0.0)
+
+    def test_flee_value(self):
+        """
+        Test that running away is chosen when it is worth more than the
+        fight.
+        """
+        table = solve(5, 30, 100, flee_value=0.5)
+        self.assertEqual(table.lookup(100, 30, 0), (RUN, 0.5))
+
+    def test_boss_defends(self):
+        """
+        Test that the boss fight uses defending, which halves the strike.
+        """
+        table = solve(10, 60, 0, SMALL_BOSS_RULES)
+        self.assertIn(DEFEND, set(table.actions))
+
+    def test_matches_engine(self):
+        """
+        Test that the solved win probability matches fights played with
+        the combat engine.
+        """
+        table = solve(10, 60, 0, SMALL_BOSS_RULES)
+        state = CombatState(60, 10, 0, 60, 0)
+        _, value = table.lookup(60, 60, 0)
+        self.assertAlmostEqual(play(table, SMALL_BOSS_RULES, state, 3000),
+                               value, delta=0.03)
+
+    def test_beats_always_attacking(self):
+        """
+        Test that the policy wins at least as often as attacking only.
+        """
+        table = solve(10, 60, 0, SMALL_BOSS_RULES)
+        attack_only = PolicyTable(
+            table.max_health, table.enemy_health, table.heal_cooldown,
+            type(table.actions)('b', [ATTACK] * len(table.actions)),
+            table.values
+        )
+        state = CombatState(60, 10, 0, 60, 0)
+        self.assertGreater(table.lookup(60, 60, 0)[1],
+                           play(attack_only, SMALL_BOSS_RULES, state, 2000))
+
+    def test_rescue_rejected(self):
+        """
+        Test that fights that rescue the player are not solved.
+        """
+        with self.assertRaises(ValueError):
+            solve(10, 30, 5, TUTORIAL_RULES)
+
+    def test_lookup_bounds(self):
+        """
+        Test that lookups clamp the state to the table.
+        """
+        table = solve(10, 30, 15)
+        self.assertEqual(table.lookup(150, 30, 7), table.lookup(100, 30, 3))
+        self.assertEqual(table.lookup(40.5, 30, 0), table.lookup(40, 30, 0))
+        self.assertEqual(table.lookup(-5, 30, 0)[1], 0.0)
+        with self.assertRaises(ValueError):
+            table.lookup(100, 31, 0)
+
+    def test_hint(self):
+        """
+        Test the advice shown for a state.
+        """
+        table = solve(10, 10, 50)
+        self.assertEqual(table.hint(100, 10, 0),
+                         "Advisor: attack (100% chance to win)")
+
+
+class TestPolicyFiles(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a temporary directory for solved tables.
+        """
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = self.temp_dir.name
+
+    def tearDown(self):
+        """
+        Remove the temporary directory.
+        """
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        """
+        Test that a written table reads back the same.
+        """
+        table = solve(10, 30, 15)
+        key = policy_key(10, 30, 15, MONSTER_RULES, 0.0)
+        path = os.path.join(self.directory, 'table.policy')
+        write_policy(table, key, path)
+        loaded = read_policy(key, path)
+        self.assertEqual(loaded.actions, table.actions)
+        self.assertEqual(loaded.values, table.values)
+        self.assertEqual((loaded.max_health, loaded.enemy_health,
+                          loaded.heal_cooldown), (100, 30, 3))
+
+    def test_stale_or_corrupt(self):
+        """
+        Test that tables of another fight or cut short are not read.
+        """
+        table = solve(10, 30, 15)
+        key = policy_key(10, 30, 15, MONSTER_RULES, 0.0)
+        path = os.path.join(self.directory, 'table.policy')
+        write_policy(table, key, path)
+        self.assertIsNone(
+            read_policy(policy_key(10, 30, 16, MONSTER_RULES, 0.0), path))
+        with open(path, 'rb') as f:
+            blob = f.read()
+        with open(path, 'wb') as f:
+            f.write(blob[:-1])
+        self.assertIsNone(read_policy(key, path))
+        self.assertIsNone(read_policy(key, path + '.missing'))
+
+    def test_key_depends_on_rules(self):
+        """
+        Test that different rules give different keys.
+        """
+        self.assertNotEqual(policy_key(10, 30, 0, MONSTER_RULES, 0.0),
+                            policy_key(10, 30, 0, BOSS_RULES, 0.0))
+
+    @patch('rpg.policy.solve', wraps=solve)
+    def test_load_solves_once(self, mock_solve):
+        """
+        Test that a fight is solved once and then read from disk.
+        """
+        first = load_policy(10, 30, 15, directory=self.directory)
+        second = load_policy(10, 30, 15, directory=self.directory)
+        mock_solve.assert_called_once()
+        self.assertEqual(first.values, second.values)
+
+    @patch('builtins.print')
+    @patch('rpg.policy.write_policy', side_effect=OSError("read-only"))
+    def test_load_unwritable(self, mock_write, mock_print):
+        """
+        Test that a table that cannot be saved is still returned.
+        """
+        table = load_policy(10, 30, 15, directory=self.directory)
+        self.assertEqual(table.lookup(31, 30, 0), (ATTACK, 1.0))
+        mock_print.assert_called_once_with(
+            "Could not save the combat policy: read-only")
+
+
+if __name__ == '__main__':
+    unittest.main()
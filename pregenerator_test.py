@@ -0,0 +1,78 @@
+from rpg.pregenerator import Pregenerator
+from rpg.world import World, START_ROOM_ID
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestPregenerator(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a world with the doors of the first two levels discovered.
+        """
+        self.world = World(seed=5)
+        self.world.discover(START_ROOM_ID)
+        for room_id in self.world.neighbours(START_ROOM_ID):
+            self.world.discover(room_id)
+
+    def test_ahead_respects_depth(self):
+        """
+        Test that only rooms within the depth are listed.
+        """
+        first = list(self.world.neighbours(START_ROOM_ID))
+        self.assertEqual(Pregenerator(self.world).ahead(START_ROOM_ID), first)
+        deeper = Pregenerator(self.world, depth=2).ahead(START_ROOM_ID)
+        self.assertEqual(deeper[:len(first)], first)
+        self.assertGreater(len(deeper), len(first))
+        self.assertNotIn(START_ROOM_ID, deeper)
+
+    def test_rooms_are_built_ahead(self):
+        """
+        Test that the rooms behind the doors are built in the background.
+        """
+        known = len(self.world)
+        pregenerator = Pregenerator(self.world, workers=2)
+        pregenerator.start()
+        pregenerator.schedule(START_ROOM_ID)
+        pregenerator.wait()
+        pregenerator.stop()
+
+        first = list(self.world.neighbours(START_ROOM_ID))
+        self.assertEqual(pregenerator.generated, len(first))
+        for room_id in first:
+            self.assertIn(room_id, self.world.rooms)
+        self.assertEqual(len(self.world), known)
+
+    def test_built_rooms_match(self):
+        """
+        Test that a room built ahead is the room the world would build.
+        """
+        pregenerator = Pregenerator(self.world)
+        pregenerator.start()
+        pregenerator.schedule(START_ROOM_ID)
+        pregenerator.wait()
+        pregenerator.stop()
+
+        other = World(seed=5)
+        other.discover(START_ROOM_ID)
+        for room_id in self.world.neighbours(START_ROOM_ID):
+            built = self.world.rooms[room_id]
+            # The game entering the room finds it ready
+            self.assertIs(self.world.room(room_id), built)
+            self.assertEqual(built.description,
+                             other.room(room_id).description)
+
+    def test_not_started(self):
+        """
+        Test that nothing is built before the pre-generator starts.
+        """
+        pregenerator = Pregenerator(self.world)
+        pregenerator.schedule(START_ROOM_ID)
+        self.assertEqual(pregenerator.generated, 0)
+        self.assertEqual(len(self.world.rooms), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
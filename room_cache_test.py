@@ -0,0 +1,163 @@
+from rpg.room_cache import RoomCache, RoomStore, RegionCache, Region
+from rpg.world import World, START_ROOM_ID
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestRoomCache(unittest.TestCase):
+
+    def test_least_recently_used_is_evicted(self):
+        """
+        Test that the room used longest ago leaves first.
+        """
+        evict = MagicMock()
+        cache = RoomCache(2, evict)
+        cache.put(1, "one")
+        cache.put(2, "two")
+        self.assertEqual(cache.get(1), "one")
+        cache.put(3, "three")
+        evict.assert_called_once_with(2, "two")
+        self.assertIn(1, cache)
+        self.assertNotIn(2, cache)
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.stats(), {
+            'hits': 1, 'misses': 1, 'evictions': 1, 'faults': 0,
+            'size': 2, 'capacity': 2
+        })
+
+    def test_unbounded(self):
+        """
+        Test that a cache without capacity keeps every room.
+        """
+        cache = RoomCache()
+        for room_id in range(100):
+            cache.put(room_id, room_id)
+        self.assertEqual(len(cache), 100)
+        self.assertEqual(cache.evictions, 0)
+
+
+class TestRoomStore(unittest.TestCase):
+
+    def test_save_and_load(self):
+        """
+        Test that a stored state is handed back once.
+        """
+        store = RoomStore()
+        self.addCleanup(store.close)
+        store.save(5, {'locked': True})
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.load(5), {'locked': True})
+        self.assertIsNone(store.load(5))
+        self.assertEqual(len(store), 0)
+
+    def test_peek(self):
+        """
+        Test that peeking at a stored state leaves it in the store.
+        """
+        store = RoomStore()
+        self.addCleanup(store.close)
+        store.save(5, {'locked': True})
+        self.assertEqual(store.peek(5), {'locked': True})
+        self.assertEqual(store.load(5), {'locked': True})
+        self.assertIsNone(store.peek(5))
+
+
+class TestWorldPaging(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a world that keeps one room in memory.
+        """
+        self.world = World(seed=3, cache_size=1, region_size=1)
+        self.world.discover(START_ROOM_ID)
+        self.ids = list(self.world.neighbours(START_ROOM_ID))
+
+    def test_memory_is_bounded(self):
+        """
+        Test that visiting many rooms keeps only the most recent ones.
+        """
+        for room_id in self.ids:
+            self.world.room(room_id)
+        self.assertEqual(len(self.world.rooms), 1)
+        self.assertEqual(self.world.rooms.evictions, len(self.ids) - 1)
+        self.assertIsNone(self.world.store)
+
+    def test_changed_rooms_are_paged_out(self):
+        """
+        Test that an evicted room comes back with its changes.
+        """
+        changed = self.world.room(self.ids[0])
+        self.world.record(self.ids[0], 'monsters', ["Goblin"])
+        self.world.record(self.ids[0], 'looted')
+        for room_id in self.ids[1:]:
+            self.world.room(room_id)
+        self.assertNotIn(self.ids[0], self.world.rooms)
+        self.assertEqual(len(self.world.store), 1)
+
+        restored = self.world.room(self.ids[0])
+        self.assertIsNot(restored, changed)
+        self.assertEqual(self.world.changes(self.ids[0]),
+                         {'looted': True, 'monsters': ["Goblin"]})
+        self.assertEqual(self.world.rooms.faults, 1)
+        self.assertEqual(restored.description, changed.description)
+
+
+class TestRegionCache(unittest.TestCase):
+
+    def test_rooms_share_their_region(self):
+        """
+        Test that rooms are kept and evicted by region.
+        """
+        evict = MagicMock()
+        cache = RegionCache(4, 1, evict=evict)
+        for room_id in range(4):
+            cache.region(room_id).rooms[room_id] = f"room {room_id}"
+        self.assertEqual(len(cache), 4)
+        self.assertEqual(cache[2], "room 2")
+        cache.region(4)
+        self.assertNotIn(2, cache)
+        self.assertEqual(cache.evictions, 1)
+        region_id, region = evict.call_args.args
+        self.assertEqual(region_id, 0)
+        self.assertEqual(len(region.rooms), 4)
+
+    def test_loaded_regions_count_as_faults(self):
+        """
+        Test that a region coming back with stored state is a fault.
+        """
+        cache = RegionCache(4, load=lambda region_id: Region({5: {}}))
+        self.assertEqual(cache.region(5).states, {5: {}})
+        self.assertEqual(cache.faults, 1)
+
+
+class TestWorldRegions(unittest.TestCase):
+
+    def test_region_is_paged_as_one(self):
+        """
+        Test that the changed rooms of a region go to disk in one row and
+        come back together.
+        """
+        world = World(seed=3, cache_size=4, region_size=4)
+        frontier = [START_ROOM_ID]
+        while len(world) < 12:
+            room_id = frontier.pop(0)
+            world.discover(room_id)
+            frontier.extend(world.neighbours(room_id))
+        for room_id in range(4):
+            world.record(room_id, 'monsters', [f"Monster {room_id}"])
+        world.room(4)
+        world.room(8)
+        self.assertEqual(len(world.store), 1)
+        self.assertEqual(world.rooms.stats()['size'], 1)
+
+        for room_id in range(4):
+            self.assertEqual(world.changes(room_id)['monsters'],
+                             [f"Monster {room_id}"])
+        self.assertEqual(world.rooms.faults, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
-from rpg.room import room
+from rpg.room import room, RoomStub
+from rpg.content import ContentRegistry
 import unittest
-from unittest.mock import patch, mock_open
-import json
+from unittest.mock import patch
+import subprocess
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -35,13 +36,13 @@ class TestRoom(unittest.TestCase):
         self.assertEqual(len(room_instance.npcs), 0)
         self.assertEqual(len(room_instance.traders), 0)
 
-    @patch('builtins.open', new_callable=mock_open, read_data=json.dumps({
-        "room_descriptions": ["A mysterious room."],
-        "npcs": [],
-        "traders": []
+    @patch('rpg.room.get_registry', return_value=ContentRegistry.from_data({
+        'descriptions.json': {
+            "room_descriptions": ["A mysterious room."]
+        }
     }))
     @patch('random.choice', return_value="A mysterious room.")
-    def test_room_random_description(self, mock_choice, mock_open):
+    def test_room_random_description(self, mock_choice, mock_get_registry):
         """
         Test that a random room description is chosen when none is provided.
         """
@@ -66,24 +67,26 @@ class TestRoom(unittest.TestCase):
                    "value": 50, "description": "Restores 50 health.",
                    "price": 10}]
     })
-    @patch('builtins.open', new_callable=mock_open, read_data=json.dumps({
-        "npcs": [
-            {"name": "Friendly NPC",
-             "description": "A helpful character.",
-             "dialogues": {}}
-        ],
-        "traders": [
-            {"name": "Trader Bob",
-             "description": "A merchant with many goods.",
-             "dialogues": {},
-             "items": [{"name": "Health Potion", "rarity": "common",
-                                "effect_type": "health", "value": 50,
-                                "description": "Restores 50 health.",
-                                "price": 10}]}
-        ]
+    @patch('rpg.room.get_registry', return_value=ContentRegistry.from_data({
+        'npc_diaologues.json': {
+            "npcs": [
+                {"name": "Friendly NPC",
+                 "description": "A helpful character.",
+                 "dialogues": {}}
+            ],
+            "traders": [
+                {"name": "Trader Bob",
+                 "description": "A merchant with many goods.",
+                 "dialogues": {},
+                 "items": [{"name": "Health Potion", "rarity": "common",
+                            "effect_type": "health", "value": 50,
+                            "description": "Restores 50 health.",
+                            "price": 10}]}
+            ]
+        }
     }))
     def test_initialize_npcs(self,
-                             mock_open,
+                             mock_get_registry,
                              mock_choice,
                              mock_sample,
                              mock_randint):
@@ -103,14 +106,14 @@ class TestRoom(unittest.TestCase):
 
     @patch('random.randint', return_value=3)
     @patch('random.shuffle', side_effect=lambda x: x)
-    @patch('builtins.open', new_callable=mock_open, read_data=json.dumps({
-        "door_descriptions": ["A sturdy oak door.",
-                              "A creaky old door.",
-                              "A metal door."],
-        "npcs": [],
-        "traders": []
+    @patch('rpg.room.get_registry', return_value=ContentRegistry.from_data({
+        'descriptions.json': {
+            "door_descriptions": ["A sturdy oak door.",
+                                  "A creaky old door.",
+                                  "A metal door."]
+        }
     }))
-    def test_add_doors(self, mock_open, mock_shuffle, mock_randint):
+    def test_add_doors(self, mock_get_registry, mock_shuffle, mock_randint):
         """
         Test that doors are added correctly to the room.
         """
@@ -124,6 +127,9 @@ class TestRoom(unittest.TestCase):
             self.assertIn("Door 1", self.default_room.doors)
             self.assertIn("Door 2", self.default_room.doors)
             self.assertIn("Door 3", self.default_room.doors)
+            names = [new_door._destination.name
+                     for new_door in self.default_room.doors.values()]
+            self.assertEqual(names, ["Room 3", "Room 4", "Room 5"])
 
     @patch('builtins.print')
     def test_room_inspect(self, mock_print):
@@ -147,14 +153,15 @@ room or look for NPCs.")
 
     @patch('random.randint', side_effect=[2])
     @patch('random.choice', return_value="A mysterious room.")
-    @patch('builtins.open', new_callable=mock_open, read_data=json.dumps({
-        "room_descriptions": ["A mysterious room."],
-        "door_descriptions": ["A simple wooden door.", "A heavy iron door."],
-        "npcs": [],
-        "traders": []
+    @patch('rpg.room.get_registry', return_value=ContentRegistry.from_data({
+        'descriptions.json': {
+            "room_descriptions": ["A mysterious room."],
+            "door_descriptions": ["A simple wooden door.",
+                                  "A heavy iron door."]
+        }
     }))
     def test_room_random_description_and_doors(self,
-                                               mock_open,
+                                               mock_get_registry,
                                                mock_choice,
                                                mock_randint):
         """
@@ -170,6 +177,53 @@ room or look for NPCs.")
             # Two doors should be added
             self.assertEqual(len(new_room.doors), 2)
 
+    @patch('random.randint', return_value=3)
+    def test_add_doors_builds_no_rooms(self, mock_randint):
+        """
+        Test that the rooms behind new doors are only built when entered.
+        """
+        with patch.object(room, 'initialize_npcs') as mock_initialize:
+            self.default_room.add_doors([self.default_room])
+        mock_initialize.assert_not_called()
+        for new_door in self.default_room.doors.values():
+            self.assertFalse(new_door.explored)
+        entered = self.default_room.doors["Door 1"].destination
+        self.assertIsInstance(entered, room)
+        self.assertEqual(entered.name, "Room 2")
+        self.assertIs(self.default_room.doors["Door 1"].destination, entered)
+
+    def test_seeded_rooms_are_reproducible(self):
+        """
+        Test that a stub always builds the same room.
+        """
+        stub = RoomStub("Room 2", 1234, None)
+        first, second = stub.materialize(), stub.materialize()
+        self.assertEqual(first.description, second.description)
+        self.assertEqual([character.name for character in first.npcs],
+                         [character.name for character in second.npcs])
+        self.assertEqual([trader.name for trader in first.traders],
+                         [trader.name for trader in second.traders])
+
+    def test_import_does_no_file_io(self):
+        """
+        Test that importing the game opens no content files.
+        """
+        code = (
+            "import sys\n"
+            "opened = []\n"
+            "sys.addaudithook(lambda event, args: opened.append(args[0])\n"
+            "                 if event == 'open' else None)\n"
+            "import rpg.game\n"
+            "print(sum(str(path).endswith(('.json', '.snapshot'))\n"
+            "          for path in opened))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output, "0\n")
+
 
 if __name__ == '__main__':
     unittest.main()
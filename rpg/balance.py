@@ -0,0 +1,236 @@
+import sys
+from .combat import MONSTER_RULES
+from .content import get_registry
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, only the simulator needs it
+    np = None
+
+HEALTHS = (40, 70, 100)
+DAMAGES = (5, 10, 15, 20)
+FIGHTS = 10_000
+MAX_TURNS = 500
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("The balance simulator needs NumPy, "
+                          "install it with 'pip install numpy'")
+
+
+def simulate_monster(
+        monster: dict,
+        healths: tuple = HEALTHS,
+        damages: tuple = DAMAGES,
+        fights: int = FIGHTS,
+        heal_below: int = 50,
+        run_below: int = 0,
+        rng=None,
+        rules=MONSTER_RULES
+        ) -> list:
+    """
+    Simulate many fights of players against one monster at once.
+
+    Every fight for every combination of player health and damage is one
+    element of a set of arrays, and each turn of all fights is resolved
+    with a handful of array operations, following the rules of
+    player.start_combat: the player heals when the heal is ready and
+    their health is below `heal_below`, runs away when it is below
+    `run_below` and the heal is not ready, and attacks otherwise. The
+    monster answers every heal and attack. Defending is never chosen: it
+    takes half of the monster's damage on top of its usual attack, so it
+    is always worse than attacking.
+
+    Args:
+        monster (dict): The monster, as in monsters.json.
+        healths (tuple, optional): The player health values to try
+        (default is HEALTHS).
+        damages (tuple, optional): The player damage values to try
+        (default is DAMAGES).
+        fights (int, optional): Fights per health and damage pair
+        (default is FIGHTS).
+        heal_below (int, optional): Heal below this health
+        (default is 50).
+        run_below (int, optional): Run away below this health when the
+        heal is not ready (default is 0, never).
+        rng (numpy.random.Generator, optional): The random number source.
+        Defaults to None, which creates a new one.
+        rules (CombatRules, optional): The rules of the fight
+        (default is MONSTER_RULES). Only the heal and health limits are
+        taken from them.
+
+    Returns:
+        list: One dict per health and damage pair, with the win, loss and
+        flee rates, the mean number of turns and the mean health lost.
+
+    Raises:
+        ValueError: If the rules draw the enemy's damage, floor the health
+        lost when running or rescue the player, which are not simulated.
+    """
+    if (rules.enemy_damage_range is not None or rules.run_floor
+            or rules.rescue_health is not None):
+        raise ValueError("Only fights against a monster's own damage, "
+                         "without rescue, can be simulated")
+    _require_numpy()
+    if rng is None:
+        rng = np.random.default_rng()
+    cells = len(healths) * len(damages)
+    start_health = np.repeat(
+        np.repeat(np.asarray(healths, dtype=np.float64), len(damages)),
+        fights
+    )
+    damage = np.repeat(
+        np.tile(np.asarray(damages, dtype=np.int64), len(healths)), fights
+    )
+    health = start_health.copy()
+    enemy_health = np.full(cells * fights, monster['health'], np.int64)
+    action_count = np.zeros(cells * fights, np.int64)
+    turns = np.zeros(cells * fights, np.int64)
+    won = np.zeros(cells * fights, bool)
+    lost = np.zeros(cells * fights, bool)
+    fled = np.zeros(cells * fights, bool)
+    active = np.ones(cells * fights, bool)
+    low, high = rules.heal_range
+
+    for _ in range(MAX_TURNS):
+        if not active.any():
+            break
+        turns += active
+        ready = action_count >= rules.heal_cooldown
+        heal = active & ready & (health < heal_below)
+        run = active & ~ready & (health < run_below)
+        attack = active & ~heal & ~run
+
+        amount = rng.integers(low, high + 1, size=health.shape)
+        health = np.where(
+            heal, np.minimum(health + amount, rules.max_health), health
+        )
+        action_count = np.where(heal, 0, action_count)
+
+        health = np.where(run, health * 0.5, health)
+        fled |= run
+
+        enemy_health = np.where(attack, enemy_health - damage, enemy_health)
+        action_count = action_count + attack
+        won |= attack & (enemy_health <= 0)
+
+        struck = (heal | attack) & ~won
+        health = np.where(struck, health - monster['damage'], health)
+        lost |= struck & (health <= 0)
+        active &= ~(won | lost | fled)
+
+    health_lost = start_health - np.maximum(health, 0)
+    results = []
+    for cell in range(cells):
+        part = slice(cell * fights, (cell + 1) * fights)
+        results.append({
+            'monster': monster['name'],
+            'difficulty': monster['difficulty'],
+            'health': healths[cell // len(damages)],
+            'damage': damages[cell % len(damages)],
+            'fights': fights,
+            'win_rate': float(won[part].mean()),
+            'loss_rate': float(lost[part].mean()),
+            'flee_rate': float(fled[part].mean()),
+            'turns': float(turns[part].mean()),
+            'health_lost': float(health_lost[part].mean()),
+        })
+    return results
+
+
+def simulate(
+        monsters: list = None,
+        healths: tuple = HEALTHS,
+        damages: tuple = DAMAGES,
+        fights: int = FIGHTS,
+        heal_below: int = 50,
+        run_below: int = 0,
+        seed: int = None
+        ) -> list:
+    """
+    Simulate fights against every monster of the roster.
+
+    Args:
+        monsters (list, optional): The monsters. Defaults to None, which
+        uses the monsters of the current content.
+        healths (tuple, optional): The player health values to try
+        (default is HEALTHS).
+        damages (tuple, optional): The player damage values to try
+        (default is DAMAGES).
+        fights (int, optional): Fights per monster, health and damage
+        (default is FIGHTS).
+        heal_below (int, optional): Heal below this health
+        (default is 50).
+        run_below (int, optional): Run away below this health when the
+        heal is not ready (default is 0, never).
+        seed (int, optional): The seed of the simulation. Defaults to
+        None, which picks a random one.
+
+    Returns:
+        list: The results of simulate_monster for every monster.
+    """
+    _require_numpy()
+    if monsters is None:
+        monsters = get_registry().monsters
+    rng = np.random.default_rng(seed)
+    results = []
+    for monster in monsters:
+        results.extend(simulate_monster(
+            monster, healths, damages, fights, heal_below, run_below, rng
+        ))
+    return results
+
+
+def by_difficulty(results: list) -> list:
+    """
+    Average simulation results over the monsters of each difficulty.
+
+    Args:
+        results (list): The results of simulate.
+
+    Returns:
+        list: One dict per difficulty, health and damage, with the mean
+        rates, turns and health lost.
+    """
+    groups = {}
+    for result in results:
+        key = (result['difficulty'], result['health'], result['damage'])
+        groups.setdefault(key, []).append(result)
+    summary = []
+    for (difficulty, health, damage), group in groups.items():
+        row = {'difficulty': difficulty, 'health': health, 'damage': damage,
+               'monsters': len(group)}
+        for column in ('win_rate', 'loss_rate', 'flee_rate', 'turns',
+                       'health_lost'):
+            row[column] = sum(result[column] for result in group) / len(group)
+        summary.append(row)
+    return summary
+
+
+def main(fights: int = FIGHTS) -> None:
+    """
+    Print the balance of every monster difficulty.
+
+    Args:
+        fights (int, optional): Fights per monster, health and damage
+        (default is FIGHTS).
+
+    Returns:
+        None
+    """
+    try:
+        results = simulate(fights=fights, seed=0)
+    except ImportError as e:
+        print(e)
+        return
+    print(f"{'difficulty':<10} {'health':>6} {'damage':>6} {'win %':>6} "
+          f"{'turns':>6} {'hp lost':>7}")
+    for row in by_difficulty(results):
+        print(f"{row['difficulty']:<10} {row['health']:>6} "
+              f"{row['damage']:>6} {row['win_rate'] * 100:6.1f} "
+              f"{row['turns']:6.1f} {row['health_lost']:7.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else FIGHTS)
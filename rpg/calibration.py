@@ -0,0 +1,353 @@
+import argparse
+import os
+import random
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from .combat import (
+    ATTACK, HEAL, RUN, WON, LOST, FLED, MONSTER_RULES, BOSS_RULES,
+    CombatRules, CombatState, resolve
+)
+from .content import get_registry
+from .sampler import derive_seed
+
+# The boss health and damage ranges FinalBoss uses today
+CURRENT_HEALTH = (250, 300)
+CURRENT_DAMAGE = BOSS_RULES.enemy_damage_range
+
+# The ranges the curves are drawn over
+HEALTH_RANGES = tuple((low, low + 50) for low in range(150, 1000, 100))
+DAMAGE_RANGES = ((10, 20), (20, 40), (30, 60), (40, 80))
+
+RUNS = 2000
+FIGHTS = 5        # boss fights per arrival and boss range
+CHUNK_RUNS = 250  # runs per task handed to a worker
+MAX_TURNS = 500
+
+# Rooms are entered one at a time; Cornelia waits in the eighth and the
+# final room comes after 20 to 25
+CORNELIA_ROOM = 8
+FINAL_ROOMS = (20, 25)
+
+# The state of the player when they enter the final room
+Arrival = namedtuple('Arrival', [
+    'health',
+    'damage',
+    'action_count',
+    'potions',  # the values of the unused health items
+])
+
+
+def fight_monster(health, damage: int, action_count: int, monster: dict,
+                  rng, heal_below: int = 50) -> CombatState:
+    """
+    Play a fight against a monster the way a careful player would: heal
+    when the heal is ready and health is low, run away when the next
+    attack would be deadly and the heal is not ready, attack otherwise.
+
+    Args:
+        health: The player's health.
+        damage (int): The player's damage.
+        action_count (int): The actions since the player last healed.
+        monster (dict): The monster, as in monsters.json.
+        rng: The random number source.
+        heal_below (int, optional): Heal below this health (default is 50).
+
+    Returns:
+        CombatState: The state at the end of the fight.
+    """
+    state = CombatState(health, damage, action_count, monster['health'],
+                        monster['damage'])
+    for _ in range(MAX_TURNS):
+        ready = state.action_count >= MONSTER_RULES.heal_cooldown
+        if ready and state.health < heal_below:
+            action = HEAL
+        elif not ready and state.health <= monster['damage']:
+            action = RUN
+        else:
+            action = ATTACK
+        state, _ = resolve(state, action, MONSTER_RULES, rng)
+        if state.outcome is not None:
+            break
+    return state
+
+
+def simulate_run(rng, content=None, search_rate: float = 1.0) -> Arrival:
+    """
+    Simulate a run of the game up to the final room.
+
+    In a share of the rooms the player looks for items; they equip damage
+    items at once and keep health items, drinking one whenever it heals
+    without waste. In every room they then look for a fight and take on
+    the weakest monster found. Cornelia's card game is won three times
+    out of four, as only Spades loses. Traders are not visited.
+
+    Args:
+        rng: The random number source.
+        content (ContentRegistry, optional): The content to play with.
+        Defaults to None, which uses the current content.
+        search_rate (float, optional): The share of rooms the player looks
+        for items in (default is 1.0, every room).
+
+    Returns:
+        Arrival: The player's state on entering the final room, or None if
+        they were defeated before.
+    """
+    if content is None:
+        content = get_registry()
+    catalog = content.monster_catalog
+    loot_table = content.loot_table
+    epic_rewards = content.epic_rewards
+    max_health = MONSTER_RULES.max_health
+    health, damage, action_count = 100, 10, 0
+    potions = []
+    defeated = set()
+
+    for room in range(1, rng.randint(*FINAL_ROOMS)):
+        if room == CORNELIA_ROOM:
+            if rng.randrange(4) == 2:
+                health = health * 0.5
+            elif epic_rewards:
+                damage += rng.choice(epic_rewards)['value']
+
+        searches = rng.randint(1, 3) if rng.random() < search_rate else 0
+        for _ in range(searches):
+            item = loot_table.draw(rng)
+            if item is None:
+                continue
+            if item.effect_type == 'damage':
+                damage += item.value
+            elif item.effect_type == 'health':
+                potions.append(item.value)
+        potions.sort()
+        while potions and health + potions[0] <= max_health:
+            health += potions.pop(0)
+
+        monsters = catalog.sample_undefeated(rng.randint(0, 2), defeated, rng)
+        if monsters:
+            monster = min(monsters, key=lambda m: (m['damage'], m['health']))
+            state = fight_monster(health, damage, action_count, monster, rng)
+            health, action_count = state.health, state.action_count
+            if state.outcome == LOST:
+                return None
+            if state.outcome != FLED:
+                defeated.add(monster['name'])
+
+    return Arrival(health, damage, action_count, tuple(potions))
+
+
+def fight_boss(arrival: Arrival, boss_health: int, rules: CombatRules,
+               rng, heal_below: int = 70, drink_below: int = 40) -> bool:
+    """
+    Play the final boss fight from an arrival state.
+
+    Items take no time in the final fight, so the player drinks a health
+    item whenever their health is within reach of the boss's strongest
+    usual attack, heals when the heal is ready and health is below
+    `heal_below`, and attacks otherwise.
+
+    Args:
+        arrival (Arrival): The player's state on entering the final room.
+        boss_health (int): The boss's health.
+        rules (CombatRules): The rules of the fight.
+        rng: The random number source.
+        heal_below (int, optional): Heal below this health (default is 70).
+        drink_below (int, optional): Drink a health item at or below this
+        health (default is 40).
+
+    Returns:
+        bool: Whether the player won.
+    """
+    state = CombatState(arrival.health, arrival.damage, arrival.action_count,
+                        boss_health, 0)
+    potions = list(arrival.potions)
+    for _ in range(MAX_TURNS):
+        while potions and state.health <= drink_below:
+            state = state._replace(health=min(state.health + potions.pop(),
+                                              rules.max_health))
+        if (state.action_count >= rules.heal_cooldown
+                and state.health < heal_below):
+            action = HEAL
+        else:
+            action = ATTACK
+        state, _ = resolve(state, action, rules, rng)
+        if state.outcome is not None:
+            break
+    return state.outcome == WON
+
+
+def boss_rules(damage_range: tuple) -> CombatRules:
+    """
+    Return the final fight rules with another boss damage range.
+
+    Args:
+        damage_range (tuple): The lowest and highest boss attack.
+
+    Returns:
+        CombatRules: The rules.
+    """
+    settings = dict(vars(BOSS_RULES))
+    settings['enemy_damage_range'] = tuple(damage_range)
+    return CombatRules(**settings)
+
+
+def calibrate_chunk(seed: int, runs: int, ranges: list, fights: int,
+                    search_rate: float = 1.0) -> dict:
+    """
+    Simulate runs and fight the boss from every arrival with every pair
+    of boss ranges. This is one task of calibrate, run by a worker.
+
+    Args:
+        seed (int): The seed of the task.
+        runs (int): The number of runs to simulate.
+        ranges (list): Pairs of (health range, damage range) to try.
+        fights (int): Boss fights per arrival and pair.
+        search_rate (float, optional): The share of rooms the player looks
+        for items in (default is 1.0).
+
+    Returns:
+        dict: The number of runs, the arrivals, and the wins and fights of
+        every pair, in the order given.
+    """
+    rng = random.Random(seed)
+    arrivals = []
+    for _ in range(runs):
+        arrival = simulate_run(rng, search_rate=search_rate)
+        if arrival is not None:
+            arrivals.append(arrival)
+
+    wins = []
+    for health_range, damage_range in ranges:
+        rules = boss_rules(damage_range)
+        won = 0
+        for arrival in arrivals:
+            for _ in range(fights):
+                won += fight_boss(arrival, rng.randint(*health_range), rules,
+                                  rng)
+        wins.append(won)
+    return {'runs': runs, 'arrivals': arrivals, 'wins': wins,
+            'fights': len(arrivals) * fights}
+
+
+def calibrate(
+        runs: int = RUNS,
+        health_ranges: tuple = HEALTH_RANGES,
+        damage_ranges: tuple = DAMAGE_RANGES,
+        fights: int = FIGHTS,
+        search_rate: float = 1.0,
+        seed: int = 0,
+        workers: int = None
+        ) -> dict:
+    """
+    Estimate the chance to beat the final boss for every pair of boss
+    health and damage ranges, from arrival states of simulated runs.
+
+    The runs are split into tasks of CHUNK_RUNS with seeds derived from
+    `seed`, so the results do not depend on the number of workers.
+
+    Args:
+        runs (int, optional): The number of runs to simulate
+        (default is RUNS).
+        health_ranges (tuple, optional): The boss health ranges to try
+        (default is HEALTH_RANGES).
+        damage_ranges (tuple, optional): The boss damage ranges to try
+        (default is DAMAGE_RANGES).
+        fights (int, optional): Boss fights per arrival and pair of ranges
+        (default is FIGHTS).
+        search_rate (float, optional): The share of rooms the player looks
+        for items in (default is 1.0).
+        seed (int, optional): The seed of the calibration (default is 0).
+        workers (int, optional): The number of worker processes. Defaults
+        to None, which uses every core; 1 runs everything in this process.
+
+    Returns:
+        dict: 'runs', 'arrivals' (the arrival states), 'reach_rate' (the
+        share of runs reaching the boss) and 'curves', one dict per pair
+        of ranges with its 'health', 'damage', 'fights' and 'win_rate'.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    ranges = [(tuple(health), tuple(damage))
+              for damage in damage_ranges for health in health_ranges]
+    tasks = []
+    for chunk, start in enumerate(range(0, runs, CHUNK_RUNS)):
+        tasks.append((derive_seed(seed, chunk),
+                      min(CHUNK_RUNS, runs - start), ranges, fights,
+                      search_rate))
+
+    if workers == 1:
+        results = [calibrate_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(calibrate_chunk, *zip(*tasks)))
+
+    arrivals = [arrival for result in results
+                for arrival in result['arrivals']]
+    fought = sum(result['fights'] for result in results)
+    curves = []
+    for index, (health, damage) in enumerate(ranges):
+        won = sum(result['wins'][index] for result in results)
+        curves.append({'health': health, 'damage': damage, 'fights': fought,
+                       'win_rate': won / fought if fought else 0.0})
+    return {'runs': runs, 'arrivals': arrivals,
+            'reach_rate': len(arrivals) / runs if runs else 0.0,
+            'curves': curves}
+
+
+def main(argv: list = None) -> None:
+    """
+    Print the win rate against the final boss for every pair of ranges.
+
+    Args:
+        argv (list, optional): The command line arguments
+        (default is sys.argv[1:]).
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(
+        description="Calibrate the final boss from simulated runs.")
+    parser.add_argument('runs', nargs='?', type=int, default=RUNS)
+    parser.add_argument('--fights', type=int, default=FIGHTS,
+                        help="boss fights per arrival and pair of ranges")
+    parser.add_argument('--search-rate', type=float, default=1.0,
+                        help="share of rooms the player looks for items in")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default is every core)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    results = calibrate(args.runs, fights=args.fights,
+                        search_rate=args.search_rate, seed=args.seed,
+                        workers=args.workers)
+    arrivals = results['arrivals']
+    print(f"{len(arrivals)} of {results['runs']} runs reached the boss "
+          f"({results['reach_rate'] * 100:.1f}%)")
+    if not arrivals:
+        return
+    damages = sorted(arrival.damage for arrival in arrivals)
+    health = sum(arrival.health for arrival in arrivals) / len(arrivals)
+    print(f"Arrival health {health:.1f} on average, "
+          f"damage {damages[len(damages) // 4]} / "
+          f"{damages[len(damages) // 2]} / {damages[3 * len(damages) // 4]} "
+          f"(quartiles)")
+
+    damage_ranges = list(dict.fromkeys(row['damage']
+                                       for row in results['curves']))
+    print(f"\n{'boss health':<12}" + "".join(
+        f"{f'dmg {low}-{high}':>12}" for low, high in damage_ranges))
+    rows = {}
+    for row in results['curves']:
+        rows.setdefault(row['health'], {})[row['damage']] = row['win_rate']
+    for health, by_damage in rows.items():
+        marks = "".join(
+            f"{by_damage[damage] * 100:11.1f}"
+            + ("*" if (health, damage) == (CURRENT_HEALTH, CURRENT_DAMAGE)
+               else " ")
+            for damage in damage_ranges
+        )
+        print(f"{f'{health[0]}-{health[1]}':<12}{marks}")
+    print("\n* the ranges FinalBoss uses today")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+import random
+from collections import namedtuple
+
+# Actions a combatant can take in one turn
+ATTACK = 0
+DEFEND = 1
+HEAL = 2
+ITEM = 3  # An item was used; the inventory applies its effect
+RUN = 4
+PASS = 5  # The turn is spent without doing anything
+
+# How a fight ended
+WON = 'won'
+LOST = 'lost'
+FLED = 'fled'
+
+CombatState = namedtuple('CombatState', [
+    'health',        # the player's health
+    'damage',        # the damage of the player's attack
+    'action_count',  # actions since the player last healed
+    'enemy_health',
+    'enemy_damage',
+    'defending',     # whether the next enemy attack is halved
+    'outcome',       # None while the fight goes on, else WON, LOST or FLED
+], defaults=(False, None))
+
+# Events of a turn, in the order they happened
+Attacked = namedtuple('Attacked', ['damage', 'enemy_health'])
+Braced = namedtuple('Braced', ['damage', 'health'])
+Healed = namedtuple('Healed', ['amount', 'health', 'capped'])
+HealRefused = namedtuple('HealRefused', [])
+ItemUsed = namedtuple('ItemUsed', ['health', 'damage'])
+EnemyAttacked = namedtuple('EnemyAttacked', ['damage', 'defended', 'health'])
+Rescued = namedtuple('Rescued', ['health'])
+Fled = namedtuple('Fled', ['lost', 'health'])
+EnemyDefeated = namedtuple('EnemyDefeated', [])
+PlayerDefeated = namedtuple('PlayerDefeated', [])
+
+# A fight against a group of enemies, indexed from 0. The totals of the
+# living enemies are kept up to date as they fall, so their attacks are
+# resolved at once whatever the size of the group
+GroupState = namedtuple('GroupState', [
+    'health',
+    'damage',
+    'action_count',
+    'enemy_health',  # tuple, an enemy at 0 or below is defeated
+    'enemy_damage',  # tuple
+    'strike',        # the summed damage of the living enemies
+    'braced',        # the summed halved damage of the living enemies
+    'alive',         # the number of living enemies
+    'defending',
+    'outcome',
+], defaults=(False, None))
+
+# Events of a group fight turn, next to the ones above
+TargetAttacked = namedtuple('TargetAttacked',
+                            ['target', 'damage', 'enemy_health'])
+TargetDefeated = namedtuple('TargetDefeated', ['target'])
+EnemiesAttacked = namedtuple('EnemiesAttacked',
+                             ['damage', 'attackers', 'defended', 'health'])
+
+
+class CombatRules:
+    def __init__(
+            self,
+            heal_range: tuple = (10, 30),
+            heal_cooldown: int = 3,
+            max_health: int = 100,
+            brace_immediately: bool = False,
+            enemy_damage_range: tuple = None,
+            item_is_action: bool = True,
+            run_floor: bool = False,
+            rescue_health: int = None
+            ) -> None:
+        """
+        Initialize the rules of a kind of fight.
+
+        Args:
+            heal_range (tuple, optional): The lowest and highest amount a
+            heal restores (default is (10, 30)).
+            heal_cooldown (int, optional): The actions needed before
+            healing again (default is 3).
+            max_health (int, optional): The most health the player can
+            have (default is 100).
+            brace_immediately (bool, optional): Whether defending takes
+            half the enemy's damage at once, instead of halving its next
+            attack (default is False).
+            enemy_damage_range (tuple, optional): The range every enemy
+            attack is drawn from. Defaults to None, which uses the enemy's
+            own damage.
+            item_is_action (bool, optional): Whether using an item counts
+            as an action the enemy answers. Otherwise it takes no time
+            (default is True).
+            run_floor (bool, optional): Whether running away halves the
+            health rounding down, keeping at least 1 health. Otherwise
+            half of it is lost exactly (default is False).
+            rescue_health (int, optional): Health at or below which the
+            player is healed to full after an enemy attack. Defaults to
+            None, which never does.
+
+        Returns:
+            None
+        """
+        self.heal_range = heal_range
+        self.heal_cooldown = heal_cooldown
+        self.max_health = max_health
+        self.brace_immediately = brace_immediately
+        self.enemy_damage_range = enemy_damage_range
+        self.item_is_action = item_is_action
+        self.run_floor = run_floor
+        self.rescue_health = rescue_health
+
+
+# The rules of the three fights in the game
+MONSTER_RULES = CombatRules(brace_immediately=True)
+BOSS_RULES = CombatRules(enemy_damage_range=(20, 40), item_is_action=False)
+TUTORIAL_RULES = CombatRules(heal_range=(7, 15), run_floor=True,
+                             rescue_health=50)
+
+
+def resolve(state: CombatState, action: int, rules: CombatRules,
+            rng=random) -> tuple:
+    """
+    Resolve one turn of a fight: the player's action and the enemy's
+    answer.
+
+    The engine does no input or output and never changes its arguments,
+    so the same fight can be played in the terminal, on a server or in a
+    simulation.
+
+    Args:
+        state (CombatState): The state before the turn.
+        action (int): What the player does (ATTACK, DEFEND, HEAL, ITEM,
+            RUN or PASS).
+        rules (CombatRules): The rules of the fight.
+        rng (optional): The random number source
+            (default is the random module).
+
+    Returns:
+        tuple: The CombatState after the turn and the list of events of
+        the turn.
+    """
+    (health, damage, action_count, enemy_health, enemy_damage,
+     defending, outcome) = state
+    events = []
+    enemy_answers = True
+
+    if action == ATTACK:
+        enemy_health -= damage
+        action_count += 1
+        events.append(Attacked(damage, enemy_health))
+        if enemy_health <= 0:
+            events.append(EnemyDefeated())
+            return state._replace(
+                action_count=action_count, enemy_health=enemy_health,
+                outcome=WON
+            ), events
+    elif action == DEFEND:
+        action_count += 1
+        if rules.brace_immediately:
+            braced = max(enemy_damage // 2, 0)
+            health -= braced
+            events.append(Braced(braced, health))
+        else:
+            defending = True
+            events.append(Braced(0, health))
+    elif action == HEAL:
+        if action_count >= rules.heal_cooldown:
+            amount = rng.randint(*rules.heal_range)
+            capped = health + amount > rules.max_health
+            health = min(health + amount, rules.max_health)
+            action_count = 0
+            events.append(Healed(amount, health, capped))
+        else:
+            events.append(HealRefused())
+    elif action == ITEM:
+        events.append(ItemUsed(health, damage))
+        if rules.item_is_action:
+            action_count += 1
+        else:
+            enemy_answers = False
+    elif action == RUN:
+        if rules.run_floor:
+            lost = health - max(health // 2, 1)
+        else:
+            lost = health * 0.5
+        health -= lost
+        events.append(Fled(lost, health))
+        return state._replace(health=health, outcome=FLED), events
+
+    if enemy_answers and enemy_health > 0:
+        if rules.enemy_damage_range is not None:
+            hit = rng.randint(*rules.enemy_damage_range)
+        else:
+            hit = enemy_damage
+        defended = defending
+        if defending:
+            hit = max(hit // 2, 0)
+            defending = False
+        health -= hit
+        events.append(EnemyAttacked(hit, defended, health))
+        if (health > 0 and rules.rescue_health is not None
+                and health <= rules.rescue_health):
+            health = rules.max_health
+            events.append(Rescued(health))
+
+    if health <= 0:
+        outcome = LOST
+        events.append(PlayerDefeated())
+    return CombatState(health, damage, action_count, enemy_health,
+                       enemy_damage, defending, outcome), events
+
+
+def group_state(health, damage: int, action_count: int,
+                enemy_health, enemy_damage) -> GroupState:
+    """
+    Start a fight against a group of enemies.
+
+    Args:
+        health: The player's health.
+        damage (int): The damage of the player's attack.
+        action_count (int): Actions since the player last healed.
+        enemy_health: The health of every enemy.
+        enemy_damage: The damage of every enemy, in the same order.
+
+    Returns:
+        GroupState: The state before the first turn.
+    """
+    enemy_health = tuple(enemy_health)
+    enemy_damage = tuple(enemy_damage)
+    living = [i for i, left in enumerate(enemy_health) if left > 0]
+    return GroupState(
+        health, damage, action_count, enemy_health, enemy_damage,
+        sum(enemy_damage[i] for i in living),
+        sum(max(enemy_damage[i] // 2, 0) for i in living),
+        len(living)
+    )
+
+
+def resolve_group(state: GroupState, action: int, rules: CombatRules,
+                  target: int = None, rng=random) -> tuple:
+    """
+    Resolve one turn of a fight against a group: the player's action and
+    the answer of every living enemy.
+
+    The player's action works as in resolve, an attack hitting `target`.
+    The enemies then strike together as one update of the running totals
+    kept in the state, and defending halves every strike, so with fixed
+    enemy damage a turn costs the same against one enemy or fifty. Only
+    rules that draw enemy damage from a range draw once per living enemy.
+
+    Args:
+        state (GroupState): The state before the turn.
+        action (int): What the player does (ATTACK, DEFEND, HEAL, ITEM,
+            RUN or PASS).
+        rules (CombatRules): The rules of the fight.
+        target (int, optional): The enemy to attack. Defaults to None,
+            which attacks the first living enemy, as does a defeated one.
+        rng (optional): The random number source
+            (default is the random module).
+
+    Returns:
+        tuple: The GroupState after the turn and the list of events of
+        the turn.
+    """
+    (health, damage, action_count, enemy_health, enemy_damage, strike,
+     braced, alive, defending, outcome) = state
+    events = []
+    enemy_answers = True
+
+    if action == ATTACK:
+        if (target is None or not 0 <= target < len(enemy_health)
+                or enemy_health[target] <= 0):
+            target = next(i for i, left in enumerate(enemy_health)
+                          if left > 0)
+        left = enemy_health[target] - damage
+        enemy_health = (enemy_health[:target] + (left,)
+                        + enemy_health[target + 1:])
+        action_count += 1
+        events.append(TargetAttacked(target, damage, left))
+        if left <= 0:
+            strike -= enemy_damage[target]
+            braced -= max(enemy_damage[target] // 2, 0)
+            alive -= 1
+            events.append(TargetDefeated(target))
+            if alive == 0:
+                events.append(EnemyDefeated())
+                return state._replace(
+                    action_count=action_count, enemy_health=enemy_health,
+                    strike=strike, braced=braced, alive=alive, outcome=WON
+                ), events
+    elif action == DEFEND:
+        action_count += 1
+        if rules.brace_immediately:
+            health -= braced
+            events.append(Braced(braced, health))
+        else:
+            defending = True
+            events.append(Braced(0, health))
+    elif action == HEAL:
+        if action_count >= rules.heal_cooldown:
+            amount = rng.randint(*rules.heal_range)
+            capped = health + amount > rules.max_health
+            health = min(health + amount, rules.max_health)
+            action_count = 0
+            events.append(Healed(amount, health, capped))
+        else:
+            events.append(HealRefused())
+    elif action == ITEM:
+        events.append(ItemUsed(health, damage))
+        if rules.item_is_action:
+            action_count += 1
+        else:
+            enemy_answers = False
+    elif action == RUN:
+        if rules.run_floor:
+            lost = health - max(health // 2, 1)
+        else:
+            lost = health * 0.5
+        health -= lost
+        events.append(Fled(lost, health))
+        return state._replace(health=health, outcome=FLED), events
+
+    if enemy_answers and alive > 0:
+        if rules.enemy_damage_range is not None:
+            hits = [rng.randint(*rules.enemy_damage_range)
+                    for left in enemy_health if left > 0]
+            if defending:
+                hits = [max(hit // 2, 0) for hit in hits]
+            hit = sum(hits)
+        else:
+            hit = braced if defending else strike
+        defended = defending
+        defending = False
+        health -= hit
+        events.append(EnemiesAttacked(hit, alive, defended, health))
+        if (health > 0 and rules.rescue_health is not None
+                and health <= rules.rescue_health):
+            health = rules.max_health
+            events.append(Rescued(health))
+
+    if health <= 0:
+        outcome = LOST
+        events.append(PlayerDefeated())
+    return GroupState(health, damage, action_count, enemy_health,
+                      enemy_damage, strike, braced, alive, defending,
+                      outcome), events
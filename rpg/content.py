@@ -0,0 +1,415 @@
+from .items import Item, ItemTemplate, item_template_id
+from .loot import LootTable
+from .enemy import MonsterCatalog
+from .dialogue import DialogueGraph
+from .content_pack import ContentPack, merge_section
+from .content_snapshot import CONTENT_DIR, load_content
+
+
+def _add_templates(
+        templates: dict,
+        items: list,
+        traders: list,
+        epic_rewards: list
+        ) -> None:
+    """
+    Add the item templates defined by content sections to an index.
+
+    Args:
+        templates (dict): The index mapping template ids to templates.
+        items (list): Dictionaries describing loot items.
+        traders (list): Dictionaries describing traders and their items.
+        epic_rewards (list): Dictionaries describing Cornelia's rewards.
+
+    Returns:
+        None
+    """
+    for item in items:
+        template_id = item_template_id('items', item['name'])
+        templates[template_id] = Item.from_dict(item, template_id).template
+    for trader in traders:
+        for item in trader.get('items', []):
+            template_id = item_template_id(
+                'traders', trader['name'], item['name']
+            )
+            templates[template_id] = Item.from_dict(item, template_id).template
+    for reward in epic_rewards:
+        template_id = item_template_id('epic_rewards', reward['name'])
+        templates[template_id] = ItemTemplate.intern(
+            reward['name'], 'epic', reward['effect_type'], reward['value'],
+            reward['description'], reward['price'], template_id
+        )
+
+
+class ContentRegistry:
+    def __init__(
+            self,
+            base_dir: str = CONTENT_DIR,
+            version: int = 0,
+            parent: 'ContentRegistry' = None
+            ) -> None:
+        """
+        Initialize a ContentRegistry reading the game's JSON content.
+
+        A registry serves one content pack. A registry with a parent lays
+        its pack over the parent's content: its entries replace the
+        parent's entries with the same name and add new ones.
+
+        Everything is computed lazily and layer by layer. Every content file
+        is parsed at most once, the first time one of its sections is
+        requested, and a layer only merges its own entries into the merged
+        sections of its parent. Indexes over sections a pack does not touch
+        are shared with the parent, so a large pack costs nothing to
+        sessions that never use it and little to those that do.
+
+        Args:
+            base_dir (str, optional): The directory holding the content
+            files (default is the rpg package directory).
+            version (int, optional): The version number of the content,
+            raised on every reload (default is 0).
+            parent (ContentRegistry, optional): The content the pack is
+            laid over, None for the base pack (default is None).
+
+        Returns:
+            None
+        """
+        self.pack = ContentPack(base_dir, overlay=parent is not None)
+        self.version = version
+        self.parent = parent
+        self._sections = {}
+        self._items = None
+        self._item_templates = None
+        self._loot_table = None
+        self._monster_catalog = None
+        self._dialogue_graphs = {}
+        self._pack_characters = None
+
+    @classmethod
+    def from_data(
+            cls,
+            data: dict,
+            base_dir: str = CONTENT_DIR,
+            version: int = 0
+            ) -> 'ContentRegistry':
+        """
+        Create a ContentRegistry from already parsed content.
+
+        Args:
+            data (dict): A dictionary mapping content file names to their
+            parsed JSON data. Missing files are read from disk on demand.
+            base_dir (str, optional): The directory holding the content
+            files (default is the rpg package directory).
+            version (int, optional): The version number of the content
+            (default is 0).
+
+        Returns:
+            ContentRegistry: A registry serving the given content.
+        """
+        registry = cls(base_dir, version)
+        registry.pack._files.update(data)
+        return registry
+
+    @property
+    def base_dir(self) -> str:
+        """
+        str: The directory holding the content files of this layer's pack.
+        """
+        return self.pack.base_dir
+
+    @property
+    def packs(self) -> list:
+        """
+        list: The content packs of every layer, base pack first.
+        """
+        packs = [] if self.parent is None else self.parent.packs
+        packs.append(self.pack)
+        return packs
+
+    def with_pack(self, base_dir: str) -> 'ContentRegistry':
+        """
+        Lay a content pack over this registry's content.
+
+        Nothing is read until the new registry's content is requested, and
+        this registry is left unchanged.
+
+        Args:
+            base_dir (str): The directory holding the pack's content files.
+
+        Returns:
+            ContentRegistry: A registry serving the combined content.
+        """
+        return ContentRegistry(base_dir, self.version, parent=self)
+
+    def with_packs(self, pack_dirs: list) -> 'ContentRegistry':
+        """
+        Lay several content packs over this registry's content in order.
+
+        Args:
+            pack_dirs (list): The directories of the packs, the last one
+            taking precedence.
+
+        Returns:
+            ContentRegistry: A registry serving the combined content, this
+            registry itself if there are no packs.
+        """
+        registry = self
+        for base_dir in pack_dirs:
+            registry = registry.with_pack(base_dir)
+        return registry
+
+    def warm(self) -> None:
+        """
+        Build every lazily computed index of the registry up front.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.loot_table
+        self.monster_catalog
+        self.item_templates
+        for character in self.npcs + self.traders:
+            self.dialogue_graph(character)
+        self.room_descriptions
+        self.door_descriptions
+
+    def _section(self, filename: str, key: str) -> list:
+        """
+        Return one top-level section of a content file, merged over every
+        layer.
+
+        Args:
+            filename (str): The name of the content file.
+            key (str): The section to return.
+
+        Returns:
+            list: The entries of the section, empty if it is missing.
+        """
+        if self.parent is None:
+            return self.pack.section(filename, key)
+        if (filename, key) not in self._sections:
+            self._sections[filename, key] = merge_section(
+                self.parent._section(filename, key),
+                self.pack.section(filename, key)
+            )
+        return self._sections[filename, key]
+
+    def _inherits(self, filename: str, *keys: str) -> bool:
+        """
+        Check whether this layer's pack leaves some sections unchanged, so
+        indexes over them can be shared with the parent.
+
+        Args:
+            filename (str): The name of the content file.
+            *keys (str): The sections to check.
+
+        Returns:
+            bool: True if the parent's indexes can be used as they are.
+        """
+        return self.parent is not None and not any(
+            self.pack.section(filename, key) for key in keys
+        )
+
+    @property
+    def items(self) -> list:
+        """
+        list: The loot items as Item objects, built once.
+        """
+        if self._items is None and self._inherits('items.json', 'items'):
+            self._items = self.parent.items
+        elif self._items is None:
+            self._items = [
+                Item.from_dict(item, item_template_id('items', item['name']))
+                for item in self._section('items.json', 'items')
+            ]
+        return self._items
+
+    @property
+    def item_templates(self) -> dict:
+        """
+        dict: Every item template of the content (loot, trader stock and
+        Cornelia's rewards) by template id.
+        """
+        if self._item_templates is None and self.parent is not None:
+            # Only this layer's own entries are added to the parent's index
+            templates = dict(self.parent.item_templates)
+            _add_templates(
+                templates,
+                self.pack.section('items.json', 'items'),
+                self.pack.section('npc_diaologues.json', 'traders'),
+                self.pack.section('items.json', 'epic_rewards')
+            )
+            self._item_templates = templates
+        elif self._item_templates is None:
+            templates = {}
+            _add_templates(templates,
+                           self._section('items.json', 'items'),
+                           self.traders, self.epic_rewards)
+            self._item_templates = templates
+        return self._item_templates
+
+    def find_items(
+            self,
+            rarity: str = None,
+            effect_type: str = None,
+            max_price: int = None
+            ) -> list:
+        """
+        Find the item templates matching every given criterion.
+
+        Args:
+            rarity (str, optional): The rarity the items must have.
+            effect_type (str, optional): The type of effect the items must
+            have ('health' or 'damage').
+            max_price (int, optional): The highest price the items may have.
+            Items whose price is not a number never match.
+
+        Returns:
+            list: The matching item templates.
+        """
+        return [
+            template for template in self.item_templates.values()
+            if (rarity is None or template.rarity == rarity)
+            and (effect_type is None or template.effect_type == effect_type)
+            and (max_price is None or (isinstance(template.price, int)
+                                       and template.price <= max_price))
+        ]
+
+    @property
+    def loot_table(self) -> LootTable:
+        """
+        LootTable: The loot table over the items, compiled once.
+        """
+        if self._loot_table is None and self._inherits('items.json', 'items'):
+            self._loot_table = self.parent.loot_table
+        elif self._loot_table is None:
+            self._loot_table = LootTable(self.items)
+        return self._loot_table
+
+    @property
+    def epic_rewards(self) -> list:
+        """
+        list: Dictionaries describing the epic items Cornelia hands out.
+        """
+        return self._section('items.json', 'epic_rewards')
+
+    @property
+    def monsters(self) -> list:
+        """
+        list: Dictionaries describing every monster.
+        """
+        return self._section('monsters.json', 'monsters')
+
+    @property
+    def monster_catalog(self) -> MonsterCatalog:
+        """
+        MonsterCatalog: The monsters indexed by name and difficulty.
+        """
+        if (self._monster_catalog is None
+                and self._inherits('monsters.json', 'monsters')):
+            self._monster_catalog = self.parent.monster_catalog
+        elif self._monster_catalog is None:
+            self._monster_catalog = MonsterCatalog(self.monsters)
+        return self._monster_catalog
+
+    @property
+    def npcs(self) -> list:
+        """
+        list: Dictionaries describing every non-trader NPC.
+        """
+        return self._section('npc_diaologues.json', 'npcs')
+
+    @property
+    def traders(self) -> list:
+        """
+        list: Dictionaries describing every trader and their items.
+        """
+        return self._section('npc_diaologues.json', 'traders')
+
+    @property
+    def pack_characters(self) -> set:
+        """
+        set: The names of the NPCs and traders this layer's pack defines.
+        """
+        if self._pack_characters is None:
+            self._pack_characters = {
+                character['name']
+                for key in ('npcs', 'traders')
+                for character in self.pack.section('npc_diaologues.json', key)
+            }
+        return self._pack_characters
+
+    def dialogue_graph(self, character: dict) -> DialogueGraph:
+        """
+        Return the compiled dialogues of an NPC or trader.
+
+        Dialogues are compiled once per character and shared by every
+        instance of that character, and by every layer whose pack leaves
+        the character unchanged.
+
+        Args:
+            character (dict): The NPC or trader entry of the content.
+
+        Returns:
+            DialogueGraph: The character's compiled dialogues.
+        """
+        name = character['name']
+        if self.parent is not None and name not in self.pack_characters:
+            return self.parent.dialogue_graph(character)
+        graph = self._dialogue_graphs.get(name)
+        if graph is None:
+            graph = DialogueGraph.compile(character.get('dialogues', {}))
+            self._dialogue_graphs[name] = graph
+        return graph
+
+    @property
+    def room_descriptions(self) -> list:
+        """
+        list: The descriptions a room can be given.
+        """
+        return self._section('descriptions.json', 'room_descriptions')
+
+    @property
+    def door_descriptions(self) -> list:
+        """
+        list: The descriptions a door can be given.
+        """
+        return self._section('descriptions.json', 'door_descriptions')
+
+
+_registry = None
+
+
+def get_registry() -> ContentRegistry:
+    """
+    Return the process-wide content registry, creating it on first use.
+
+    The registry is filled from the compiled content snapshot, so the
+    first call costs a single file read once the snapshot exists.
+
+    Args:
+        None
+
+    Returns:
+        ContentRegistry: The shared content registry.
+    """
+    global _registry
+    if _registry is None:
+        _registry = ContentRegistry.from_data(load_content())
+    return _registry
+
+
+def set_registry(registry: ContentRegistry) -> None:
+    """
+    Replace the process-wide content registry.
+
+    Args:
+        registry (ContentRegistry): The registry to share from now on.
+
+    Returns:
+        None
+    """
+    global _registry
+    _registry = registry
@@ -0,0 +1,473 @@
+import os
+import sqlite3
+from collections.abc import Mapping, Sequence
+from .content import ContentRegistry
+from .content_snapshot import CONTENT_DIR, content_key, load_content
+from .enemy import MonsterCatalog
+from .items import ITEM_FIELDS, Item, ItemTemplate, item_template_id
+from .loot import RARITY_WEIGHTS, LootTable
+
+DATABASE_NAME = 'content.sqlite3'
+
+MONSTER_FIELDS = ('name', 'description', 'health', 'damage', 'difficulty')
+
+# Sections served from the database; everything else comes from JSON
+DATABASE_SECTIONS = {
+    ('items.json', 'items'): 'items',
+    ('items.json', 'epic_rewards'): 'epic_rewards',
+    ('monsters.json', 'monsters'): 'monsters',
+}
+
+# Loot items are numbered within their rarity (loot_rank) so a random loot
+# item is found with one index lookup. Monsters are numbered by position
+# for the same reason.
+SCHEMA = """
+CREATE TABLE items (
+    template_id TEXT PRIMARY KEY,
+    section TEXT NOT NULL,
+    name TEXT NOT NULL,
+    rarity TEXT NOT NULL,
+    effect_type TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    description TEXT NOT NULL,
+    price INTEGER NOT NULL,
+    loot_rank INTEGER
+);
+CREATE INDEX items_rarity ON items (rarity, loot_rank);
+CREATE INDEX items_effect_type ON items (effect_type, price);
+CREATE INDEX items_price ON items (price);
+CREATE INDEX items_query ON items (rarity, effect_type, price);
+CREATE INDEX items_section ON items (section);
+CREATE TABLE monsters (
+    position INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT NOT NULL,
+    health INTEGER NOT NULL,
+    damage INTEGER NOT NULL,
+    difficulty TEXT NOT NULL
+);
+CREATE INDEX monsters_difficulty ON monsters (difficulty);
+CREATE TABLE meta (
+    content_key BLOB NOT NULL
+);
+"""
+
+ITEM_COLUMNS = ", ".join(ITEM_FIELDS)
+MONSTER_COLUMNS = ", ".join(MONSTER_FIELDS)
+
+
+def database_path(base_dir: str = CONTENT_DIR) -> str:
+    """
+    Return where the content database of a content directory is kept.
+
+    Args:
+        base_dir (str, optional): The directory holding the content files.
+
+    Returns:
+        str: The path of the database file.
+    """
+    return os.path.join(base_dir, '__pycache__', DATABASE_NAME)
+
+
+def build_database(registry: ContentRegistry, path: str) -> None:
+    """
+    Store the items and monsters of a registry in a new SQLite database.
+
+    The database is written next to its final location and renamed into
+    place, like the content snapshot. It records the content key of the
+    registry's JSON files, so a database older than its sources is
+    recognised as stale.
+
+    Args:
+        registry (ContentRegistry): The content to store.
+        path (str): Where to write the database.
+
+    Returns:
+        None
+    """
+    def item_rows():
+        ranks = {}
+        for item in registry.items:
+            rank = ranks.get(item.rarity, 0)
+            ranks[item.rarity] = rank + 1
+            yield (item.template.template_id, 'items', item.name,
+                   item.rarity, item.effect_type, item.value,
+                   item.description, item.price, rank)
+        for trader in registry.traders:
+            for item in trader.get('items', []):
+                yield (item_template_id('traders', trader['name'],
+                                        item['name']),
+                       'traders', *(item[field] for field in ITEM_FIELDS),
+                       None)
+        for reward in registry.epic_rewards:
+            yield (item_template_id('epic_rewards', reward['name']),
+                   'epic_rewards', reward['name'], 'epic',
+                   reward['effect_type'], reward['value'],
+                   reward['description'], reward['price'], None)
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    connection = sqlite3.connect(temp_path)
+    try:
+        connection.executescript(SCHEMA)
+        connection.executemany(
+            "INSERT INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            item_rows()
+        )
+        connection.executemany(
+            "INSERT INTO monsters VALUES (?, ?, ?, ?, ?, ?)",
+            ((position, *(monster[field] for field in MONSTER_FIELDS))
+             for position, monster in enumerate(registry.monsters))
+        )
+        connection.execute(
+            "INSERT INTO meta VALUES (?)", (content_key(registry.base_dir),)
+        )
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(temp_path, path)
+
+
+class _LootBucket(Sequence):
+    """
+    The loot items of one rarity, read from the database on demand.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, rarity: str) -> None:
+        self.connection = connection
+        self.rarity = rarity
+        self.size = connection.execute(
+            "SELECT COUNT(*) FROM items WHERE rarity = ? "
+            "AND loot_rank IS NOT NULL", (rarity,)
+        ).fetchone()[0]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> Item:
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        row = self.connection.execute(
+            f"SELECT template_id, {ITEM_COLUMNS} FROM items "
+            "WHERE rarity = ? AND loot_rank = ?", (self.rarity, index)
+        ).fetchone()
+        return Item.from_template(ItemTemplate.intern(*row[1:], row[0]))
+
+
+class SQLiteLootTable(LootTable):
+    def __init__(
+            self,
+            connection: sqlite3.Connection,
+            weights: dict = RARITY_WEIGHTS
+            ) -> None:
+        """
+        Initialize a loot table over the loot items of a content database.
+
+        Draws work exactly like in a LootTable, but every bucket only
+        knows its size and reads the drawn item through the rarity index.
+
+        Args:
+            connection (sqlite3.Connection): The content database.
+            weights (dict, optional): The chance of rolling each rarity
+            (default is RARITY_WEIGHTS).
+
+        Returns:
+            None
+        """
+        self.rarities = tuple(weights)
+        self.buckets = tuple(
+            _LootBucket(connection, rarity) for rarity in self.rarities
+        )
+        self.probability, self.alias = self._build_alias(
+            [weights[rarity] for rarity in self.rarities]
+        )
+
+
+class _MonsterRows(Sequence):
+    """
+    The monsters of the database in catalog order, read on demand.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self.size = connection.execute(
+            "SELECT COUNT(*) FROM monsters"
+        ).fetchone()[0]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> dict:
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        row = self.connection.execute(
+            f"SELECT {MONSTER_COLUMNS} FROM monsters WHERE position = ?",
+            (index,)
+        ).fetchone()
+        return dict(zip(MONSTER_FIELDS, row))
+
+    def __iter__(self):
+        rows = self.connection.execute(
+            f"SELECT {MONSTER_COLUMNS} FROM monsters ORDER BY position"
+        )
+        for row in rows:
+            yield dict(zip(MONSTER_FIELDS, row))
+
+
+class SQLiteMonsterCatalog(MonsterCatalog):
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """
+        Initialize a monster catalog over a content database.
+
+        Lookups by name and difficulty use the database indexes, and
+        sampling reads only the monsters it draws.
+
+        Args:
+            connection (sqlite3.Connection): The content database.
+
+        Returns:
+            None
+        """
+        self.connection = connection
+        self.monsters = _MonsterRows(connection)
+
+    def get(self, name: str) -> dict:
+        """
+        Look up a monster template by name.
+
+        Args:
+            name (str): The name of the monster.
+
+        Returns:
+            dict: The monster template, or None if there is no such monster.
+        """
+        row = self.connection.execute(
+            f"SELECT {MONSTER_COLUMNS} FROM monsters WHERE name = ?", (name,)
+        ).fetchone()
+        return None if row is None else dict(zip(MONSTER_FIELDS, row))
+
+    def with_difficulty(self, difficulty: str) -> tuple:
+        """
+        Return every monster template of a difficulty.
+
+        Args:
+            difficulty (str): The difficulty level.
+
+        Returns:
+            tuple: The matching monster templates.
+        """
+        rows = self.connection.execute(
+            f"SELECT {MONSTER_COLUMNS} FROM monsters WHERE difficulty = ? "
+            "ORDER BY position", (difficulty,)
+        )
+        return tuple(dict(zip(MONSTER_FIELDS, row)) for row in rows)
+
+
+class _TemplateIndex(Mapping):
+    """
+    Item templates by template id, read from the database on demand.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+
+    def __getitem__(self, template_id: str) -> ItemTemplate:
+        row = self.connection.execute(
+            f"SELECT {ITEM_COLUMNS} FROM items WHERE template_id = ?",
+            (template_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(template_id)
+        return ItemTemplate.intern(*row, template_id)
+
+    def __iter__(self):
+        rows = self.connection.execute(
+            "SELECT template_id FROM items ORDER BY rowid"
+        )
+        for row in rows:
+            yield row[0]
+
+    def __len__(self) -> int:
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM items"
+        ).fetchone()[0]
+
+
+class SQLiteRegistry(ContentRegistry):
+    def __init__(
+            self,
+            path: str = None,
+            base_dir: str = CONTENT_DIR,
+            version: int = 0
+            ) -> None:
+        """
+        Initialize a content registry backed by a SQLite database.
+
+        Items and monsters are served from the database through its
+        indexes, so lookups, loot draws and monster sampling cost the same
+        whatever the size of the catalog. NPCs, traders and descriptions
+        are read from the JSON files as usual. Listing a whole section
+        (for example `monsters`) still reads every row.
+
+        A database built from other versions of the JSON files than the
+        current ones is refused, so one registry never mixes two content
+        versions.
+
+        Args:
+            path (str, optional): The database file (default is the
+            database of the content directory).
+            base_dir (str, optional): The directory holding the JSON
+            content files (default is the rpg package directory).
+            version (int, optional): The version number of the content
+            (default is 0).
+
+        Returns:
+            None
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or is stale.
+        """
+        super().__init__(base_dir, version)
+        self.path = path or database_path(base_dir)
+        # Opened read-only: a missing file is an error, not a new database
+        self.connection = sqlite3.connect(
+            f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+        )
+        try:
+            row = self.connection.execute(
+                "SELECT content_key FROM meta"
+            ).fetchone()
+            key = content_key(base_dir)
+            if not key or row is None or row[0] != key:
+                raise sqlite3.DatabaseError(
+                    f"{self.path} is older than the content files"
+                )
+        except sqlite3.Error:
+            self.connection.close()
+            raise
+
+    def _section(self, filename: str, key: str) -> list:
+        """
+        Return one top-level section of the content, reading items and
+        monsters from the database.
+
+        Args:
+            filename (str): The name of the content file.
+            key (str): The section to return.
+
+        Returns:
+            list: The entries of the section, empty if it is missing.
+        """
+        section = DATABASE_SECTIONS.get((filename, key))
+        if section is None:
+            return super()._section(filename, key)
+        if (filename, key) not in self._sections:
+            if section == 'monsters':
+                entries = list(self.monster_catalog.monsters)
+            else:
+                fields = ITEM_FIELDS
+                if section == 'epic_rewards':
+                    fields = tuple(f for f in fields if f != 'rarity')
+                rows = self.connection.execute(
+                    f"SELECT {', '.join(fields)} FROM items "
+                    "WHERE section = ? ORDER BY rowid", (section,)
+                )
+                entries = [dict(zip(fields, row)) for row in rows]
+            self._sections[filename, key] = entries
+        return self._sections[filename, key]
+
+    @property
+    def item_templates(self) -> Mapping:
+        """
+        Mapping: Every item template of the content by template id.
+        """
+        if self._item_templates is None:
+            self._item_templates = _TemplateIndex(self.connection)
+        return self._item_templates
+
+    @property
+    def loot_table(self) -> LootTable:
+        """
+        LootTable: The loot table over the items of the database.
+        """
+        if self._loot_table is None:
+            self._loot_table = SQLiteLootTable(self.connection)
+        return self._loot_table
+
+    @property
+    def monster_catalog(self) -> MonsterCatalog:
+        """
+        MonsterCatalog: The monsters of the database.
+        """
+        if self._monster_catalog is None:
+            self._monster_catalog = SQLiteMonsterCatalog(self.connection)
+        return self._monster_catalog
+
+    def find_items(
+            self,
+            rarity: str = None,
+            effect_type: str = None,
+            max_price: int = None
+            ) -> list:
+        """
+        Find the item templates matching every given criterion.
+
+        Args:
+            rarity (str, optional): The rarity the items must have.
+            effect_type (str, optional): The type of effect the items must
+            have ('health' or 'damage').
+            max_price (int, optional): The highest price the items may have.
+            Items whose price is not a number never match, as text sorts
+            after numbers in SQLite.
+
+        Returns:
+            list: The matching item templates.
+        """
+        conditions = []
+        parameters = []
+        for condition, parameter in (("rarity = ?", rarity),
+                                     ("effect_type = ?", effect_type),
+                                     ("price <= ?", max_price)):
+            if parameter is not None:
+                conditions.append(condition)
+                parameters.append(parameter)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        rows = self.connection.execute(
+            f"SELECT {ITEM_COLUMNS}, template_id FROM items {where}"
+            "ORDER BY rowid", parameters
+        )
+        return [ItemTemplate.intern(*row) for row in rows]
+
+
+def open_registry(
+        path: str = None,
+        base_dir: str = CONTENT_DIR
+        ) -> ContentRegistry:
+    """
+    Open the SQLite content backend, falling back to the JSON content.
+
+    Args:
+        path (str, optional): The database file (default is the database
+        of the content directory).
+        base_dir (str, optional): The directory holding the JSON content
+        files (default is the rpg package directory).
+
+    Returns:
+        ContentRegistry: A SQLiteRegistry, or a registry over the JSON
+        content if the database cannot be opened or is stale.
+    """
+    try:
+        return SQLiteRegistry(path, base_dir)
+    except sqlite3.Error as e:
+        print(f"Error opening content database: {e}")
+        return ContentRegistry.from_data(load_content(base_dir), base_dir)
+
+
+if __name__ == "__main__":
+    path = database_path()
+    build_database(
+        ContentRegistry.from_data(load_content(), CONTENT_DIR), path
+    )
+    print(f"Content database written to {path}")
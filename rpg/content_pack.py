@@ -0,0 +1,113 @@
+import json
+import os
+from .content_snapshot import CONTENT_DIR
+
+
+class ContentPack:
+    def __init__(self, base_dir: str = CONTENT_DIR, overlay: bool = False):
+        """
+        Initialize a ContentPack reading JSON content from one directory.
+
+        The base pack holds every content file of the game. An overlay pack
+        only holds the files it changes, laid out like the base pack, so its
+        missing files are simply empty.
+
+        Every file is parsed at most once, the first time one of its
+        sections is requested.
+
+        Args:
+            base_dir (str, optional): The directory holding the content
+            files (default is the rpg package directory).
+            overlay (bool, optional): Whether the pack is an overlay
+            (default is False).
+
+        Returns:
+            None
+        """
+        self.base_dir = base_dir
+        self.overlay = overlay
+        self._files = {}
+
+    @property
+    def name(self) -> str:
+        """
+        str: The name of the pack, taken from its directory.
+        """
+        return os.path.basename(os.path.normpath(self.base_dir))
+
+    def load_file(self, filename: str) -> dict:
+        """
+        Parse a content file once and cache its data.
+
+        Args:
+            filename (str): The name of the content file.
+
+        Returns:
+            dict: The parsed file, or an empty dictionary if it could not
+            be read.
+        """
+        if filename not in self._files:
+            path = os.path.join(self.base_dir, filename)
+            try:
+                with open(path, 'r') as f:
+                    self._files[filename] = json.load(f)
+            except FileNotFoundError as e:
+                if not self.overlay:
+                    print(f"Error loading {filename}: {e}")
+                self._files[filename] = {}
+            except json.JSONDecodeError as e:
+                print(f"Error loading {filename}: {e}")
+                self._files[filename] = {}
+        return self._files[filename]
+
+    def section(self, filename: str, key: str) -> list:
+        """
+        Return one top-level section of a content file.
+
+        Args:
+            filename (str): The name of the content file.
+            key (str): The section to return.
+
+        Returns:
+            list: The entries of the section, empty if it is missing.
+        """
+        return self.load_file(filename).get(key, [])
+
+
+def merge_section(base: list, overlay: list) -> list:
+    """
+    Lay the entries of an overlay section over a base section.
+
+    Named entries (monsters, items, NPCs and traders) replace the base
+    entry with the same name in place and are appended otherwise. Plain
+    entries such as descriptions are appended.
+
+    Args:
+        base (list): The entries of the base section.
+        overlay (list): The entries the overlay adds or replaces.
+
+    Returns:
+        list: The merged entries. The base list itself is returned when the
+        overlay is empty, so layers that change nothing share it.
+    """
+    if not overlay:
+        return base
+    merged = list(base)
+    positions = None
+    for entry in overlay:
+        if not isinstance(entry, dict):
+            merged.append(entry)
+            continue
+        if positions is None:
+            positions = {
+                existing['name']: index
+                for index, existing in enumerate(merged)
+                if isinstance(existing, dict)
+            }
+        index = positions.get(entry['name'])
+        if index is None:
+            positions[entry['name']] = len(merged)
+            merged.append(entry)
+        else:
+            merged[index] = entry
+    return merged
@@ -0,0 +1,252 @@
+import hashlib
+import json
+import marshal
+import os
+
+CONTENT_DIR = os.path.dirname(__file__)
+
+# Content files and the top-level sections the game reads from them
+CONTENT_FILES = {
+    'items.json': ('items', 'epic_rewards'),
+    'monsters.json': ('monsters',),
+    'npc_diaologues.json': ('npcs', 'traders'),
+    'descriptions.json': ('room_descriptions', 'door_descriptions'),
+}
+
+# Fields every entry of a section must provide
+REQUIRED_FIELDS = {
+    'items': ('name', 'rarity', 'effect_type', 'value', 'description',
+              'price'),
+    'epic_rewards': ('name', 'effect_type', 'value', 'description', 'price'),
+    'monsters': ('name', 'description', 'health', 'damage', 'difficulty'),
+    'npcs': ('name', 'description', 'dialogues'),
+    'traders': ('name', 'description', 'dialogues', 'items'),
+}
+
+SNAPSHOT_MAGIC = b'RPGC'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_NAME = 'content.snapshot'
+
+
+def snapshot_path(base_dir: str = CONTENT_DIR) -> str:
+    """
+    Return where the snapshot of a content directory is cached.
+
+    Args:
+        base_dir (str, optional): The directory holding the content files.
+
+    Returns:
+        str: The path of the snapshot file.
+    """
+    return os.path.join(base_dir, '__pycache__', SNAPSHOT_NAME)
+
+
+def content_key(base_dir: str = CONTENT_DIR) -> bytes:
+    """
+    Compute the key identifying the current version of the content files.
+
+    The key hashes the size and modification time of every source file,
+    the same stamps Python uses to invalidate its own bytecode caches, so
+    checking it costs a few stat calls instead of reading the sources.
+
+    Args:
+        base_dir (str, optional): The directory holding the content files.
+
+    Returns:
+        bytes: A 32 byte digest, or empty bytes if a file is missing.
+    """
+    digest = hashlib.sha256(SNAPSHOT_VERSION.to_bytes(2, 'big'))
+    for filename in sorted(CONTENT_FILES):
+        try:
+            stat = os.stat(os.path.join(base_dir, filename))
+        except OSError:
+            return b''
+        digest.update(f"{filename}:{stat.st_size}:{stat.st_mtime_ns};"
+                      .encode())
+    return digest.digest()
+
+
+def validate_content(data: dict) -> list:
+    """
+    Check parsed content for missing sections and malformed entries.
+
+    Args:
+        data (dict): A dictionary mapping content file names to their
+        parsed JSON data.
+
+    Returns:
+        list: A description of every problem found, empty if the content
+        is valid.
+    """
+    problems = []
+    for filename, sections in CONTENT_FILES.items():
+        file_data = data.get(filename)
+        if not isinstance(file_data, dict):
+            problems.append(f"{filename}: missing or not an object")
+            continue
+        for section in sections:
+            entries = file_data.get(section)
+            if not isinstance(entries, list):
+                problems.append(f"{filename}: '{section}' is not a list")
+                continue
+            fields = REQUIRED_FIELDS.get(section)
+            for index, entry in enumerate(entries):
+                if fields is None:
+                    if not isinstance(entry, str):
+                        problems.append(
+                            f"{filename}: {section}[{index}] is not a string"
+                        )
+                    continue
+                if not isinstance(entry, dict):
+                    problems.append(
+                        f"{filename}: {section}[{index}] is not an object"
+                    )
+                    continue
+                missing = [field for field in fields if field not in entry]
+                if missing:
+                    problems.append(
+                        f"{filename}: {section}[{index}] is missing "
+                        f"{', '.join(missing)}"
+                    )
+    return problems
+
+
+def compile_content(base_dir: str = CONTENT_DIR) -> dict:
+    """
+    Parse and validate every content file of a directory.
+
+    Args:
+        base_dir (str, optional): The directory holding the content files.
+
+    Returns:
+        dict: A dictionary mapping content file names to their parsed data.
+
+    Raises:
+        ValueError: If a file cannot be parsed or fails validation.
+    """
+    data = {}
+    for filename in CONTENT_FILES:
+        path = os.path.join(base_dir, filename)
+        try:
+            with open(path, 'r') as f:
+                data[filename] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            raise ValueError(f"Error loading {filename}: {e}")
+    problems = validate_content(data)
+    if problems:
+        raise ValueError("Invalid content: " + "; ".join(problems))
+    return data
+
+
+def write_snapshot(
+        data: dict,
+        key: bytes,
+        path: str
+        ) -> None:
+    """
+    Write compiled content to a snapshot file.
+
+    The file is written next to its final location and renamed into place
+    so a concurrent reader never sees a half written snapshot.
+
+    Args:
+        data (dict): The compiled content.
+        key (bytes): The content key the snapshot belongs to.
+        path (str): Where to write the snapshot.
+
+    Returns:
+        None
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(SNAPSHOT_VERSION.to_bytes(2, 'big'))
+        f.write(key)
+        f.write(marshal.dumps(data))
+    os.replace(temp_path, path)
+
+
+def read_snapshot(key: bytes, path: str) -> dict:
+    """
+    Read a snapshot file if it matches the given content key.
+
+    Args:
+        key (bytes): The key of the current content.
+        path (str): The snapshot file to read.
+
+    Returns:
+        dict: The compiled content, or None if the snapshot is missing,
+        corrupt or stale.
+    """
+    try:
+        with open(path, 'rb') as f:
+            blob = f.read()
+    except OSError:
+        return None
+    header = SNAPSHOT_MAGIC + SNAPSHOT_VERSION.to_bytes(2, 'big') + key
+    if not key or not blob.startswith(header):
+        return None
+    try:
+        data = marshal.loads(blob[len(header):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def build_snapshot(base_dir: str = CONTENT_DIR, path: str = None) -> str:
+    """
+    Compile the content of a directory into a snapshot file.
+
+    Args:
+        base_dir (str, optional): The directory holding the content files.
+        path (str, optional): Where to write the snapshot
+        (default is the directory's cache location).
+
+    Returns:
+        str: The path of the written snapshot.
+
+    Raises:
+        ValueError: If the content fails to parse or validate.
+    """
+    path = path or snapshot_path(base_dir)
+    key = content_key(base_dir)
+    write_snapshot(compile_content(base_dir), key, path)
+    return path
+
+
+def load_content(base_dir: str = CONTENT_DIR) -> dict:
+    """
+    Load the compiled content of a directory in a single read.
+
+    A missing or stale snapshot is rebuilt from the JSON sources. If the
+    sources are invalid nothing is returned and callers fall back to
+    reading the JSON files directly.
+
+    Args:
+        base_dir (str, optional): The directory holding the content files.
+
+    Returns:
+        dict: The compiled content, or an empty dictionary if it could
+        not be compiled.
+    """
+    path = snapshot_path(base_dir)
+    key = content_key(base_dir)
+    data = read_snapshot(key, path)
+    if data is not None:
+        return data
+
+    try:
+        data = compile_content(base_dir)
+    except ValueError as e:
+        print(e)
+        return {}
+    try:
+        write_snapshot(data, key, path)
+    except OSError:
+        pass  # A read-only install simply runs without a cache
+    return data
+
+
+if __name__ == "__main__":
+    print(f"Content snapshot written to {build_snapshot()}")
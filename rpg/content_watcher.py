@@ -0,0 +1,105 @@
+import threading
+from .content import ContentRegistry, get_registry, set_registry
+from .content_snapshot import (
+    CONTENT_DIR, compile_content, content_key, snapshot_path, write_snapshot
+)
+
+
+class ContentWatcher:
+    def __init__(self, base_dir: str = CONTENT_DIR, interval: float = 1.0):
+        """
+        Initialize a watcher that hot-reloads the game content.
+
+        The watcher polls the stamps of the content files from a background
+        thread. When they change, the new content is validated, compiled
+        and fully indexed on that thread before it replaces the shared
+        registry, so the game loop never waits for a reload. Running
+        sessions keep the registry they hold until they choose to switch.
+
+        Args:
+            base_dir (str, optional): The directory holding the content
+            files (default is the rpg package directory).
+            interval (float, optional): Seconds between two checks
+            (default is 1.0).
+
+        Returns:
+            None
+        """
+        self.base_dir = base_dir
+        self.interval = interval
+        self._key = content_key(base_dir)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        """
+        Start watching in a background thread.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="content-watcher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def check(self) -> bool:
+        """
+        Reload the content if a content file changed since the last check.
+
+        Invalid content is reported and skipped; the current registry stays
+        in place until the files are fixed.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if a new registry was swapped in.
+        """
+        key = content_key(self.base_dir)
+        if not key or key == self._key:
+            return False
+        # Remember the key even if the content is invalid, so a broken
+        # edit is reported once rather than on every check
+        self._key = key
+
+        try:
+            data = compile_content(self.base_dir)
+        except ValueError as e:
+            print(f"Content reload skipped: {e}")
+            return False
+
+        registry = ContentRegistry.from_data(
+            data, self.base_dir, get_registry().version + 1
+        )
+        registry.warm()
+        try:
+            write_snapshot(data, key, snapshot_path(self.base_dir))
+        except OSError:
+            pass  # The cache is only an optimisation
+        set_registry(registry)
+        return True
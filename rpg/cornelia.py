@@ -1,5 +1,6 @@
 import random
-from .items import Item
+from .items import Item, item_template_id
+from .content import get_registry
 
 
 class Cornelia:
@@ -91,7 +92,7 @@ class Cornelia:
             print("     Mermade Cornelia: 'Now, go away from me!'")
             return
         else:
-            epic_item = self.get_random_epic_item()
+            epic_item = self.get_random_epic_item(player.content)
             player.inventory.append(epic_item)
             print(
                 "\n Mermade Cornelia: 'Congratulations!"
@@ -100,43 +101,23 @@ class Cornelia:
                 )
             self.played = True
 
-    def get_random_epic_item(self) -> Item:
+    def get_random_epic_item(self, content=None) -> Item:
         """
         Return a random epic item as an instance of the Item class.
 
         Args:
-            None
+            content (ContentRegistry, optional): The content the rewards
+            come from, with its content packs. Defaults to None, which uses
+            the current base content.
 
         Returns:
             Item:
             An epic item with attributes such as name,
             rarity, effect type, and value.
         """
-        epic_items_data = [
-            {
-                "name": "Epic Sword",
-                "description": "A sword of epic proportions.",
-                "effect_type": "damage",
-                "value": 20,
-                "price": 0
-                },
-            {
-                "name": "Epic Axe",
-                "description": "An axe with unstoppable power.",
-                "effect_type": "damage",
-                "value": 15,
-                "price": 0
-            },
-            {
-                "name": "Epic Bow",
-                "description": "A bow that shoots arrows with great precision",
-                "effect_type": "damage",
-                "value": 18,
-                "price": 0
-            }
-
-        ]
-        selected_item_data = random.choice(epic_items_data)
+        if content is None:
+            content = get_registry()
+        selected_item_data = random.choice(content.epic_rewards)
 
         return Item(
             name=selected_item_data['name'],
@@ -144,5 +125,8 @@ class Cornelia:
             effect_type=selected_item_data['effect_type'],
             value=selected_item_data['value'],
             description=selected_item_data['description'],
-            price=selected_item_data['price']
+            price=selected_item_data['price'],
+            template_id=item_template_id(
+                'epic_rewards', selected_item_data['name']
+            )
         )
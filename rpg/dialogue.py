@@ -0,0 +1,108 @@
+class DialogueGraph:
+    """
+    An NPC's dialogues compiled into immutable node and edge tables.
+
+    Node `n` is a prompt the NPC can open with. Its options are the edges
+    `option_offsets[n]` up to `option_offsets[n + 1]` of the flat option
+    tables, so any option is found with two index lookups.
+    """
+    __slots__ = ('prompts', 'option_offsets', 'option_texts',
+                 'option_responses')
+
+    def __init__(
+            self,
+            prompts: tuple,
+            option_offsets: tuple,
+            option_texts: tuple,
+            option_responses: tuple
+            ) -> None:
+        """
+        Initialize a DialogueGraph from its tables.
+
+        Args:
+            prompts (tuple): The prompt of every node.
+            option_offsets (tuple): Where the options of every node start,
+            followed by the total number of options.
+            option_texts (tuple): The text of every option.
+            option_responses (tuple): The possible answers to every option.
+
+        Returns:
+            None
+        """
+        object.__setattr__(self, 'prompts', prompts)
+        object.__setattr__(self, 'option_offsets', option_offsets)
+        object.__setattr__(self, 'option_texts', option_texts)
+        object.__setattr__(self, 'option_responses', option_responses)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("Dialogue graphs are immutable")
+
+    def __len__(self) -> int:
+        return len(self.prompts)
+
+    @classmethod
+    def compile(cls, dialogues: dict) -> 'DialogueGraph':
+        """
+        Compile dialogues in the JSON layout into a DialogueGraph.
+
+        Args:
+            dialogues (dict): A dictionary mapping every prompt to its
+            'options', which map a player response to the NPC's answers.
+
+        Returns:
+            DialogueGraph: The compiled dialogues.
+        """
+        prompts = []
+        option_offsets = [0]
+        option_texts = []
+        option_responses = []
+        for prompt, node in dialogues.items():
+            prompts.append(prompt)
+            for text, responses in node.get('options', {}).items():
+                option_texts.append(text)
+                option_responses.append(tuple(responses))
+            option_offsets.append(len(option_texts))
+        return cls(tuple(prompts), tuple(option_offsets),
+                   tuple(option_texts), tuple(option_responses))
+
+    def option_count(self, node: int) -> int:
+        """
+        Return how many options a node has.
+
+        Args:
+            node (int): The index of the node.
+
+        Returns:
+            int: The number of options.
+        """
+        return self.option_offsets[node + 1] - self.option_offsets[node]
+
+    def option_text(self, node: int, index: int) -> str:
+        """
+        Return the text of one option of a node.
+
+        Args:
+            node (int): The index of the node.
+            index (int): The index of the option within the node.
+
+        Returns:
+            str: The option's text.
+        """
+        return self.option_texts[self.option_offsets[node] + index]
+
+    def responses(self, node: int, index: int) -> tuple:
+        """
+        Return the NPC's possible answers to one option of a node.
+
+        Args:
+            node (int): The index of the node.
+            index (int): The index of the option within the node.
+
+        Returns:
+            tuple: The answers.
+        """
+        return self.option_responses[self.option_offsets[node] + index]
+
+
+# Shared by every NPC created without dialogues
+NO_DIALOGUE = DialogueGraph((), (0,), (), ())
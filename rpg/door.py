@@ -16,7 +16,8 @@ class door(Inspectable, Interactable):
         Args:
             name (str): The name of the door.
             description (str): A brief description of the door.
-            destination: The destination room the door leads to (default: None)
+            destination: The destination room the door leads to, or a stub
+            of it that is built on first use (default: None)
             locked (bool): Whether the door is locked or not (default: False).
 
         Returns:
@@ -27,6 +28,30 @@ class door(Inspectable, Interactable):
         self.destination = destination
         self.locked = locked
 
+    @property
+    def destination(self):
+        """
+        The room the door leads to, built from its stub the first time it
+        is needed. A link to a room of a world is looked up in the world
+        on every use instead, so the door does not keep the room alive.
+        """
+        if hasattr(self._destination, 'resolve'):
+            return self._destination.resolve()
+        if hasattr(self._destination, 'materialize'):
+            self._destination = self._destination.materialize()
+        return self._destination
+
+    @destination.setter
+    def destination(self, destination) -> None:
+        self._destination = destination
+
+    @property
+    def explored(self) -> bool:
+        """
+        bool: Whether the room behind the door has been built.
+        """
+        return getattr(self._destination, 'explored', True)
+
     def interact(self, player) -> None:
         """
         Interact with the door, allowing the player
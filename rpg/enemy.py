@@ -1,5 +1,4 @@
-import json
-import os
+import random
 from .base_model import Interactable, Inspectable
 
 
@@ -80,33 +79,125 @@ class Enemy(Inspectable, Interactable):
             return True
         return False
 
+    @classmethod
+    def from_dict(cls, monster_dict: dict) -> 'Enemy':
+        """
+        Create an Enemy object from a dictionary.
+
+        Args:
+            monster_dict (dict): A dictionary containing the enemy's
+            attributes.
+
+        Returns:
+            Enemy: A fresh instance of the Enemy class.
+        """
+        return cls(
+            monster_dict['name'],
+            monster_dict['description'],
+            monster_dict['health'],
+            monster_dict['damage'],
+            monster_dict['difficulty']
+        )
+
     @classmethod
     def load_monsters(cls) -> list:
         """
-        Load monsters from a JSON file and return a list of Enemy instances.
+        Build every monster of the current game content.
+
+        Args:
+            None
+
+        Returns:
+            list: A list of new Enemy objects.
+        """
+        # Imported here because the content registry builds on this module
+        from .content import get_registry
+        return [cls.from_dict(monster) for monster in get_registry().monsters]
+
+
+class MonsterCatalog:
+    def __init__(self, monsters: list) -> None:
+        """
+        Index monster templates by name and difficulty.
 
         Args:
+            monsters (list): Dictionaries describing every monster.
+
+        Returns:
             None
+        """
+        self.monsters = tuple(monsters)
+        self.by_name = {monster['name']: monster for monster in self.monsters}
+        by_difficulty = {}
+        for monster in self.monsters:
+            by_difficulty.setdefault(monster['difficulty'], []).append(monster)
+        self.by_difficulty = {
+            difficulty: tuple(group)
+            for difficulty, group in by_difficulty.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.monsters)
+
+    def get(self, name: str) -> dict:
+        """
+        Look up a monster template by name.
+
+        Args:
+            name (str): The name of the monster.
+
+        Returns:
+            dict: The monster template, or None if there is no such monster.
+        """
+        return self.by_name.get(name)
+
+    def with_difficulty(self, difficulty: str) -> tuple:
+        """
+        Return every monster template of a difficulty.
+
+        Args:
+            difficulty (str): The difficulty level.
 
         Returns:
-            list: A list of Enemy objects loaded from the JSON file.
-        """
-        base_dir = os.path.dirname(__file__)
-        monsters_file = os.path.join(base_dir, 'monsters.json')
-
-        try:
-            with open(monsters_file, 'r') as f:
-                monster_data = json.load(f)
-                return [
-                    cls(
-                        monster['name'],
-                        monster['description'],
-                        monster['health'],
-                        monster['damage'],
-                        monster['difficulty']
-                    ) for monster in monster_data['monsters']
-                ]
-
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading monsters: {e}")
+            tuple: The matching monster templates.
+        """
+        return self.by_difficulty.get(difficulty, ())
+
+    def sample_undefeated(self, count: int, defeated, rng=random) -> list:
+        """
+        Pick distinct monster templates the player has not defeated yet.
+
+        Random positions are drawn and rejected when already taken or
+        defeated, which needs about `count` draws while most of the catalog
+        is undefeated, whatever its size. If too many draws are rejected,
+        the remaining monsters are listed and sampled instead.
+
+        Args:
+            count (int): The number of monsters wanted.
+            defeated: A set-like container of defeated monster names.
+            rng (optional): The random number source
+            (default is the random module).
+
+        Returns:
+            list: Up to `count` monster templates.
+        """
+        total = len(self.monsters)
+        if total == 0 or count <= 0:
             return []
+
+        chosen = {}
+        attempts = 4 * count + 8
+        while len(chosen) < count and attempts > 0:
+            attempts -= 1
+            index = rng.randrange(total)
+            if (index not in chosen
+                    and self.monsters[index]['name'] not in defeated):
+                chosen[index] = self.monsters[index]
+        if len(chosen) == count:
+            return list(chosen.values())
+
+        remaining = [
+            monster for monster in self.monsters
+            if monster['name'] not in defeated
+        ]
+        return rng.sample(remaining, min(count, len(remaining)))
@@ -3,6 +3,14 @@
 from rpg.enemy import Enemy
 import random
 from rpg.vision_handler import reveal_truth
+from rpg.combat import (
+    ATTACK, DEFEND, HEAL, ITEM, PASS, BOSS_RULES, CombatState, resolve,
+    Attacked, Braced, Healed, HealRefused, EnemyAttacked, EnemyDefeated,
+    PlayerDefeated
+)
+
+# Final combat menu choices; running away is not possible
+BOSS_ACTIONS = {'0': ATTACK, '1': DEFEND, '2': HEAL, '3': ITEM}
 
 
 class FinalBoss:
@@ -89,59 +97,63 @@ can be used once every 3 actions."
             )
 
             choice = input("Select an action by number: ")
+            action = BOSS_ACTIONS.get(choice, PASS)
+
+            if action == ITEM:
+                if not self.player.show_inventory_and_use_item():
+                    action = PASS
+            elif choice == '4':  # Run Away
+                print("\nThere is no escape from the final battle!")
+            elif action == PASS:
+                print("Invalid choice. Please select a valid action.")
 
-            if choice == '0':
-                damage_dealt = self.player.damage
+            state, events = resolve(CombatState(
+                self.player.health, self.player.damage,
+                self.player.action_count, self.final_boss.health,
+                self.final_boss.damage, self.defend_active
+            ), action, BOSS_RULES)
+            self.player.health = state.health
+            self.player.action_count = state.action_count
+            self.final_boss.health = state.enemy_health
+            self.defend_active = state.defending
+            self.show_events(events)
+
+            if state.outcome is not None:
+                break
+
+    def show_events(self, events: list) -> None:
+        """
+        Print what happened in a turn of the final combat.
+
+        Args:
+            events (list): The events of the turn.
+
+        Returns:
+            None
+        """
+        for event in events:
+            if isinstance(event, Attacked):
                 print(
                     f"\nYou attack {self.final_boss.name} for\
- {damage_dealt} damage"
+ {event.damage} damage"
                 )
-                self.final_boss.health -= damage_dealt
-                self.player.action_count += 1
-                if self.final_boss.health <= 0:
-                    print(f"  You defeated the {self.final_boss.name}!")
-                    reveal_truth()  # Reveal the final truth here
-                    break
-
-            elif choice == '1':
+            elif isinstance(event, EnemyDefeated):
+                print(f"  You defeated the {self.final_boss.name}!")
+                reveal_truth()  # Reveal the final truth here
+            elif isinstance(event, Braced):
                 print("You brace yourself for the next attack. \
 Your defense will reduce the damage taken.")
-                self.defend_active = True
-                self.player.action_count += 1
-
-            elif choice == '2':
-                if self.player.action_count >= 3:
-                    heal_amount = random.randint(10, 30)
-                    self.player.health = min(
-                        self.player.health + heal_amount, 100
-                    )
-                    print(f"\nYou heal yourself for {heal_amount} health! \
-Your current health is now {self.player.health}.")
-                    self.player.action_count = 0
-                else:
-                    print("\nYou cannot heal again in this combat!")
-
-            elif choice == '3':
-                if self.player.show_inventory_and_use_item():
-                    continue
-
-            elif choice == '4':  # Run Away
-                print("\nThere is no escape from the final battle!")
-            else:
-                print("Invalid choice. Please select a valid action.")
-
-            # Enemy's turn to attack if still alive
-            if self.final_boss.health > 0:
-                final_boss_damage = random.randint(20, 40)
-                if self.defend_active:
-                    final_boss_damage = max(final_boss_damage // 2, 0)
-                    self.defend_active = False  # Reset defend status
+            elif isinstance(event, Healed):
+                print(f"\nYou heal yourself for {event.amount} health! \
+Your current health is now {event.health}.")
+            elif isinstance(event, HealRefused):
+                print("\nYou cannot heal again in this combat!")
+            elif isinstance(event, EnemyAttacked):
+                if event.defended:
                     print(f"\n{self.final_boss.name} attacks you, \
-but you defend! You take {final_boss_damage} damage.")
+but you defend! You take {event.damage} damage.")
                 else:
                     print(f"\n{self.final_boss.name} attacks \
-you for {final_boss_damage} damage!")
-                self.player.health -= final_boss_damage
-                if self.player.health <= 0:
-                    print("You have fallen in battle...")
-                    break
+you for {event.damage} damage!")
+            elif isinstance(event, PlayerDefeated):
+                print("You have fallen in battle...")
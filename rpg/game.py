@@ -1,33 +1,62 @@
 import random  # Import the random module
 from rpg.player import player
-from rpg.room import room
 from rpg.io_utils import Scanner
 from rpg.starting_room import StartingRoom
-from rpg.enemy import Enemy
 from rpg.cornelia import Cornelia
-from rpg.npc import Trader
 from rpg.game_save import save_game, load_game
 from rpg.final_boss import FinalBoss
 from rpg.vision_handler import show_next_vision
+from rpg.content import get_registry
+from rpg.content_watcher import ContentWatcher
+from rpg.world import World, START_ROOM_ID
+from rpg.pregenerator import Pregenerator
 
 
 class Game:
-    def __init__(self) -> None:
+    def __init__(
+            self,
+            watch_content: bool = False,
+            content_packs: list = (),
+            room_cache_size: int = None,
+            pregenerate: bool = False
+            ) -> None:
         """
         Initialize the Game object with an empty room list, the starting room,
         and player instance.
+
+        The game content is loaded up front from the compiled content
+        snapshot in a single read.
+
+        Args:
+            watch_content (bool, optional): Whether to hot-reload the game
+            content when its files change (default is False).
+            content_packs (list, optional): Directories of content packs
+            laid over the base content, the last one taking precedence
+            (default is no packs).
+            room_cache_size (int, optional): The most rooms kept in memory,
+            the others are paged out to disk (default is no limit).
+            pregenerate (bool, optional): Whether to build the rooms behind
+            the doors of the player's room in the background while the
+            game waits for a command (default is False).
         """
+        self.content_packs = list(content_packs)
+        self.base_content = get_registry()
+        content = self.base_content.with_packs(self.content_packs)
+        self.content = content
+        self.content_watcher = ContentWatcher() if watch_content else None
+        self.world = World(content=content, cache_size=room_cache_size)
+        self.pregenerator = Pregenerator(self.world) if pregenerate else None
         self.rooms = []
-        self.current_room = room(name="Starting room")
+        self.current_room = self.world.room(START_ROOM_ID)
         self.rooms.append(self.current_room)
         self.current_room.add_doors(self.rooms)
-        self.player_instance = player(starting_room=self.current_room)
+        self.player_instance = player(
+            starting_room=self.current_room, content=content
+        )
         self.scanner = Scanner()
         self.visited_rooms = set()
-        self.monsters = Enemy.load_monsters()
         self.boss_fight_done = False
         self.played = False
-        self.current_room.traders = Trader.load_traders()
         self.vision_index = 0
 
     def run(self) -> None:
@@ -37,7 +66,8 @@ class Game:
         starting_room = StartingRoom()
         player_name = starting_room.run()
         self.player_instance = player(
-            starting_room=self.current_room, name=player_name
+            starting_room=self.current_room, name=player_name,
+            content=self.content
         )
 
         print("\nYou step inside the room and the door closes behind you."
@@ -48,8 +78,16 @@ class Game:
         user_input = None
         game_end = random.randint(20, 25)
 
+        if self.content_watcher is not None:
+            self.content_watcher.start()
+        if self.pregenerator is not None:
+            self.pregenerator.start()
+
         try:
             while True:
+                # Between two commands nothing holds on to old content
+                self.refresh_content()
+
                 if (len(self.player_instance.visited_rooms) == 8
                         and not self.played):
                     cornelia = Cornelia()
@@ -66,6 +104,12 @@ class Game:
                     print("Exiting game...")
                     break
 
+                if self.pregenerator is not None:
+                    # Build the next rooms while the player decides
+                    self.pregenerator.schedule(
+                        self.player_instance.current_room.room_id
+                    )
+
                 print(question)
                 self.scanner.options()
                 user_input = self.scanner.read_int()
@@ -103,9 +147,31 @@ class Game:
                     else:
                         print("Invalid input. Please choose 1 for Save or 2 "
                               "for Load.")
+                elif user_input == 9:  # Fast travel
+                    self.player_instance.fast_travel()
                 elif user_input == -1:
                     print("Exiting game...")
                     break  # Exit the game
 
         except ValueError as e:
             print(e)
+        finally:
+            if self.content_watcher is not None:
+                self.content_watcher.stop()
+            if self.pregenerator is not None:
+                self.pregenerator.stop()
+
+    def refresh_content(self) -> None:
+        """
+        Move the game to the latest content version, if it changed.
+
+        Rooms that already exist keep the content they were built from;
+        rooms, loot and fights from now on use the new version, with the
+        game's content packs laid over it again.
+        """
+        latest = get_registry()
+        if latest is not self.base_content:
+            self.base_content = latest
+            self.content = latest.with_packs(self.content_packs)
+            self.player_instance.pinned_content = self.content
+            self.world.content = self.content
@@ -1,6 +1,12 @@
 import json
 import os
 from rpg.items import Item
+from rpg.travel import TravelIndex
+
+
+def _world_of(player_instance):
+    current_room = getattr(player_instance, 'current_room', None)
+    return getattr(current_room, 'world', None)
 
 
 def save_game(player_instance, filename: str = "game_save.json") -> None:
@@ -33,9 +39,21 @@ def save_game(player_instance, filename: str = "game_save.json") -> None:
         "action_count": player_instance.action_count,
         "defeated_enemy": player_instance.defeated_enemy,
         "inventory": inventory_data,
-        "coins": player_instance.coins
+        "coins": player_instance.coins,
+        # JSON keys are strings, so the room ids are saved as a list
+        "fought_in_room": [
+            key for key, fought in player_instance.fought_in_room.items()
+            if fought
+        ],
+        "explored": player_instance.explored.to_list()
     }
 
+    # Room ids only mean something in the world they were handed out by
+    world = _world_of(player_instance)
+    if world is not None:
+        game_data["world"] = world.to_dict()
+        game_data["room_id"] = player_instance.current_room.room_id
+
     all_game_data[player_instance.name] = game_data
 
     # Write the updated data back to the JSON file
@@ -72,9 +90,16 @@ def load_game(
 
         game_data = all_game_data[player_name]
 
-        player_instance.inventory = [
-            Item.from_dict(item) for item in game_data["inventory"]
-            ]
+        # Items of content packs are only known to the player's content
+        inventory = []
+        for item in game_data["inventory"]:
+            try:
+                inventory.append(
+                    Item.from_dict(item, content=player_instance.content)
+                )
+            except ValueError as e:
+                print(f"Skipping saved item: {e}")
+        player_instance.inventory = inventory
         player_instance.name = game_data["name"]
         player_instance.health = game_data["health"]
         player_instance.damage = game_data["damage"]
@@ -83,6 +108,17 @@ def load_game(
         player_instance.action_count = game_data["action_count"]
         player_instance.defeated_enemy = game_data["defeated_enemy"]
         player_instance.coins = game_data["coins"]
+        player_instance.fought_in_room = dict.fromkeys(
+            game_data.get("fought_in_room", []), True
+        )
+        if "explored" in game_data:
+            player_instance.explored = TravelIndex.from_list(
+                game_data["explored"]
+            )
+        world = _world_of(player_instance)
+        if world is not None and "world" in game_data:
+            world.restore(game_data["world"])
+            player_instance.current_room = world.room(game_data["room_id"])
 
         print(f"Game for player {player_name} loaded successfully!")
     except FileNotFoundError:
@@ -31,6 +31,7 @@ class Scanner:
         print("     (6) Look for items")
         print("     (7) Interact with trader")
         print("     (8) Save/Load the game")
+        print("     (9) Travel to an explored room")
 
     def read_int(self) -> int:
         """
@@ -49,7 +50,7 @@ class Scanner:
             if user_input.strip() == "-1":
                 print("You chose to quit the game")
                 return -1
-            if user_input.isdigit() and 8 >= int(user_input) >= 0:
+            if user_input.isdigit() and 9 >= int(user_input) >= 0:
                 return int(user_input)
             else:
                 print("Invalid input: Please enter a positive whole number.")
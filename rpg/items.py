@@ -1,15 +1,122 @@
-import json
-import os
+import weakref
+
+ITEM_FIELDS = ('name', 'rarity', 'effect_type', 'value', 'description',
+               'price')
+TEMPLATE_FIELDS = ITEM_FIELDS + ('template_id',)
+
+
+def item_template_id(*path: str) -> str:
+    """
+    Build the id of an item template defined by the game content.
+
+    Args:
+        *path (str): Where the item is defined, for example the content
+        section followed by the item name.
+
+    Returns:
+        str: The template id.
+    """
+    return "/".join(path)
+
+
+class ItemTemplate:
+    """
+    The shared, immutable data of an item.
+
+    Templates are interned: asking for the same data twice returns the
+    same object, so every copy of an item in every inventory points at a
+    single template. The interning table only holds weak references, so a
+    template is dropped once no item and no content version uses it.
+    """
+    __slots__ = TEMPLATE_FIELDS + ('__weakref__',)
+
+    _interned = weakref.WeakValueDictionary()
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("Item templates are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Item templates are immutable")
+
+    def __repr__(self) -> str:
+        return f"ItemTemplate({self.template_id or self.name!r})"
+
+    @classmethod
+    def intern(
+            cls,
+            name: str,
+            rarity: str,
+            effect_type: str,
+            value: int,
+            description: str,
+            price: int,
+            template_id: str = None
+            ) -> 'ItemTemplate':
+        """
+        Return the shared template holding the given item data.
+
+        Args:
+            name (str): The name of the item.
+            rarity (str): The rarity level of the item.
+            effect_type (str):
+            The type of effect the item has ('health' or 'damage').
+            value (int): The value of the item's effect.
+            description (str): A brief description of the item.
+            price (int): The price of the item in the game's currency.
+            template_id (str, optional): The id of the template in the game
+            content, None for items created outside of it.
+
+        Returns:
+            ItemTemplate: The interned template.
+        """
+        key = (name, rarity, effect_type, value, description, price,
+               template_id)
+        template = cls._interned.get(key)
+        if template is None:
+            template = object.__new__(cls)
+            for field, field_value in zip(TEMPLATE_FIELDS, key):
+                object.__setattr__(template, field, field_value)
+            cls._interned[key] = template
+        return template
+
+    @classmethod
+    def lookup(cls, template_id: str, content=None) -> 'ItemTemplate':
+        """
+        Find the template with the given id in the game content.
+
+        Args:
+            template_id (str): The id of the template.
+            content (ContentRegistry, optional): The content to look in,
+            with its content packs. Defaults to None, which uses the
+            current base content.
+
+        Returns:
+            ItemTemplate: The template.
+
+        Raises:
+            ValueError: If the game content defines no such template.
+        """
+        # Imported here because the content registry builds on Item
+        from .content import get_registry
+        if content is None:
+            content = get_registry()
+        template = content.item_templates.get(template_id)
+        if template is None:
+            raise ValueError(f"Unknown item: {template_id}")
+        return template
 
 
 class Item:
+    __slots__ = ('template',)
+
     def __init__(
             self,
             name: str,
             rarity: str, effect_type: str,
             value: int,
             description: str,
-            price: int
+            price: int,
+            template_id: str = None
             ) -> None:
         """
         Initialize an Item object.
@@ -22,27 +129,71 @@ class Item:
             value (int): The value of the item's effect.
             description (str): A brief description of the item.
             price (int): The price of the item in the game's currency.
+            template_id (str, optional): The id of the item in the game
+            content (default is None).
 
         Returns:
             None
         """
-        self.name = name
-        self.rarity = rarity
-        self.effect_type = effect_type  # 'health' or 'damage'
-        self.value = value
-        self.description = description
-        self.price = price
+        self.template = ItemTemplate.intern(
+            name, rarity, effect_type, value, description, price,
+            template_id
+        )
+
+    @classmethod
+    def from_template(cls, template: ItemTemplate) -> 'Item':
+        """
+        Create an Item referencing an existing template.
+
+        Args:
+            template (ItemTemplate): The template holding the item's data.
+
+        Returns:
+            Item: A new handle to the template.
+        """
+        item = cls.__new__(cls)
+        item.template = template
+        return item
+
+    @property
+    def name(self) -> str:
+        return self.template.name
+
+    @property
+    def rarity(self) -> str:
+        return self.template.rarity
+
+    @property
+    def effect_type(self) -> str:
+        return self.template.effect_type  # 'health' or 'damage'
+
+    @property
+    def value(self) -> int:
+        return self.template.value
+
+    @property
+    def description(self) -> str:
+        return self.template.description
+
+    @property
+    def price(self) -> int:
+        return self.template.price
 
     def to_dict(self) -> dict:
         """
         Convert the item object into a dictionary representation.
 
+        Items from the game content are stored by template id only, other
+        items with all their attributes.
+
         Args:
             None
 
         Returns:
-            dict: A dictionary containing the item's attributes.
+            dict: A dictionary identifying the item.
         """
+        if self.template.template_id is not None:
+            return {'id': self.template.template_id}
         return {
             'name': self.name,
             'rarity': self.rarity,
@@ -53,52 +204,56 @@ class Item:
         }
 
     @classmethod
-    def from_dict(cls, item_dict: dict) -> 'Item':
+    def from_dict(
+            cls,
+            item_dict: dict,
+            template_id: str = None,
+            content=None
+            ) -> 'Item':
         """
         Create an Item object from a dictionary.
 
         Args:
-            item_dict (dict): A dictionary containing the item's attributes.
+            item_dict (dict): A dictionary containing either the item's
+            template id or all of its attributes.
+            template_id (str, optional): The id of the item in the game
+            content, when the dictionary comes from it (default is None).
+            content (ContentRegistry, optional): The content template ids
+            are looked up in. Defaults to None, which uses the current base
+            content.
 
         Returns:
             Item: An instance of the Item class created from the dictionary.
+
+        Raises:
+            ValueError: If the template id is unknown.
         """
-        return cls(
+        if 'id' in item_dict:
+            return cls.from_template(
+                ItemTemplate.lookup(item_dict['id'], content)
+            )
+        return cls.from_template(ItemTemplate.intern(
             item_dict['name'],
             item_dict['rarity'],
             item_dict['effect_type'],
             item_dict['value'],
             item_dict['description'],
-            item_dict['price']
-        )
+            item_dict['price'],
+            template_id
+        ))
 
     @classmethod
     def load_items(cls) -> list:
         """
-        Load items from a JSON file and return a list of Item instances.
+        Return the loot items of the current game content.
 
         Args:
             None
 
         Returns:
-            list: A list of Item objects loaded from the JSON file.
+            list: New Item handles to the content's item templates.
         """
-        base_dir = os.path.dirname(__file__)
-        items_file = os.path.join(base_dir, 'items.json')
-
-        try:
-            with open(items_file, 'r') as f:
-                item_data = json.load(f)
-                return [
-                    cls(
-                        item['name'],
-                        item['rarity'],
-                        item['effect_type'],
-                        item['value'],
-                        item["description"],
-                        item["price"]
-                        ) for item in item_data['items']
-                    ]
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading items: {e}")
-            return []
+        # Imported here because the content registry builds on Item
+        from .content import get_registry
+        return [cls.from_template(item.template)
+                for item in get_registry().items]
@@ -0,0 +1,117 @@
+import random
+
+# Chance of each rarity being rolled when the player looks for items
+RARITY_WEIGHTS = {
+    'common': 0.5,
+    'rare': 0.3,
+    'super rare': 0.15,
+    'epic': 0.04,
+    'legendary': 0.01,
+}
+
+
+class LootTable:
+    def __init__(self, items: list, weights: dict = RARITY_WEIGHTS) -> None:
+        """
+        Precompile a loot table from an item catalog.
+
+        Items are grouped into one bucket per rarity and the rarity weights
+        are turned into an alias table (Vose's method), so every draw costs
+        a single random number and two list lookups, whatever the size of
+        the catalog.
+
+        Args:
+            items (list): The items that can be found.
+            weights (dict, optional): The chance of rolling each rarity
+            (default is RARITY_WEIGHTS).
+
+        Returns:
+            None
+        """
+        self.rarities = tuple(weights)
+        self.buckets = tuple(
+            tuple(item for item in items if item.rarity == rarity)
+            for rarity in self.rarities
+        )
+        self.probability, self.alias = self._build_alias(
+            [weights[rarity] for rarity in self.rarities]
+        )
+
+    @staticmethod
+    def _build_alias(weights: list) -> tuple:
+        """
+        Build the probability and alias columns of an alias table.
+
+        Args:
+            weights (list): The relative weight of every outcome.
+
+        Returns:
+            tuple: The probability column and the alias column.
+        """
+        count = len(weights)
+        total = sum(weights)
+        scaled = [weight * count / total for weight in weights]
+        probability = [1.0] * count
+        alias = list(range(count))
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # Whatever is left over only differs from 1 by rounding errors
+        return tuple(probability), tuple(alias)
+
+    def roll_rarity(self, rng=random) -> int:
+        """
+        Roll a rarity with the table's weights.
+
+        Args:
+            rng (optional): The random number source
+            (default is the random module).
+
+        Returns:
+            int: The index of the rolled rarity.
+        """
+        position = rng.random() * len(self.probability)
+        column = int(position)
+        if position - column < self.probability[column]:
+            return column
+        return self.alias[column]
+
+    def draw(self, rng=random):
+        """
+        Draw one item from the table.
+
+        Args:
+            rng (optional): The random number source
+            (default is the random module).
+
+        Returns:
+            The drawn item, or None if the rolled rarity has no items.
+        """
+        bucket = self.buckets[self.roll_rarity(rng)]
+        if not bucket:
+            return None
+        return bucket[int(rng.random() * len(bucket))]
+
+    def draw_many(self, count: int, rng=random) -> list:
+        """
+        Draw several items at once, for simulations.
+
+        Args:
+            count (int): The number of rolls.
+            rng (optional): The random number source
+            (default is the random module).
+
+        Returns:
+            list: The result of every roll, None where nothing was found.
+        """
+        draw = self.draw
+        return [draw(rng) for _ in range(count)]
@@ -1,7 +1,7 @@
 from .base_model import Interactable, Inspectable
-import json
-import os
-from .items import Item
+from .items import Item, item_template_id
+from .content import get_registry
+from .dialogue import DialogueGraph, NO_DIALOGUE
 
 
 class npc(Interactable, Inspectable):
@@ -9,7 +9,7 @@ class npc(Interactable, Inspectable):
             self,
             name: str,
             description: str,
-            dialogues: dict = None
+            dialogues=None
             ) -> None:
         """
         Initialize an NPC object.
@@ -17,15 +17,20 @@ class npc(Interactable, Inspectable):
         Args:
             name (str): The name of the NPC.
             description (str): A brief description of the NPC.
-            dialogues (dict, optional): A dictionary of dialogues
-            the NPC can have (default is None).
+            dialogues (DialogueGraph or dict, optional): The dialogues the
+            NPC can have, either compiled or as a dictionary to compile
+            (default is None).
 
         Returns:
             None
         """
         self.name = name
         self.description = description
-        self.dialogues = dialogues if dialogues is not None else {}
+        if not dialogues:
+            dialogues = NO_DIALOGUE
+        elif not isinstance(dialogues, DialogueGraph):
+            dialogues = DialogueGraph.compile(dialogues)
+        self.dialogues = dialogues
 
     def interact(self, player) -> None:
         """
@@ -38,14 +43,16 @@ class npc(Interactable, Inspectable):
         Returns:
             None
         """
-        dialogue_keys = list(self.dialogues.keys())
-        selected_dialogue = dialogue_keys[0]
-        print(f"\n{self.name} says: {selected_dialogue}")
+        if not len(self.dialogues):
+            print(f"\n{self.name} has nothing to say.")
+            return
 
-        responses = self.dialogues[selected_dialogue]['options']
+        node = 0
+        print(f"\n{self.name} says: {self.dialogues.prompts[node]}")
 
-        for index, response in enumerate(responses.keys()):
-            print(f"  ({index}) {response}")
+        option_count = self.dialogues.option_count(node)
+        for index in range(option_count):
+            print(f"  ({index}) {self.dialogues.option_text(node, index)}")
 
         response_choice = input(
             "Select a response by number (or -1 to go back): "
@@ -55,13 +62,12 @@ class npc(Interactable, Inspectable):
             print("You have chosen to end the conversation.")
             return
 
-        if response_choice.isdigit():
-            if 0 <= int(response_choice) < len(responses):
-                response_index = int(response_choice)
-                selected_response_key = list(responses.keys())[response_index]
+        if (response_choice.isdigit()
+                and 0 <= int(response_choice) < option_count):
+            responses = self.dialogues.responses(node, int(response_choice))
             print(
                 f"\n{self.name} responds:\
-                {responses[selected_response_key][0]}"
+                {responses[0]}"
                 )
         else:
             print("Invalid choice.")
@@ -81,30 +87,23 @@ class npc(Interactable, Inspectable):
     @classmethod
     def load_npcs(cls) -> list:
         """
-        Load NPCs from a JSON file.
+        Build every NPC of the current game content.
 
         Args:
             None
 
         Returns:
-            list: A list of NPC objects loaded from the JSON file.
+            list: A list of new NPC objects sharing their compiled
+            dialogues.
         """
-        base_dir = os.path.dirname(__file__)
-        npcs_file = os.path.join(base_dir, 'npc_diaologues.json')
-
-        try:
-            with open(npcs_file, 'r') as f:
-                npc_data = json.load(f)
-                return [
-                    cls(
-                        name=npc['name'],
-                        description=npc['description'],
-                        dialogues=npc['dialogues']
-                        ) for npc in npc_data['npcs']
-                    ]
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading NPCs: {e}")
-            return []
+        content = get_registry()
+        return [
+            cls(
+                name=npc_info['name'],
+                description=npc_info['description'],
+                dialogues=content.dialogue_graph(npc_info)
+            ) for npc_info in content.npcs
+        ]
 
 
 class Enemy(npc):
@@ -155,7 +154,7 @@ class Trader(npc):
             self,
             name: str,
             description: str,
-            dialogues: dict = None,
+            dialogues=None,
             items: list = None
             ) -> None:
         """
@@ -164,8 +163,8 @@ class Trader(npc):
         Args:
             name (str): The name of the trader.
             description (str): A brief description of the trader.
-            dialogues (dict, optional):
-            A dictionary of dialogues the trader can have (default is None).
+            dialogues (DialogueGraph or dict, optional):
+            The dialogues the trader can have (default is None).
             items (list, optional):
             A list of items the trader has for sale (default is None).
 
@@ -175,48 +174,52 @@ class Trader(npc):
         super().__init__(name, description, dialogues)
         self.items = items if items is not None else []
 
+    @classmethod
+    def from_dict(
+            cls,
+            trader_dict: dict,
+            dialogues: DialogueGraph = None
+            ) -> 'Trader':
+        """
+        Create a Trader object from a dictionary.
+
+        Args:
+            trader_dict (dict): A dictionary containing the trader's
+            attributes and the items they sell.
+            dialogues (DialogueGraph, optional): Already compiled dialogues
+            to share instead of compiling the dictionary's (default is None).
+
+        Returns:
+            Trader: An instance of the Trader class.
+        """
+        return cls(
+            name=trader_dict['name'],
+            description=trader_dict['description'],
+            dialogues=dialogues or trader_dict.get('dialogues', {}),
+            items=[
+                Item.from_dict(item, item_template_id(
+                    'traders', trader_dict['name'], item['name']
+                ))
+                for item in trader_dict.get('items', [])
+            ]
+        )
+
     @classmethod
     def load_traders(cls) -> list:
         """
-        Load traders from a JSON file and return a list of Trader instances.
+        Build every trader of the current game content.
 
         Args:
             None
 
         Returns:
-            list: A list of Trader objects loaded from the JSON file.
+            list: A list of new Trader objects.
         """
-        base_dir = os.path.dirname(__file__)
-        traders_file = os.path.join(base_dir, 'npc_diaologues.json')
-
-        try:
-            with open(traders_file, 'r') as f:
-                trader_data = json.load(f)
-                traders = []
-                for trader in trader_data['traders']:
-                    # Convert each item dictionary into an Item object
-                    items = []
-                    for item in trader.get('items', []):
-                        # Enforce conversion from dict to Item object
-                        if isinstance(item, dict):
-                            item_object = Item.from_dict(item)
-                            items.append(item_object)
-                        else:
-                            print(
-                                "Warning:"
-                                f"Item is not a valid dictionary: {item}"
-                            )
-
-                    traders.append(cls(
-                        name=trader['name'],
-                        description=trader['description'],
-                        dialogues=trader.get('dialogues', {}),
-                        items=items
-                    ))
-                return traders
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading traders: {e}")
-            return []
+        content = get_registry()
+        return [
+            cls.from_dict(trader, content.dialogue_graph(trader))
+            for trader in content.traders
+        ]
 
     def trade(self, player) -> None:
         """
@@ -3,16 +3,28 @@
 from .base_model import Interactable, Inspectable
 from .enemy import Enemy
 import random
-from .items import Item
+from .content import get_registry
+from .travel import TravelIndex
+from .combat import (
+    ATTACK, DEFEND, HEAL, ITEM, RUN, PASS, WON, LOST, FLED, MONSTER_RULES,
+    CombatState, resolve, Attacked, Braced, Healed, HealRefused, ItemUsed,
+    EnemyAttacked, Fled, EnemyDefeated, group_state, resolve_group,
+    TargetAttacked, TargetDefeated, EnemiesAttacked
+)
+
+# Combat menu choices
+COMBAT_ACTIONS = {'0': ATTACK, '1': DEFEND, '2': HEAL, '3': ITEM, '4': RUN}
 
 
 class player(Inspectable, Interactable):
 
     def __init__(
         self, starting_room, name: str = "Player",
-        health: int = 100, damage: int = 10
+        health: int = 100, damage: int = 10, content=None
     ) -> None:
         super().__init__()
+        # Content version the player is pinned to, None follows the latest
+        self.pinned_content = content
         self.name = name
         self.health = health
         self.damage = damage
@@ -21,14 +33,79 @@ class player(Inspectable, Interactable):
         self.action_count = 0
         self.defeated_enemy = []
         self.inventory = []
-        self.looked_for_items = False
+        # Rooms outside of a world the player looked for items in
+        self.looted_rooms = set()
         self.coins = 5
         self.trader_count = 0
         self.fought_in_room = {}
+        self.explored = TravelIndex()
 
         if starting_room:
             self.current_room = starting_room
             self.visited_rooms.append(starting_room.name)
+            self.explored.visit(self.room_key, name=starting_room.name)
+
+    @property
+    def content(self):
+        """
+        ContentRegistry: The content version the player plays with.
+        """
+        if self.pinned_content is not None:
+            return self.pinned_content
+        return get_registry()
+
+    @property
+    def defeated_names(self) -> set:
+        """
+        set: The names of the defeated enemies, built once per encounter so
+        sampling monsters checks each of them in O(1).
+        """
+        return set(self.defeated_enemy)
+
+    @property
+    def room_key(self):
+        """
+        The key of the current room in fought_in_room: its id when it
+        belongs to a world, its name otherwise.
+        """
+        room_id = getattr(self.current_room, 'room_id', None)
+        if room_id is not None:
+            return room_id
+        return self.current_room.name
+
+    @property
+    def looked_for_items(self) -> bool:
+        """
+        bool: Whether the current room was already searched for items.
+        Rooms of a world remember it in the world, so coming back to a
+        room does not fill it with items again.
+        """
+        if getattr(self.current_room, 'world', None) is not None:
+            return self.room_changes().get('looted', False)
+        return self.room_key in self.looted_rooms
+
+    def room_changes(self) -> dict:
+        """
+        Return what players changed in the current room, as remembered by
+        its world.
+
+        Args:
+            None
+
+        Returns:
+            dict: The changes, empty for rooms outside of a world.
+        """
+        world = getattr(self.current_room, 'world', None)
+        if world is None:
+            return {}
+        return world.changes(self.current_room.room_id)
+
+    def record_room_change(self, change: str, value=True) -> None:
+        # Rooms of a world are rebuilt from its seed, so the world has to
+        # remember what the player changed
+        world = getattr(self.current_room, 'world', None)
+        if world is not None:
+            world.record(self.current_room.room_id, change, value)
 
     def inspect(self, room_instance=None) -> None:
         if room_instance is None:
@@ -57,17 +134,25 @@ class player(Inspectable, Interactable):
 
             if chosen_door.destination:
                 print("  \nYou go through the door")
+                previous_key = self.room_key
                 self.current_room = chosen_door.destination
-                self.visited_rooms.append(self.current_room.name)
-
-                self.looked_for_items = False
-                amount = 1
-                self.coins += amount
-                print(f"  You received {amount} coins, for clearing the room! "
-                      f"Total coins: {self.coins}")
+                # Fast travel leads back to explored rooms, which must not
+                # pay again or count towards the rooms visited
+                if self.room_key not in self.explored:
+                    self.visited_rooms.append(self.current_room.name)
+                    self.explored.visit(
+                        self.room_key, previous_key, self.current_room.name
+                    )
+
+                    amount = 1
+                    self.coins += amount
+                    print(f"  You received {amount} coins, for clearing the "
+                          f"room! Total coins: {self.coins}")
 
                 if len(self.current_room.doors) == 0:
-                    self.current_room.add_doors(self.visited_rooms)
+                    self.current_room.add_doors(
+                        self.visited_rooms, self.content
+                    )
 
                 self.current_room.inspect()
             else:
@@ -75,6 +160,37 @@ class player(Inspectable, Interactable):
         else:
             print("Invalid choice. Please select a valid door number.")
 
+    def fast_travel(self) -> None:
+        world = getattr(self.current_room, 'world', None)
+        current_key = self.room_key
+        destinations = [key for key in self.explored if key != current_key]
+
+        if world is None or not destinations:
+            print("\nYou have not explored any other rooms yet.")
+            return
+
+        print("\nYou remember these rooms:")
+        for index, key in enumerate(destinations):
+            print(f"  ({index}) {self.explored.name(key)}")
+
+        room_choice = input("Select a room to travel to (or -1 to stay): ")
+        if room_choice == "-1":
+            print("\nYou chose to stay in the room.")
+            return
+        if room_choice.isdigit() and 0 <= int(room_choice) < len(
+                destinations):
+            target = destinations[int(room_choice)]
+            route = self.explored.route(current_key, target)
+            if route is None:
+                print("You cannot find the way to that room.")
+                return
+            print(f"  \nYou retrace your steps through {len(route) - 1} "
+                  "rooms")
+            self.current_room = world.room(target)
+            self.current_room.inspect()
+        else:
+            print("Invalid choice. Please select a valid room number.")
+
     def look_for_company(self) -> None:
         print("\nYou see the following characters:")
 
@@ -133,141 +249,261 @@ class player(Inspectable, Interactable):
             )
 
             combat_choice = input("Choose an action: ")
+            action = COMBAT_ACTIONS.get(combat_choice)
+            if action is None:
+                print("Invalid choice. Please select a valid action.")
+                continue
+            if action == ITEM:
+                print("\nYou decide to use an item from inventory")
+                if not self.show_inventory_and_use_item():
+                    print("          You decided not to use any\
+                           items or there was an invalid selection.")
+                    action = PASS
+
+            state, events = resolve(CombatState(
+                self.health, self.damage, self.action_count,
+                enemy.health, enemy.damage
+            ), action, MONSTER_RULES)
+            self.health = state.health
+            self.damage = state.damage
+            self.action_count = state.action_count
+            enemy.health = state.enemy_health
+            self.show_combat_events(enemy, action, events)
+
+            if state.outcome == WON:
+                break
+            if state.outcome == FLED:
+                break
+            if state.outcome == LOST:
+                print("     \nYou have been defeated!")
+                print("Game Over!")
+                exit(0)
 
-            if combat_choice == '0':
-                attack_damage = self.damage
-                enemy.health -= attack_damage
-                self.action_count += 1
-                if enemy.health <= 0:
-                    print(f"     \nYou defeated {enemy.name}!")
-                    self.defeated_enemy.append(enemy.name)
-                    if enemy.difficulty == "easy":
-                        amount = 2
-                        self.coins += amount
-                        print(f"     You received {amount} coins,\
-                               for beating an easy monster! \
-                              Your total coins: {self.coins}")
-                    elif enemy.difficulty == "medium":
-                        amount = 3
-                        self.coins += amount
-                        print(f"     You received {amount} coins, \
-                              for beating a medium monster! \
-                              Your total coins: {self.coins}")
-                    elif enemy.difficulty == "hard":
-                        amount = 5
-                        self.coins += amount
-                        print(f"     You received {amount} \
-                              coins, for beating a hard monster!\
-                               Your total coins: {self.coins}")
-                    break
-                else:
+        self.fought_in_room[self.room_key] = True
+        self.record_room_change('fought')
+
+    def show_combat_events(self, enemy, action: int, events: list) -> None:
+        for event in events:
+            if isinstance(event, Attacked):
+                if event.enemy_health > 0:
                     print(f"     \nYou attack {enemy.name} \
-                          for {attack_damage} damage!")
+                          for {event.damage} damage!")
                     print(f"          {enemy.name}\
-                           has {enemy.health} health remaining")
-            elif combat_choice == '1':
+                           has {event.enemy_health} health remaining")
+            elif isinstance(event, EnemyDefeated):
+                print(f"     \nYou defeated {enemy.name}!")
+                self.defeated_enemy.append(enemy.name)
+                self.reward_defeat(enemy)
+            elif isinstance(event, Braced):
                 print("     \nYou brace yourself for the next attack.")
-
-                reduced_damage = max(enemy.damage // 2, 0)
-                self.health -= reduced_damage
                 print(f"     {enemy.name}'s attack is weakened!\
-                       You take {reduced_damage} damage.")
+                       You take {event.damage} damage.")
                 print(f"          Your current health \
-                      is {self.health} health.")
-                self.action_count += 1
-
-            elif combat_choice == '2':
-                if self.action_count >= 3:
-                    heal_amount = random.randint(10, 30)
-                    self.health += heal_amount
-                    if self.health > 100:
-                        self.health = 100
-                        print(f"     \nYou healed yourself to full health!\
-                               Your current health is {self.health}.")
-                    else:
-                        print(f"     \nYou healed yourself for {heal_amount}\
-                               health! Your current health is {self.health}.")
-                    self.action_count = 0
+                      is {event.health} health.")
+            elif isinstance(event, Healed):
+                if event.capped:
+                    print(f"     \nYou healed yourself to full health!\
+                               Your current health is {event.health}.")
                 else:
-                    print("     \nYou need to take 3 \
+                    print(f"     \nYou healed yourself for {event.amount}\
+                               health! Your current health is {event.health}.")
+            elif isinstance(event, HealRefused):
+                print("     \nYou need to take 3 \
                           actions before healing again.")
-                # Enemy attacks after healing
-                if enemy.health > 0:
-                    self.health -= enemy.damage
+            elif isinstance(event, ItemUsed):
+                print(f"          After using the item, \
+                          your current health is {event.health}\
+                              and damage is {event.damage}.")
+            elif isinstance(event, EnemyAttacked):
+                if action == HEAL:
                     print(f"     {enemy.name} attacks you\
-                           for {enemy.damage} damage!")
-                    print(f"          You have {self.health}\
+                           for {event.damage} damage!")
+                    print(f"          You have {event.health}\
                            health remaining.")
-            elif combat_choice == '3':
-                print("\nYou decide to use an item from inventory")
-                if self.show_inventory_and_use_item():
-                    print(f"          After using the item, \
-                          your current health is {self.health}\
-                              and damage is {self.damage}.")
-                    self.action_count += 1
                 else:
-                    print("          You decided not to use any\
-                           items or there was an invalid selection.")
-            elif combat_choice == '4':
-                lost_health = self.health * 0.5
-                self.health -= lost_health
-                print(f"     \nYou ran away but lost {lost_health} health.\
-                       Your current health is {self.health}.")
-                break
-            else:
-                print("Invalid choice. Please select a valid action.")
-
-            # Enemy attacks after player's action (if not defeated)
-            if enemy.health > 0 and combat_choice in ['0', '1', '3']:
-                self.health -= enemy.damage
-                print(f"     {enemy.name} attacks you for\
-                       {enemy.damage} damage!")
-                print(f"          You have {self.health} health remaining.")
+                    print(f"     {enemy.name} attacks you for\
+                       {event.damage} damage!")
+                    print(f"          You have {event.health} health "
+                          "remaining.")
+            elif isinstance(event, Fled):
+                print(f"     \nYou ran away but lost {event.lost} health.\
+                       Your current health is {event.health}.")
+
+    def start_group_combat(self, enemies: list) -> None:
+        print(f"\n{len(enemies)} monsters attack you together!")
+        state = group_state(self.health, self.damage, self.action_count,
+                            [enemy.health for enemy in enemies],
+                            [enemy.damage for enemy in enemies])
+
+        while state.outcome is None:
+            print("\nCombat Menu:")
+            for index, enemy in enumerate(enemies):
+                if enemy.health > 0:
+                    print(f"     [{index}] {enemy.name} has {enemy.health}"
+                          f" health and deals {enemy.damage} damage.")
+            print(f"     (0) Attack - Deal {self.damage} damage to a monster.")
+            print(f"     (1) Defend - Brace against every monster. "
+                  f"You will take {state.braced} damage.")
+            print(
+                "     (2) Heal - Restore health randomly from 10 to 30 health,"
+                "can be used once every 3 actions."
+            )
+            print("     (3) Use an Item - Use a healing or "
+                  "damage-boosting item from your inventory.")
+            print(f"     (4) Run Away - Escape the fight, but lose 50% of "
+                  f"your health. You will end up with {self.health * 0.5} "
+                  "health.")
 
-            if self.health <= 0:
+            combat_choice = input("Choose an action: ")
+            action = COMBAT_ACTIONS.get(combat_choice)
+            if action is None:
+                print("Invalid choice. Please select a valid action.")
+                continue
+            target = None
+            if action == ATTACK and state.alive > 1:
+                target_choice = input("Choose a monster to attack by "
+                                      "number: ").strip()
+                if target_choice.isdigit():
+                    target = int(target_choice)
+            if action == ITEM:
+                print("\nYou decide to use an item from inventory")
+                if not self.show_inventory_and_use_item():
+                    print("          You decided not to use any items "
+                          "or there was an invalid selection.")
+                    action = PASS
+
+            # Items change the player outside of the engine
+            state, events = resolve_group(
+                state._replace(health=self.health, damage=self.damage),
+                action, MONSTER_RULES, target
+            )
+            self.health = state.health
+            self.damage = state.damage
+            self.action_count = state.action_count
+            for enemy, health in zip(enemies, state.enemy_health):
+                enemy.health = health
+            self.show_group_events(enemies, action, events)
+
+            if state.outcome == LOST:
                 print("     \nYou have been defeated!")
                 print("Game Over!")
                 exit(0)
 
-        current_room_name = self.current_room.name
-        self.fought_in_room[current_room_name] = True
+        self.fought_in_room[self.room_key] = True
+        self.record_room_change('fought')
+
+    def show_group_events(self, enemies: list, action: int,
+                          events: list) -> None:
+        for event in events:
+            if isinstance(event, TargetAttacked):
+                enemy = enemies[event.target]
+                if event.enemy_health > 0:
+                    print(f"     \nYou attack {enemy.name} for "
+                          f"{event.damage} damage!")
+                    print(f"          {enemy.name} has "
+                          f"{event.enemy_health} health remaining")
+            elif isinstance(event, TargetDefeated):
+                enemy = enemies[event.target]
+                print(f"     \nYou defeated {enemy.name}!")
+                self.defeated_enemy.append(enemy.name)
+                self.reward_defeat(enemy)
+            elif isinstance(event, EnemyDefeated):
+                print("     \nYou defeated every monster!")
+            elif isinstance(event, Braced):
+                print("     \nYou brace yourself for the next attacks.")
+                print(f"     The monsters' attacks are weakened! "
+                      f"You take {event.damage} damage.")
+                print(f"          Your current health is {event.health} "
+                      "health.")
+            elif isinstance(event, EnemiesAttacked):
+                print(f"     {event.attackers} monster(s) attack you for "
+                      f"{event.damage} damage!")
+                print(f"          You have {event.health} health remaining.")
+            else:
+                self.show_combat_events(None, action, [event])
+
+    def reward_defeat(self, enemy) -> None:
+        if enemy.difficulty == "easy":
+            amount = 2
+            self.coins += amount
+            print(f"     You received {amount} coins,\
+                   for beating an easy monster! \
+                  Your total coins: {self.coins}")
+        elif enemy.difficulty == "medium":
+            amount = 3
+            self.coins += amount
+            print(f"     You received {amount} coins, \
+                  for beating a medium monster! \
+                  Your total coins: {self.coins}")
+        elif enemy.difficulty == "hard":
+            amount = 5
+            self.coins += amount
+            print(f"     You received {amount} \
+                  coins, for beating a hard monster!\
+                   Your total coins: {self.coins}")
 
     def look_for_fight(self) -> None:
-        current_room_name = self.current_room.name
+        # Rooms are keyed by id, names of rooms outside a world can repeat
+        current_room_key = self.room_key
+        changes = self.room_changes()
 
-        if (current_room_name in self.fought_in_room
-                and self.fought_in_room[current_room_name]):
+        if self.fought_in_room.get(current_room_key) or changes.get('fought'):
             print("     There are no more enemies in this room.")
             return
 
-        num_monsters = random.randint(0, 2)
-        monsters_to_fight = []
+        catalog = self.content.monster_catalog
+        if 'monsters' in changes:
+            # The monsters met here before are still waiting
+            defeated = self.defeated_names
+            templates = [
+                catalog.get(name) for name in changes['monsters']
+                if name not in defeated
+            ]
+            templates = [monster for monster in templates if monster]
+            if not templates:
+                print("     There are no more enemies in this room.")
+                self.fought_in_room[current_room_key] = True
+                self.record_room_change('fought')
+                return
+            num_monsters = len(templates)
+        else:
+            num_monsters = random.randint(0, 2)
+            templates = None
 
         if num_monsters > 0:
             print(f"     \nYou encounter {num_monsters} monster(s)!")
-            monsters_to_fight = random.sample(
-                    Enemy.load_monsters(), num_monsters
+            if templates is None:
+                templates = catalog.sample_undefeated(
+                    num_monsters, self.defeated_names
                 )
+                if templates:
+                    self.record_room_change(
+                        'monsters', [monster['name'] for monster in templates]
+                    )
             remaining_monsters = [
-                monster for monster in monsters_to_fight
-                if monster.name not in self.defeated_enemy
+                Enemy.from_dict(monster) for monster in templates
             ]
 
             if not remaining_monsters:
                 print("     There are no more monsters to fight in this room.")
-                self.fought_in_room[current_room_name] = True
+                self.fought_in_room[current_room_key] = True
+                self.record_room_change('fought')
                 return
 
             for index, monster in enumerate(remaining_monsters):
                 print(f"({index}) {monster.name}: {monster.description} \
 (Health: {monster.health}), \
 Difficulty: {monster.difficulty}")
+            if len(remaining_monsters) > 1:
+                print("(a) Fight them all at once")
 
             choice = input("\nSelect a monster to fight by \
                            number (or -1 to back out): ")
             if choice.isdigit() and 0 <= int(choice) < len(remaining_monsters):
                 chosen_monster = remaining_monsters[int(choice)]
                 self.start_combat(chosen_monster)
+            elif choice == 'a' and len(remaining_monsters) > 1:
+                self.start_group_combat(remaining_monsters)
             elif choice == '-1':
                 print("     You decided to back out of the fight.")
             else:
@@ -282,19 +518,12 @@ Difficulty: {monster.difficulty}")
 
         num_items_found = random.randint(1, 3)
         found_items = []
-
-        rarities = ['common', 'rare', 'super rare', 'epic', 'legendary']
-        probabilities = [0.5, 0.3, 0.15, 0.04, 0.01]
+        loot_table = self.content.loot_table
 
         for _ in range(num_items_found):
-            rarity_choice = random.choices(rarities, probabilities)[0]
-            items_of_rarity = [
-                item for item in Item.load_items()
-                if item.rarity == rarity_choice
-            ]
+            selected_item = loot_table.draw()
 
-            if items_of_rarity:
-                selected_item = random.choice(items_of_rarity)
+            if selected_item is not None:
                 found_items.append(selected_item)
                 print(f"\nYou found a {selected_item.name}!\
                        It's a {selected_item.rarity} item.")
@@ -308,7 +537,8 @@ Difficulty: {monster.difficulty}")
         else:
             print("No items found.")
 
-        self.looked_for_items = True
+        self.looted_rooms.add(self.room_key)
+        self.record_room_change('looted')
 
     def show_inventory_and_use_item(self) -> bool:
         if not self.inventory:
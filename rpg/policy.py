@@ -0,0 +1,401 @@
+import hashlib
+import os
+import sys
+from array import array
+from .combat import ATTACK, DEFEND, HEAL, RUN, MONSTER_RULES, BOSS_RULES
+
+POLICY_MAGIC = b'RPGP'
+POLICY_VERSION = 1
+POLICY_DIR = os.path.join(os.path.dirname(__file__), '__pycache__',
+                          'policies')
+
+# Values change less than this between two sweeps once a level is solved
+TOLERANCE = 1e-12
+MAX_SWEEPS = 10_000
+
+ACTION_NAMES = {ATTACK: 'attack', DEFEND: 'defend', HEAL: 'heal',
+                RUN: 'run away'}
+
+
+class PolicyTable:
+    def __init__(
+            self,
+            max_health: int,
+            enemy_health: int,
+            heal_cooldown: int,
+            actions: array,
+            values: array
+            ) -> None:
+        """
+        Initialize a table of the best action and the win probability of
+        every state of a fight.
+
+        A state is the player's health (1 to `max_health`), the enemy's
+        health (1 to `enemy_health`) and the actions since the player last
+        healed (0 to `heal_cooldown`, more count as `heal_cooldown`). The
+        table is two flat typed arrays indexed by state, so a lookup is
+        O(1) and the whole table is a few hundred kilobytes at most.
+
+        Args:
+            max_health (int): The most health the player can have.
+            enemy_health (int): The most enemy health covered.
+            heal_cooldown (int): The actions needed before healing again.
+            actions (array): The best action of every state.
+            values (array): The win probability of every state.
+
+        Returns:
+            None
+        """
+        self.max_health = max_health
+        self.enemy_health = enemy_health
+        self.heal_cooldown = heal_cooldown
+        self.actions = actions
+        self.values = values
+
+    def index(self, health, enemy_health: int, action_count: int) -> int:
+        """
+        Return the position of a state in the table.
+
+        Args:
+            health: The player's health, rounded down and limited to the
+            range of the table.
+            enemy_health (int): The enemy's health, at most the table's.
+            action_count (int): The actions since the player last healed.
+
+        Returns:
+            int: The position.
+
+        Raises:
+            ValueError: If the enemy has more health than the table covers.
+        """
+        if enemy_health > self.enemy_health:
+            raise ValueError(f"The table covers enemies with up to "
+                             f"{self.enemy_health} health")
+        health = min(max(int(health), 1), self.max_health)
+        enemy_health = max(int(enemy_health), 1)
+        action_count = min(max(action_count, 0), self.heal_cooldown)
+        return (((enemy_health - 1) * self.max_health + health - 1)
+                * (self.heal_cooldown + 1) + action_count)
+
+    def lookup(self, health, enemy_health: int, action_count: int) -> tuple:
+        """
+        Look up the best action of a state.
+
+        Args:
+            health: The player's health.
+            enemy_health (int): The enemy's health.
+            action_count (int): The actions since the player last healed.
+
+        Returns:
+            tuple: The best action and the probability of winning the
+            fight when playing the best action from now on.
+        """
+        position = self.index(health, enemy_health, action_count)
+        return self.actions[position], self.values[position]
+
+    def hint(self, health, enemy_health: int, action_count: int) -> str:
+        """
+        Describe the best action of a state for a player.
+
+        Args:
+            health: The player's health.
+            enemy_health (int): The enemy's health.
+            action_count (int): The actions since the player last healed.
+
+        Returns:
+            str: The advice.
+        """
+        action, value = self.lookup(health, enemy_health, action_count)
+        return (f"Advisor: {ACTION_NAMES[action]} "
+                f"({value * 100:.0f}% chance to win)")
+
+
+def _hits(rules, enemy_damage: int) -> list:
+    if rules.enemy_damage_range is None:
+        return [(enemy_damage, 1.0)]
+    low, high = rules.enemy_damage_range
+    return [(hit, 1 / (high - low + 1)) for hit in range(low, high + 1)]
+
+
+def solve(
+        damage: int,
+        enemy_health: int,
+        enemy_damage: int,
+        rules=MONSTER_RULES,
+        flee_value: float = 0.0
+        ) -> PolicyTable:
+    """
+    Compute the best action and the win probability of every state of a
+    fight by dynamic programming.
+
+    An attack always lowers the enemy's health, so the states are solved
+    one enemy health at a time, from 1 up. Within one enemy health the
+    player can only defend and heal, which may loop; those states are
+    solved by value iteration until they stop changing. Using items is
+    not modelled, and running away is worth `flee_value`.
+
+    Args:
+        damage (int): The damage of the player's attack.
+        enemy_health (int): The most enemy health to cover.
+        enemy_damage (int): The damage of the enemy's attack, unless the
+        rules draw it from a range.
+        rules (CombatRules, optional): The rules of the fight
+        (default is MONSTER_RULES). Rescuing the player is not supported.
+        flee_value (float, optional): What running away is worth compared
+        to a win (default is 0.0).
+
+    Returns:
+        PolicyTable: The solved table.
+
+    Raises:
+        ValueError: If the rules rescue the player.
+    """
+    if rules.rescue_health is not None:
+        raise ValueError("Fights that rescue the player cannot be solved")
+    top = rules.max_health
+    cooldown = rules.heal_cooldown
+    counts = cooldown + 1
+    hits = _hits(rules, enemy_damage)
+    heals = range(rules.heal_range[0], rules.heal_range[1] + 1)
+    heal_chance = 1 / len(heals)
+    brace = max(enemy_damage // 2, 0)
+    level_size = top * counts
+    values = []
+    actions = []
+
+    def struck(level: list, health, count: int) -> float:
+        # The win probability after the enemy attacks a player with
+        # `health` whose next state is `count` in `level`
+        total = 0.0
+        for hit, chance in hits:
+            left = int(health - hit)
+            if left > 0:
+                total += chance * level[(left - 1) * counts + count]
+        return total
+
+    for enemy in range(1, enemy_health + 1):
+        below = enemy - damage
+        lower = None
+        if below > 0:
+            start = (below - 1) * level_size
+            lower = values[start:start + level_size]
+        attack = []
+        for health in range(1, top + 1):
+            for count in range(counts):
+                if lower is None:
+                    attack.append(1.0)
+                else:
+                    attack.append(
+                        struck(lower, health, min(count + 1, cooldown)))
+
+        level = [0.0] * level_size
+        best = [ATTACK] * level_size
+        for _ in range(MAX_SWEEPS):
+            # The win probability after a heal brings the player to a
+            # health, before the enemy answers
+            healed = [0.0] + [struck(level, health, 0)
+                              for health in range(1, top + 1)]
+            change = 0.0
+            for health in range(1, top + 1):
+                for count in range(cooldown, -1, -1):
+                    position = (health - 1) * counts + count
+                    choice, value = ATTACK, attack[position]
+                    if rules.brace_immediately:
+                        defend = struck(level, health - brace,
+                                        min(count + 1, cooldown))
+                    else:
+                        defend = 0.0
+                        for hit, chance in hits:
+                            left = health - hit // 2
+                            if left > 0:
+                                defend += chance * level[
+                                    (left - 1) * counts
+                                    + min(count + 1, cooldown)]
+                    if defend > value:
+                        choice, value = DEFEND, defend
+                    if count >= cooldown:
+                        heal = heal_chance * sum(
+                            healed[min(health + amount, top)]
+                            for amount in heals
+                        )
+                        if heal > value:
+                            choice, value = HEAL, heal
+                    if flee_value > value:
+                        choice, value = RUN, flee_value
+                    change = max(change, abs(value - level[position]))
+                    level[position] = value
+                    best[position] = choice
+            if change < TOLERANCE:
+                break
+        values.extend(level)
+        actions.extend(best)
+
+    return PolicyTable(top, enemy_health, cooldown, array('b', actions),
+                       array('f', values))
+
+
+def policy_key(damage: int, enemy_health: int, enemy_damage: int,
+               rules, flee_value: float) -> bytes:
+    """
+    Compute the key identifying a solved fight.
+
+    Args:
+        damage (int): The damage of the player's attack.
+        enemy_health (int): The most enemy health covered.
+        enemy_damage (int): The damage of the enemy's attack.
+        rules (CombatRules): The rules of the fight.
+        flee_value (float): What running away is worth.
+
+    Returns:
+        bytes: A 32 byte digest.
+    """
+    settings = (damage, enemy_health, enemy_damage, flee_value,
+                sorted(vars(rules).items()))
+    return hashlib.sha256(
+        POLICY_VERSION.to_bytes(2, 'big') + repr(settings).encode()
+    ).digest()
+
+
+def write_policy(table: PolicyTable, key: bytes, path: str) -> None:
+    """
+    Write a solved table to a file.
+
+    Args:
+        table (PolicyTable): The table.
+        key (bytes): The key of the fight it solves.
+        path (str): Where to write it.
+
+    Returns:
+        None
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(POLICY_MAGIC)
+        f.write(POLICY_VERSION.to_bytes(2, 'big'))
+        f.write(key)
+        for size in (table.max_health, table.enemy_health,
+                     table.heal_cooldown):
+            f.write(size.to_bytes(4, 'little'))
+        table.actions.tofile(f)
+        table.values.tofile(f)
+    os.replace(temp_path, path)
+
+
+def read_policy(key: bytes, path: str) -> PolicyTable:
+    """
+    Read a solved table if it matches the given key.
+
+    Args:
+        key (bytes): The key of the fight.
+        path (str): The file to read.
+
+    Returns:
+        PolicyTable: The table, or None if the file is missing, corrupt or
+        solves another fight.
+    """
+    try:
+        with open(path, 'rb') as f:
+            blob = f.read()
+    except OSError:
+        return None
+    header = POLICY_MAGIC + POLICY_VERSION.to_bytes(2, 'big') + key
+    if not blob.startswith(header):
+        return None
+    sizes = blob[len(header):len(header) + 12]
+    if len(sizes) != 12:
+        return None
+    max_health, enemy_health, cooldown = (
+        int.from_bytes(sizes[i:i + 4], 'little') for i in (0, 4, 8)
+    )
+    states = max_health * enemy_health * (cooldown + 1)
+    body = blob[len(header) + 12:]
+    actions = array('b')
+    values = array('f')
+    if len(body) != states * (actions.itemsize + values.itemsize):
+        return None
+    actions.frombytes(body[:states * actions.itemsize])
+    values.frombytes(body[states * actions.itemsize:])
+    return PolicyTable(max_health, enemy_health, cooldown, actions, values)
+
+
+def load_policy(
+        damage: int,
+        enemy_health: int,
+        enemy_damage: int,
+        rules=MONSTER_RULES,
+        flee_value: float = 0.0,
+        directory: str = POLICY_DIR
+        ) -> PolicyTable:
+    """
+    Return the solved table of a fight, solving it only the first time.
+
+    Args:
+        damage (int): The damage of the player's attack.
+        enemy_health (int): The most enemy health to cover.
+        enemy_damage (int): The damage of the enemy's attack.
+        rules (CombatRules, optional): The rules of the fight
+        (default is MONSTER_RULES).
+        flee_value (float, optional): What running away is worth
+        (default is 0.0).
+        directory (str, optional): Where solved tables are kept
+        (default is POLICY_DIR).
+
+    Returns:
+        PolicyTable: The table.
+    """
+    key = policy_key(damage, enemy_health, enemy_damage, rules, flee_value)
+    path = os.path.join(directory, f"{key.hex()[:32]}.policy")
+    table = read_policy(key, path)
+    if table is None:
+        table = solve(damage, enemy_health, enemy_damage, rules, flee_value)
+        try:
+            write_policy(table, key, path)
+        except OSError as e:
+            print(f"Could not save the combat policy: {e}")
+    return table
+
+
+def monster_policy(damage: int, monster: dict, **kwargs) -> PolicyTable:
+    """
+    Return the solved table of a fight against a monster.
+
+    Args:
+        damage (int): The damage of the player's attack.
+        monster (dict): The monster, as in monsters.json.
+        **kwargs: Passed on to load_policy.
+
+    Returns:
+        PolicyTable: The table.
+    """
+    return load_policy(damage, monster['health'], monster['damage'],
+                       MONSTER_RULES, **kwargs)
+
+
+def boss_policy(damage: int, boss_health: int = 300,
+                **kwargs) -> PolicyTable:
+    """
+    Return the solved table of the final boss fight.
+
+    The boss's health is drawn when it appears, so the table covers every
+    boss health up to `boss_health`.
+
+    Args:
+        damage (int): The damage of the player's attack.
+        boss_health (int, optional): The most boss health to cover
+        (default is 300, the highest FinalBoss draws).
+        **kwargs: Passed on to load_policy.
+
+    Returns:
+        PolicyTable: The table.
+    """
+    return load_policy(damage, boss_health, 0, BOSS_RULES, **kwargs)
+
+
+if __name__ == "__main__":
+    player_damage = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    table = boss_policy(player_damage)
+    for health in (30, 60, 100):
+        action, value = table.lookup(health, 300, 3)
+        print(f"Health {health:>3} against a full health boss: "
+              f"{ACTION_NAMES[action]}, {value * 100:.1f}% to win")
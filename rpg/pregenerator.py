@@ -0,0 +1,134 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+class Pregenerator:
+    def __init__(self, world, depth: int = 1, workers: int = 1) -> None:
+        """
+        Initialize a pre-generator that builds rooms ahead of the player.
+
+        While the game waits for the player's next command, worker threads
+        build the rooms up to `depth` doors away, so going through a door
+        finds its room ready in the world's cache.
+
+        Only rooms whose ids are already known are built. Discovering the
+        doors of a room hands out room ids, and that stays on the game's
+        own thread, so pre-generation never changes what the world looks
+        like.
+
+        Args:
+            world (World): The world to build rooms of.
+            depth (int, optional): How many doors ahead to build
+            (default is 1).
+            workers (int, optional): The number of worker threads
+            (default is 1).
+
+        Returns:
+            None
+        """
+        self.world = world
+        self.depth = depth
+        self.workers = workers
+        self.generated = 0
+        self._executor = None
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Start the worker threads.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="pregenerator"
+            )
+
+    def stop(self) -> None:
+        """
+        Stop the worker threads, dropping rooms not started yet.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            self._pending.clear()
+
+    def wait(self) -> None:
+        """
+        Wait until every queued room is built.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self._lock:
+            futures = list(self._pending.values())
+        wait(futures)
+
+    def ahead(self, room_id: int) -> list:
+        """
+        List the known rooms within `depth` doors of a room.
+
+        Args:
+            room_id (int): The id of the room the player is in.
+
+        Returns:
+            list: The room ids, nearest first.
+        """
+        found = []
+        seen = {room_id}
+        frontier = [room_id]
+        for _ in range(self.depth):
+            next_frontier = []
+            for current in frontier:
+                for neighbour in self.world.neighbours(current):
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        found.append(neighbour)
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+        return found
+
+    def schedule(self, room_id: int) -> None:
+        """
+        Queue the rooms ahead of a room that are not built yet.
+
+        Args:
+            room_id (int): The id of the room the player is in.
+
+        Returns:
+            None
+        """
+        if self._executor is None:
+            return
+        for neighbour in self.ahead(room_id):
+            with self._lock:
+                if neighbour in self._pending or neighbour in self.world.rooms:
+                    continue
+                self._pending[neighbour] = self._executor.submit(
+                    self._build, neighbour
+                )
+
+    def _build(self, room_id: int) -> None:
+        try:
+            # Descriptions are drawn when the game enters the room
+            built = self.world.room(room_id, assign=False)
+            built.traders  # Traders are built on first use
+            with self._lock:
+                self.generated += 1
+        finally:
+            with self._lock:
+                self._pending.pop(room_id, None)
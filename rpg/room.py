@@ -1,28 +1,63 @@
 import random
-import os
-import json
 from .base_model import Interactable, Inspectable
 from .door import door
 from .npc import npc, Trader
-from .items import Item
+from .content import get_registry
+from .sampler import ShuffleBag
+
+
+class RoomStub:
+    """
+    A room behind a door that nobody went through yet.
+
+    A stub only remembers what is needed to build the room later, so
+    unexplored rooms cost a few bytes instead of a full room with its NPCs
+    and trader.
+    """
+    __slots__ = ('name', 'seed', 'content')
+
+    explored = False
+
+    def __init__(self, name: str, seed: int, content) -> None:
+        """
+        Initialize a RoomStub.
+
+        Args:
+            name (str): The name of the room.
+            seed (int): The seed the room's contents are drawn with.
+            content (ContentRegistry): The content version to build the
+                room from.
+
+        Returns:
+            None
+        """
+        self.name = name
+        self.seed = seed
+        self.content = content
+
+    def materialize(self) -> 'room':
+        """
+        Build the full room.
+
+        Args:
+            None
+
+        Returns:
+            room: The room, always the same for the same stub data.
+        """
+        return room(self.name, content=self.content, seed=self.seed)
 
 
 class room(Inspectable, Interactable):
-    # Load descriptions from JSON file
-    base_dir = os.path.dirname(__file__)
-    descriptions_file = os.path.join(base_dir, 'descriptions.json')
-
-    try:
-        with open(descriptions_file, 'r') as f:
-            descriptions_data = json.load(f)
-            room_descriptions = descriptions_data['room_descriptions']
-            door_descriptions = descriptions_data['door_descriptions']
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"Error loading descriptions: {e}")
-        room_descriptions = ["An empty room."]
-        door_descriptions = ["A plain door."]
-
-    def __init__(self, name: str, description: str = None) -> None:
+    def __init__(
+            self,
+            name: str,
+            description: str = None,
+            content=None,
+            seed: int = None,
+            room_id: int = None,
+            world=None
+            ) -> None:
         """
         Initialize a Room object.
 
@@ -30,15 +65,31 @@ class room(Inspectable, Interactable):
             name (str): The name of the room.
             description (str, optional): A description of the room.
                 Defaults to None, which selects a random description.
+            content (ContentRegistry, optional): The content version to
+                build the room from. Defaults to the current registry.
+            seed (int, optional): The seed to draw the room's description
+                and NPCs with. Defaults to None, which uses the global
+                random generator.
+            room_id (int, optional): The id of the room in its world.
+            world (World, optional): The world the room belongs to, which
+                then provides its doors. Defaults to None.
 
         Returns:
             None
         """
         super().__init__()
         self.name = name
+        self.seed = seed
+        self.room_id = room_id
+        self.world = world
+        self.content = content if content is not None else get_registry()
+        rng = random if seed is None else random.Random(seed)
         # Set a default room description if none is provided
-        self.description = (random.choice(self.room_descriptions)
-                            if description is None else description)
+        self.description = (
+            rng.choice(
+                self.content.room_descriptions or ["An empty room."]
+            ) if description is None else description
+        )
         self.doors = {}
         self.items = []
         self.characters = []
@@ -46,31 +97,43 @@ class room(Inspectable, Interactable):
         self.locked = False
         self.npcs = []
         self.traders = []  # Use plural for clarity
-        self.initialize_npcs()  # Initialize NPCs
+        self.initialize_npcs(rng)  # Initialize NPCs
 
-    def add_doors(self, existing_rooms: list) -> None:
+    def add_doors(self, existing_rooms: list, content=None) -> None:
         """
         Add a random number of doors to the room.
 
+        The rooms behind the doors are only stubs; each one is built when
+        a player first goes through its door. A room of a world gets the
+        doors its world derives for it instead.
+
         Args:
             existing_rooms (list): A list of rooms that already exist.
+            content (ContentRegistry, optional): The content version to
+                build the new rooms from. Defaults to the room's own.
 
         Returns:
             None
         """
+        if self.world is not None:
+            self.world.add_doors(self)
+            return
+        if content is None:
+            content = self.content
         num_doors = random.randint(2, 4)  # Generate a random number of doors
-        descriptions = self.door_descriptions.copy()
-        random.shuffle(descriptions)
+        descriptions = ShuffleBag(
+            content.door_descriptions, random.getrandbits(64)
+        )
 
         for i in range(num_doors):
             door_name = f"Door {i + 1}"
-            if descriptions:
-                door_description = descriptions.pop()
-            else:
-                door_description = "A simple door."
-            destination_room_name = (f"Room {len(existing_rooms) + 1}")
-            # Create a new room for the door
-            destination_room = room(destination_room_name)
+            door_description = descriptions.draw("A simple door.")
+            # Rooms behind one set of doors each get their own number
+            destination_room_name = f"Room {len(existing_rooms) + i + 1}"
+            # The room is built from the stub when it is first entered
+            destination_room = RoomStub(
+                destination_room_name, random.getrandbits(32), content
+            )
 
             # Add the door to the current room
             self.doors[door_name] = door(
@@ -78,56 +141,39 @@ class room(Inspectable, Interactable):
                 destination=destination_room
             )
 
-    def initialize_npcs(self) -> None:
+    def initialize_npcs(self, rng=random) -> None:
         """
         Initialize a random number of NPCs in the room (0 to 3) and ensure
         only one trader is present.
 
         Args:
-            None
+            rng (optional): The random number source
+            (default is the random module).
 
         Returns:
             None
         """
-        npcs_file = os.path.join(
-            os.path.dirname(__file__), 'npc_diaologues.json'
-        )
+        content = self.content
 
-        try:
-            with open(npcs_file, 'r') as f:
-                npc_data = json.load(f)
-
-                # Initialize NPCs
-                num_npcs = random.randint(0, 3)
-                selected_npcs = random.sample(
-                    npc_data['npcs'], min(num_npcs, len(npc_data['npcs']))
-                )
-                for npc_info in selected_npcs:
-                    new_npc = npc(
-                        name=npc_info['name'],
-                        description=npc_info['description'],
-                        dialogues=npc_info['dialogues']
-                    )
-                    self.npcs.append(new_npc)
-
-                # Ensure only one trader is added
-                if not self.traders:
-                    num_traders = 1
-                    if num_traders == 1:
-                        selected_trader = random.choice(npc_data['traders'])
-                        new_trader = Trader(
-                            name=selected_trader['name'],
-                            description=selected_trader['description'],
-                            dialogues=selected_trader['dialogues'],
-                            items=[
-                                Item.from_dict(item)
-                                for item in selected_trader['items']
-                            ]
-                        )
-                        self.traders.append(new_trader)
-
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading NPCs: {e}")
+        # Initialize NPCs
+        num_npcs = rng.randint(0, 3)
+        selected_npcs = rng.sample(
+            content.npcs, min(num_npcs, len(content.npcs))
+        )
+        for npc_info in selected_npcs:
+            new_npc = npc(
+                name=npc_info['name'],
+                description=npc_info['description'],
+                dialogues=content.dialogue_graph(npc_info)
+            )
+            self.npcs.append(new_npc)
+
+        # Ensure only one trader is added
+        if not self.traders and content.traders:
+            selected_trader = rng.choice(content.traders)
+            self.traders.append(Trader.from_dict(
+                selected_trader, content.dialogue_graph(selected_trader)
+            ))
 
     def inspect(self) -> None:
         """
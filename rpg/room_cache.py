@@ -0,0 +1,337 @@
+import json
+import sqlite3
+from collections import OrderedDict
+
+
+class RoomStore:
+    def __init__(self, path: str = "") -> None:
+        """
+        Initialize an on-disk store for the state of regions paged out of
+        memory.
+
+        Each region is stored as one row holding the state of all of its
+        changed rooms, so paging a region in or out is a single write or
+        read however many rooms it has.
+
+        Args:
+            path (str, optional): The database file. Defaults to an empty
+            string, which keeps the store in a temporary file that is
+            removed when the store is closed.
+
+        Returns:
+            None
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS regions "
+            "(region_id INTEGER PRIMARY KEY, state TEXT NOT NULL)"
+        )
+
+    def __len__(self) -> int:
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM regions"
+        ).fetchone()[0]
+
+    def save(self, region_id: int, state: dict) -> None:
+        """
+        Store the state of a region, replacing any earlier one.
+
+        Args:
+            region_id (int): The id of the region.
+            state (dict): The JSON serializable state of the region.
+
+        Returns:
+            None
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO regions VALUES (?, ?)",
+            (region_id, json.dumps(state, separators=(',', ':')))
+        )
+        self.connection.commit()
+
+    def peek(self, region_id: int) -> dict:
+        """
+        Read the stored state of a region, leaving it in the store.
+
+        Args:
+            region_id (int): The id of the region.
+
+        Returns:
+            dict: The state of the region, or None if none is stored.
+        """
+        row = self.connection.execute(
+            "SELECT state FROM regions WHERE region_id = ?", (region_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def load(self, region_id: int) -> dict:
+        """
+        Take the stored state of a region out of the store.
+
+        Args:
+            region_id (int): The id of the region.
+
+        Returns:
+            dict: The state of the region, or None if none is stored.
+        """
+        state = self.peek(region_id)
+        if state is None:
+            return None
+        self.connection.execute(
+            "DELETE FROM regions WHERE region_id = ?", (region_id,)
+        )
+        self.connection.commit()
+        return state
+
+    def close(self) -> None:
+        """
+        Close the store.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.connection.close()
+
+
+class RoomCache:
+    def __init__(self, capacity: int = None, evict=None) -> None:
+        """
+        Initialize a cache of built rooms with least recently used eviction.
+
+        Args:
+            capacity (int, optional): The most rooms kept in memory.
+            Defaults to None, which never evicts.
+            evict (optional): Called with the id and the room whenever a
+            room leaves the cache (default is None).
+
+        Returns:
+            None
+        """
+        self.capacity = capacity
+        self.evict = evict
+        self.rooms = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.faults = 0
+
+    def __len__(self) -> int:
+        return len(self.rooms)
+
+    def __contains__(self, room_id: int) -> bool:
+        return room_id in self.rooms
+
+    def __getitem__(self, room_id: int):
+        return self.rooms[room_id]
+
+    def get(self, room_id: int):
+        """
+        Look up a room and mark it as the most recently used.
+
+        Args:
+            room_id (int): The id of the room.
+
+        Returns:
+            The room, or None if it is not in memory.
+        """
+        built = self.rooms.get(room_id)
+        if built is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.rooms.move_to_end(room_id)
+        return built
+
+    def put(self, room_id: int, built) -> None:
+        """
+        Add a room, evicting the least recently used rooms beyond the
+        capacity.
+
+        Args:
+            room_id (int): The id of the room.
+            built: The room.
+
+        Returns:
+            None
+        """
+        self.rooms[room_id] = built
+        self.rooms.move_to_end(room_id)
+        if self.capacity is not None:
+            while len(self.rooms) > self.capacity:
+                old_id, old_room = self.rooms.popitem(last=False)
+                self.evictions += 1
+                if self.evict is not None:
+                    self.evict(old_id, old_room)
+
+    def pop(self, room_id: int, default=None):
+        """
+        Remove a room from the cache.
+
+        Args:
+            room_id (int): The id of the room.
+            default (optional): Returned if the room is not in memory.
+
+        Returns:
+            The removed room, or the default.
+        """
+        built = self.rooms.pop(room_id, None)
+        if built is None:
+            return default
+        if self.evict is not None:
+            self.evict(room_id, built)
+        return built
+
+    def stats(self) -> dict:
+        """
+        Return the counters of the cache.
+
+        Args:
+            None
+
+        Returns:
+            dict: The hits, misses, evictions and faults (rooms restored
+            from disk), the number of rooms in memory and the capacity.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'faults': self.faults,
+            'size': len(self.rooms),
+            'capacity': self.capacity,
+        }
+
+
+class Region:
+    """
+    The rooms of one region that are in memory, and the stored state of
+    its rooms that were not built again yet.
+    """
+    __slots__ = ('rooms', 'states')
+
+    def __init__(self, states: dict = None) -> None:
+        """
+        Initialize a Region.
+
+        Args:
+            states (dict, optional): The paged out state of its rooms by
+            room id (default is None, for no state).
+
+        Returns:
+            None
+        """
+        self.rooms = {}
+        self.states = states if states is not None else {}
+
+
+class RegionCache:
+    def __init__(
+            self,
+            region_size: int,
+            capacity: int = None,
+            load=None,
+            evict=None
+            ) -> None:
+        """
+        Initialize a cache of built rooms that keeps, evicts and pages
+        whole regions of rooms at once.
+
+        Room `r` belongs to region `r // region_size`. Rooms are looked up
+        by id as in a RoomCache; the least recently used region leaves
+        memory with all of its rooms.
+
+        Args:
+            region_size (int): The number of room ids in a region.
+            capacity (int, optional): The most regions kept in memory.
+            Defaults to None, which never evicts.
+            load (optional): Called with a region id when the region comes
+            into memory; returns the Region (default is None, which starts
+            an empty one).
+            evict (optional): Called with the region id and the Region
+            whenever a region leaves the cache (default is None).
+
+        Returns:
+            None
+        """
+        self.region_size = region_size
+        self.load = load
+        self.regions = RoomCache(capacity, evict)
+
+    def __len__(self) -> int:
+        return sum(len(region.rooms)
+                   for region in self.regions.rooms.values())
+
+    def __contains__(self, room_id: int) -> bool:
+        region = self.regions.rooms.get(self.region_of(room_id))
+        return region is not None and room_id in region.rooms
+
+    def __getitem__(self, room_id: int):
+        return self.regions[self.region_of(room_id)].rooms[room_id]
+
+    @property
+    def evictions(self) -> int:
+        """
+        int: The number of regions evicted.
+        """
+        return self.regions.evictions
+
+    @property
+    def faults(self) -> int:
+        """
+        int: The number of regions restored from disk.
+        """
+        return self.regions.faults
+
+    def region_of(self, room_id: int) -> int:
+        """
+        Return the region of a room.
+
+        Args:
+            room_id (int): The id of the room.
+
+        Returns:
+            int: The id of the region.
+        """
+        return room_id // self.region_size
+
+    def region(self, room_id: int) -> Region:
+        """
+        Return the region of a room, bringing it into memory if needed.
+
+        Args:
+            room_id (int): The id of a room of the region.
+
+        Returns:
+            Region: The region, marked as the most recently used.
+        """
+        region_id = self.region_of(room_id)
+        region = self.regions.get(region_id)
+        if region is None:
+            region = self.load(region_id) if self.load else None
+            if region is None:
+                region = Region()
+            elif region.states:
+                self.regions.faults += 1
+            self.regions.put(region_id, region)
+        return region
+
+    def stats(self) -> dict:
+        """
+        Return the counters of the cache.
+
+        Args:
+            None
+
+        Returns:
+            dict: The counters of the region cache (see RoomCache.stats)
+            and the number of rooms in memory.
+        """
+        stats = self.regions.stats()
+        stats['rooms'] = len(self)
+        return stats
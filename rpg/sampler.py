@@ -0,0 +1,131 @@
+_MASK = (1 << 64) - 1
+
+# Rounds of the Feistel network behind IndexPermutation
+_ROUNDS = 4
+
+
+def derive_seed(*values: int) -> int:
+    """
+    Mix integers into a 64 bit seed.
+
+    Every value goes through the SplitMix64 finalizer, so seeds of
+    neighbouring rooms are unrelated and the result is the same on every
+    platform and Python version.
+
+    Args:
+        *values (int): The values to mix, for example a world seed, a room
+        id and a stream number.
+
+    Returns:
+        int: The derived seed.
+    """
+    state = 0
+    for value in values:
+        state = (state ^ value) & _MASK
+        state = (state + 0x9E3779B97F4A7C15) & _MASK
+        state = ((state ^ (state >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+        state = ((state ^ (state >> 27)) * 0x94D049BB133111EB) & _MASK
+        state ^= state >> 31
+    return state
+
+
+class IndexPermutation:
+    def __init__(self, size: int, seed: int) -> None:
+        """
+        Initialize a seeded shuffle of the indexes of a pool.
+
+        Position `p` maps to an index of the pool so that every run of
+        `size` consecutive positions starting at a multiple of `size` visits
+        each index exactly once, in a different order for every run. It is
+        a shuffle-bag that never stores the shuffled order: each index is
+        computed in O(1) with a small Feistel network over the next power
+        of two, walking the cycle until it lands inside the pool.
+
+        Since an index only depends on the seed and the position, any
+        position can be looked up in any order, from any thread.
+
+        Args:
+            size (int): The number of entries in the pool, at least one.
+            seed (int): The seed of the shuffle.
+
+        Returns:
+            None
+        """
+        if size < 1:
+            raise ValueError("Cannot shuffle an empty pool")
+        self.size = size
+        self.seed = seed
+        bits = max(2, (size - 1).bit_length())
+        self.half = (bits + 1) // 2
+        self.mask = (1 << self.half) - 1
+        self._cached = (None, ())
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, position: int) -> int:
+        epoch, index = divmod(position, self.size)
+        keys = self._round_keys(epoch)
+        # The network permutes a range at most four times the pool, so the
+        # walk takes a few steps at most on average
+        while True:
+            index = self._permute(index, keys)
+            if index < self.size:
+                return index
+
+    def _round_keys(self, epoch: int) -> tuple:
+        # Positions are mostly looked up in order, so the keys of the
+        # latest pass are kept
+        cached_epoch, keys = self._cached
+        if cached_epoch != epoch:
+            keys = tuple(
+                derive_seed(self.seed, epoch, round_number)
+                for round_number in range(_ROUNDS)
+            )
+            self._cached = (epoch, keys)
+        return keys
+
+    def _permute(self, value: int, keys: tuple) -> int:
+        left = value >> self.half
+        right = value & self.mask
+        for key in keys:
+            left, right = right, left ^ (derive_seed(key ^ right) & self.mask)
+        return (left << self.half) | right
+
+
+class ShuffleBag:
+    def __init__(self, items: list, seed: int) -> None:
+        """
+        Initialize a bag that hands out the items of a list in a shuffled
+        order, without repeating one until all were drawn.
+
+        The list is neither copied nor changed; the bag only counts how
+        many items it handed out.
+
+        Args:
+            items (list): The items to draw from.
+            seed (int): The seed of the shuffle.
+
+        Returns:
+            None
+        """
+        self.items = items
+        self.drawn = 0
+        self.order = IndexPermutation(len(items), seed) if items else None
+
+    def draw(self, default=None):
+        """
+        Draw the next item.
+
+        Args:
+            default (optional): Returned if there are no items
+            (default is None).
+
+        Returns:
+            The item, or the default.
+        """
+        if self.order is None:
+            return default
+        item = self.items[self.order[self.drawn]]
+        self.drawn += 1
+        return item
@@ -1,7 +1,14 @@
 import json
 import os
-import random
 from .enemy import Enemy
+from .combat import (
+    ATTACK, DEFEND, HEAL, RUN, TUTORIAL_RULES, CombatState, resolve,
+    Attacked, Braced, Healed, HealRefused, EnemyAttacked, Rescued, Fled,
+    EnemyDefeated, PlayerDefeated
+)
+
+# Tutorial combat menu choices
+TUTORIAL_ACTIONS = {'0': ATTACK, '1': DEFEND, '2': HEAL, '3': RUN}
 
 
 class StartingRoom:
@@ -126,59 +133,45 @@ class StartingRoom:
             print(" (3) Run Away - Lose 50% health, escape the fight.")
 
             choice = input("Select an action by number: ")
+            action = TUTORIAL_ACTIONS.get(choice)
+            if action is None:
+                print("Invalid choice. Please select a valid action.")
+                continue  # Skip enemy's attack
 
-            is_defending = False  # Reset defending status each turn
+            state, events = resolve(CombatState(
+                self.health, 10, self.action_count,
+                dummy_enemy.health, dummy_enemy.damage
+            ), action, TUTORIAL_RULES)
+            self.health = state.health
+            self.action_count = state.action_count
+            dummy_enemy.health = state.enemy_health
 
-            if choice == '0':
-                damage_dealt = 10
-                print(f"\nYou attack {dummy_enemy.name} \
-                      for {damage_dealt} damage!")
-                dummy_enemy.health -= damage_dealt
-                self.action_count += 1
-                if dummy_enemy.health <= 0:
+            for event in events:
+                if isinstance(event, Attacked):
+                    print(f"\nYou attack {dummy_enemy.name} \
+                      for {event.damage} damage!")
+                elif isinstance(event, EnemyDefeated):
                     print(f"You defeated {dummy_enemy.name}!")
                     self.defeated = True
-                    break
-            elif choice == '1':
-                print("You brace yourself for the next attack.")
-                is_defending = True
-                self.action_count += 1
-            elif choice == '2':
-                if self.action_count >= 3:
-                    heal_amount = random.randint(7, 15)
-                    self.health = min(self.health + heal_amount, 100)
-                    print(f"\nYou heal yourself for {heal_amount} health!\
-                           Current health: {self.health}.")
-                    self.action_count = 0
-                else:
+                elif isinstance(event, Braced):
+                    print("You brace yourself for the next attack.")
+                elif isinstance(event, Healed):
+                    print(f"\nYou heal yourself for {event.amount} health!\
+                           Current health: {event.health}.")
+                elif isinstance(event, HealRefused):
                     print("\nYou cannot heal again in this combat!")
-            elif choice == '3':
-                print("\nCome oooonn! You can do better than that!")
-                self.health = max(self.health // 2, 1)
-                return
-            else:
-                print("Invalid choice. Please select a valid action.")
-                continue  # Skip enemy's attack
-
-            # Enemy's turn
-            if dummy_enemy.health > 0:
-                if is_defending:
-                    damage_received = max(dummy_enemy.damage // 2, 0)
+                elif isinstance(event, Fled):
+                    print("\nCome oooonn! You can do better than that!")
+                elif isinstance(event, EnemyAttacked):
                     print(f"{dummy_enemy.name} attacks\
-                           you for {damage_received} damage!")
-                    self.health -= damage_received
-                else:
-                    print(f"{dummy_enemy.name} attacks\
-                           you for {dummy_enemy.damage} damage!")
-                    self.health -= dummy_enemy.damage
-
-                if self.health <= 0:
+                           you for {event.damage} damage!")
+                elif isinstance(event, PlayerDefeated):
                     print("You have been defeated by the Training Dummy!")
-                    break
-
-                if self.health <= 50:
+                elif isinstance(event, Rescued):
                     print("You are losing! I'll restore your health to 100.")
-                    self.health = 100
+
+            if state.outcome is not None:
+                break
 
     def try_open_door(self) -> bool:
         """
@@ -0,0 +1,134 @@
+class TravelIndex:
+    def __init__(self) -> None:
+        """
+        Initialize an index of the shortest paths between explored rooms.
+
+        Every room of a world lies behind exactly one door, so the explored
+        rooms form a tree rooted at the room the player started in. The
+        index is that tree as built by a breadth first search: each room
+        keeps the room it was entered from and its distance from the start.
+        Exploring a room extends the tree in O(1), and a route between two
+        rooms climbs from both ends to their closest common room, which
+        takes time proportional to the length of the route rather than the
+        size of the map.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.parent = {}
+        self.depth = {}
+        self.names = {}
+
+    def __len__(self) -> int:
+        return len(self.depth)
+
+    def __contains__(self, room_key) -> bool:
+        return room_key in self.depth
+
+    def __iter__(self):
+        return iter(self.depth)
+
+    def visit(self, room_key, from_key=None, name: str = None) -> None:
+        """
+        Add an explored room to the index.
+
+        A room is added once; the way it was first reached is the shortest
+        one. Rooms entered from a room that is not in the index start a new
+        tree.
+
+        Args:
+            room_key: The id of the room (or its name outside a world).
+            from_key (optional): The room it was entered from (default is
+            None, for the starting room).
+            name (str, optional): The name shown for the room. Defaults to
+            None, which uses the key.
+
+        Returns:
+            None
+        """
+        if room_key in self.depth:
+            return
+        if from_key in self.depth:
+            self.parent[room_key] = from_key
+            self.depth[room_key] = self.depth[from_key] + 1
+        else:
+            self.parent[room_key] = None
+            self.depth[room_key] = 0
+        self.names[room_key] = str(room_key) if name is None else name
+
+    def name(self, room_key) -> str:
+        """
+        Return the name shown for an explored room.
+
+        Args:
+            room_key: The id of the room.
+
+        Returns:
+            str: The name of the room.
+        """
+        return self.names[room_key]
+
+    def route(self, start_key, end_key) -> list:
+        """
+        Find the shortest route between two explored rooms.
+
+        Args:
+            start_key: The room to start from.
+            end_key: The room to travel to.
+
+        Returns:
+            list: The rooms on the route, both ends included, or None if
+            either room is unexplored or they are not connected.
+        """
+        if start_key not in self.depth or end_key not in self.depth:
+            return None
+        up = []
+        down = []
+        start, end = start_key, end_key
+        while self.depth[start] > self.depth[end]:
+            start = self.parent[start]
+            up.append(start)
+        while self.depth[end] > self.depth[start]:
+            down.append(end)
+            end = self.parent[end]
+        while start != end:
+            if self.parent[start] is None:
+                return None
+            down.append(end)
+            start = self.parent[start]
+            end = self.parent[end]
+            up.append(start)
+        return [start_key] + up + down[::-1]
+
+    def to_list(self) -> list:
+        """
+        Convert the index into a JSON serializable list.
+
+        Args:
+            None
+
+        Returns:
+            list: The explored rooms in the order they were first entered,
+            each as [room key, the room it was entered from, name].
+        """
+        return [[key, self.parent[key], self.names[key]]
+                for key in self.depth]
+
+    @classmethod
+    def from_list(cls, rooms: list) -> 'TravelIndex':
+        """
+        Create an index from a list made by to_list.
+
+        Args:
+            rooms (list): The explored rooms.
+
+        Returns:
+            TravelIndex: The index.
+        """
+        index = cls()
+        for key, from_key, name in rooms:
+            index.visit(key, from_key, name)
+        return index
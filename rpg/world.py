@@ -0,0 +1,715 @@
+import random
+import threading
+from array import array
+from .door import door
+from .room import room
+from .content import get_registry
+from .npc import npc, Trader
+from .room_cache import Region, RegionCache, RoomStore
+from .sampler import IndexPermutation, derive_seed
+
+START_ROOM_ID = 0
+
+# Room ids per region, the unit rooms are cached and paged out in
+REGION_SIZE = 16
+
+# Separate random streams of a room, so drawing one part of a room does not
+# depend on how many random numbers another part used
+ROOM_STREAM = 0
+DOOR_STREAM = 1
+NPC_STREAM = 2
+
+# Values of the index columns that do not point into the content
+UNSET = -1
+NONE = -2
+ALL_TRADERS = -3
+
+# Bits of the flags column
+LOOTED = 1
+FOUGHT = 2
+FLAGS = {'looted': LOOTED, 'fought': FOUGHT}
+
+# The columns a saved world is rebuilt from
+SAVED_COLUMNS = ('description_index', 'trader_index', 'flags', 'door_start',
+                 'door_count', 'entry_door')
+
+
+class RoomLink:
+    """
+    A door's reference to a room of a world.
+
+    The world owns its rooms; a link only holds the room id, so rooms that
+    are dropped from memory are rebuilt the next time a door leads to them.
+    """
+    __slots__ = ('world', 'room_id')
+
+    def __init__(self, world: 'World', room_id: int) -> None:
+        """
+        Initialize a RoomLink.
+
+        Args:
+            world (World): The world the room belongs to.
+            room_id (int): The id of the room.
+
+        Returns:
+            None
+        """
+        self.world = world
+        self.room_id = room_id
+
+    @property
+    def explored(self) -> bool:
+        """
+        bool: Whether the room has ever been built for the game, not only
+        pre-generated.
+        """
+        return self.world.description_index[self.room_id] != UNSET
+
+    def resolve(self) -> room:
+        """
+        Return the room, building it if it is not in memory.
+
+        Args:
+            None
+
+        Returns:
+            room: The room.
+        """
+        return self.world.room(self.room_id)
+
+
+class WorldRoom(room):
+    def __init__(self, world: 'World', room_id: int) -> None:
+        """
+        Initialize a view of one room of a world.
+
+        The description, trader and doors are read from the world's
+        columns whenever they are used; only the NPCs, drawn from the
+        room's NPC stream, are kept in the view.
+
+        Args:
+            world (World): The world the room belongs to.
+            room_id (int): The id of the room.
+
+        Returns:
+            None
+        """
+        self.world = world
+        self.room_id = room_id
+        self.content = world.content_of(room_id)
+        self.seed = world.room_seed(room_id)
+        if room_id == START_ROOM_ID:
+            self.name = "Starting room"
+        else:
+            self.name = f"Room {room_id}"
+        self.items = []
+        self.characters = []
+        self.monsters = []
+        self.locked = False
+        # Changes players made that the world's flags cannot hold
+        self.changes = {}
+        self.npcs = []
+        self._traders = None
+        self.initialize_npcs(
+            random.Random(world.room_seed(room_id, NPC_STREAM))
+        )
+
+    @property
+    def description(self) -> str:
+        """
+        str: The description of the room.
+        """
+        return self.world.description(self.room_id)
+
+    @property
+    def traders(self) -> list:
+        """
+        list: The traders in the room, built on first use.
+        """
+        if self._traders is None:
+            self._traders = self.world.traders(self.room_id)
+        return self._traders
+
+    @property
+    def doors(self) -> dict:
+        """
+        dict: The doors of the room by name, empty until they are
+        discovered.
+        """
+        return self.world.doors(self.room_id)
+
+    def page_out(self) -> dict:
+        """
+        Return what players changed in the room that cannot be rebuilt
+        from the world.
+
+        Args:
+            None
+
+        Returns:
+            dict: The JSON serializable state, empty if nothing changed.
+        """
+        return dict(self.changes)
+
+    def page_in(self, state: dict) -> None:
+        """
+        Restore the state returned by page_out.
+
+        Args:
+            state (dict): The stored state of the room.
+
+        Returns:
+            None
+        """
+        self.changes = dict(state)
+
+    def initialize_npcs(self, rng=random) -> None:
+        """
+        Initialize a random number of NPCs in the room (0 to 3). The trader
+        of the room is stored by its world.
+
+        Args:
+            rng (optional): The random number source
+            (default is the random module).
+
+        Returns:
+            None
+        """
+        content = self.content
+        num_npcs = rng.randint(0, 3)
+        for npc_info in rng.sample(content.npcs,
+                                   min(num_npcs, len(content.npcs))):
+            self.npcs.append(npc(
+                name=npc_info['name'],
+                description=npc_info['description'],
+                dialogues=content.dialogue_graph(npc_info)
+            ))
+
+
+class World:
+    def __init__(
+            self,
+            seed: int = None,
+            content=None,
+            cache_size: int = None,
+            store: RoomStore = None,
+            region_size: int = REGION_SIZE
+            ) -> None:
+        """
+        Initialize a World of rooms generated from a seed.
+
+        A room's description, NPCs, trader and doors are a pure function of
+        the world seed and the room id. Only what cannot be derived is
+        stored: which room id lies behind each door, handed out in the
+        order doors are discovered, and the changes players made to rooms.
+        Rooms kept in memory are therefore only a cache; any of them can be
+        released and is rebuilt identically on its next use.
+
+        The world itself is a set of typed columns indexed by room id, a
+        few bytes per room:
+
+            description_index  the room description, UNSET until the game
+                               first uses the room
+            trader_index       the room's trader, NONE or ALL_TRADERS
+            flags              what players changed (LOOTED, FOUGHT)
+            content_version    the content version the room is built from
+            door_start         the id behind the room's first door, UNSET
+                               until its doors are discovered
+            door_count         how many doors the room has
+            entry_door         the description of the door leading in
+
+        The rooms behind the doors of one room get consecutive ids, so
+        door `i` of room `r` leads to room `door_start[r] + i`, which makes
+        the columns a compressed adjacency list of the world.
+
+        Built rooms are kept in a RegionCache, by regions of
+        `region_size` consecutive room ids. Rooms are discovered a door set
+        at a time, so a region holds rooms close to each other. When the
+        cache is bounded, the least recently used region is evicted with
+        all of its rooms; whatever players changed in them is paged out to
+        a RoomStore on disk as one row, and restored in one read when any
+        room of the region is needed again.
+
+        Args:
+            seed (int, optional): The world seed. Defaults to None, which
+                picks a random seed.
+            content (ContentRegistry, optional): The content version to
+                build rooms from until `content` is set to a newer one.
+                Defaults to the current registry.
+            cache_size (int, optional): The most rooms kept in memory,
+                rounded up to whole regions. Defaults to None, which keeps
+                every built room.
+            store (RoomStore, optional): Where evicted regions are paged
+                out to. Defaults to a temporary store created when first
+                needed.
+            region_size (int, optional): The number of room ids in a
+                region (default is REGION_SIZE).
+
+        Returns:
+            None
+        """
+        self.seed = random.getrandbits(64) if seed is None else seed
+        # The content versions rooms were created with, oldest first
+        self.versions = []
+        self._content = content if content is not None else get_registry()
+        capacity = None
+        if cache_size is not None:
+            capacity = max(1, -(-cache_size // region_size))
+        self.rooms = RegionCache(
+            region_size, capacity, self._page_in, self._page_out
+        )
+        self.store = store
+        # Rooms may be built by pre-generation threads
+        self.lock = threading.RLock()
+        # Shuffles of the content pools by stream and pool size, and the
+        # next position of each shuffle to hand out
+        self.samplers = {}
+        self.positions = {}
+        self.description_index = array('i')
+        self.trader_index = array('i')
+        self.flags = array('B')
+        self.content_version = array('I')
+        self.door_start = array('q')
+        self.door_count = array('B')
+        self.entry_door = array('i')
+        self.allocate(1)
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+    @property
+    def content(self):
+        """
+        ContentRegistry: The content version new rooms are created with.
+        Setting it leaves the rooms that already exist on the version they
+        were created with, so their descriptions, doors and traders do not
+        change. A version is only kept once a room is created with it.
+        """
+        return self._content
+
+    @content.setter
+    def content(self, content) -> None:
+        with self.lock:
+            self._content = content
+
+    def content_of(self, room_id: int):
+        """
+        Return the content version a room is built from.
+
+        Args:
+            room_id (int): The id of the room.
+
+        Returns:
+            ContentRegistry: The version that was current when the room was
+            created.
+        """
+        return self.versions[self.content_version[room_id]]
+
+    def allocate(self, count: int) -> int:
+        """
+        Add rooms to the world.
+
+        Args:
+            count (int): The number of rooms to add.
+
+        Returns:
+            int: The id of the first new room; the others follow it.
+        """
+        first = len(self.flags)
+        if not self.versions or self.versions[-1] is not self._content:
+            self.versions.append(self._content)
+        self.description_index.extend([UNSET] * count)
+        self.trader_index.extend([UNSET] * count)
+        self.flags.extend(bytes(count))
+        self.content_version.extend([len(self.versions) - 1] * count)
+        self.door_start.extend([UNSET] * count)
+        self.door_count.extend(bytes(count))
+        self.entry_door.extend([NONE] * count)
+        return first
+
+    def room_seed(self, room_id: int, stream: int = ROOM_STREAM) -> int:
+        """
+        Return the seed of one random stream of a room.
+
+        Args:
+            room_id (int): The id of the room.
+            stream (int, optional): The stream (default is ROOM_STREAM).
+
+        Returns:
+            int: The seed.
+        """
+        return derive_seed(self.seed, room_id, stream)
+
+    def room(self, room_id: int, assign: bool = True) -> room:
+        """
+        Return a room, building it if it is not in memory.
+
+        Args:
+            room_id (int): The id of the room.
+            assign (bool, optional): Whether to draw the room's description
+                if it has none yet. Descriptions are handed out in the order
+                the game uses rooms, so only the game's own thread may draw
+                them (default is True).
+
+        Returns:
+            room: The room.
+        """
+        with self.lock:
+            region = self.rooms.region(room_id)
+            built = region.rooms.get(room_id)
+            if built is None:
+                state = region.states.pop(room_id, None)
+                built = self.generate(room_id, state)
+                region.rooms[room_id] = built
+            if assign and self.description_index[room_id] == UNSET:
+                pool = len(self.content_of(room_id).room_descriptions)
+                self.description_index[room_id] = self.sample(
+                    ROOM_STREAM, pool
+                )
+            return built
+
+    def generate(self, room_id: int, state: dict = None) -> room:
+        """
+        Build a view of a room, drawing its trader the first time.
+
+        Args:
+            room_id (int): The id of the room.
+            state (dict, optional): The state the room was paged out with
+                (default is None).
+
+        Returns:
+            room: A new room object.
+        """
+        if self.trader_index[room_id] == UNSET:
+            rng = random.Random(self.room_seed(room_id))
+            traders = self.content_of(room_id).traders
+            if room_id == START_ROOM_ID:
+                self.trader_index[room_id] = ALL_TRADERS
+            else:
+                self.trader_index[room_id] = (
+                    rng.randrange(len(traders)) if traders else NONE
+                )
+        built = WorldRoom(self, room_id)
+        if state is not None:
+            built.page_in(state)
+        return built
+
+    def release(self, room_id: int) -> bool:
+        """
+        Drop a room from memory. It is rebuilt on its next use.
+
+        Args:
+            room_id (int): The id of the room.
+
+        Returns:
+            bool: True if the room was in memory.
+        """
+        with self.lock:
+            if room_id not in self.rooms:
+                return False
+            region = self.rooms.region(room_id)
+            state = region.rooms.pop(room_id).page_out()
+            if state:
+                region.states[room_id] = state
+            return True
+
+    def _page_in(self, region_id: int) -> Region:
+        if self.store is None:
+            return None
+        stored = self.store.load(region_id)
+        if stored is None:
+            return None
+        # JSON keys are strings
+        return Region({
+            int(room_id): state for room_id, state in stored.items()
+        })
+
+    def _states(self, region: Region) -> dict:
+        states = dict(region.states)
+        for room_id, built in region.rooms.items():
+            state = built.page_out()
+            if state:
+                states[room_id] = state
+        return states
+
+    def _page_out(self, region_id: int, region: Region) -> None:
+        states = self._states(region)
+        if states:
+            if self.store is None:
+                self.store = RoomStore()
+            self.store.save(region_id, states)
+
+    def description(self, room_id: int) -> str:
+        """
+        Return the description of a built room.
+
+        Args:
+            room_id (int): The id of the room.
+
+        Returns:
+            str: The description.
+        """
+        index = self.description_index[room_id]
+        descriptions = self.content_of(room_id).room_descriptions
+        if 0 <= index < len(descriptions):
+            return descriptions[index]
+        return "An empty room."
+
+    def traders(self, room_id: int) -> list:
+        """
+        Build the traders of a built room.
+
+        Args:
+            room_id (int): The id of the room.
+
+        Returns:
+            list: New Trader objects.
+        """
+        index = self.trader_index[room_id]
+        content = self.content_of(room_id)
+        traders = content.traders
+        if index == ALL_TRADERS:
+            selected = traders
+        elif 0 <= index < len(traders):
+            selected = [traders[index]]
+        else:
+            selected = []
+        return [
+            Trader.from_dict(trader, content.dialogue_graph(trader))
+            for trader in selected
+        ]
+
+    def neighbours(self, room_id: int) -> range:
+        """
+        Return the ids of the rooms behind the doors of a room.
+
+        Args:
+            room_id (int): The id of the room.
+
+        Returns:
+            range: The ids, empty if the doors are not discovered yet.
+        """
+        start = self.door_start[room_id]
+        if start == UNSET:
+            return range(0)
+        return range(start, start + self.door_count[room_id])
+
+    def doors(self, room_id: int) -> dict:
+        """
+        Build the doors of a room from the world's columns.
+
+        Args:
+            room_id (int): The id of the room.
+
+        Returns:
+            dict: New door objects by name, empty if the doors are not
+            discovered yet.
+        """
+        doors = {}
+        for i, destination_id in enumerate(self.neighbours(room_id)):
+            door_name = f"Door {i + 1}"
+            index = self.entry_door[destination_id]
+            # A door is drawn with the room behind it
+            descriptions = self.content_of(destination_id).door_descriptions
+            if 0 <= index < len(descriptions):
+                door_description = descriptions[index]
+            else:
+                door_description = "A simple door."
+            doors[door_name] = door(
+                name=door_name, description=door_description,
+                destination=RoomLink(self, destination_id)
+            )
+        return doors
+
+    def add_doors(self, target: room) -> None:
+        """
+        Discover the doors of a room of this world.
+
+        Args:
+            target (room): The room to add doors to.
+
+        Returns:
+            None
+        """
+        self.discover(target.room_id)
+
+    def discover(self, room_id: int) -> None:
+        """
+        Discover the doors of a room, without building any room object.
+
+        How many doors a room has and how they look is drawn from the
+        room's door stream. The rooms behind them get fresh ids the first
+        time; discovering the doors again changes nothing.
+
+        Args:
+            room_id (int): The id of the room.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            if self.door_start[room_id] == UNSET:
+                self._discover(room_id)
+
+    def _discover(self, room_id: int) -> None:
+        rng = random.Random(self.room_seed(room_id, DOOR_STREAM))
+        num_doors = rng.randint(2, 4)
+        pool = len(self.content.door_descriptions)
+
+        first = self.allocate(num_doors)
+        self.door_start[room_id] = first
+        self.door_count[room_id] = num_doors
+        for destination_id in range(first, first + num_doors):
+            self.entry_door[destination_id] = self.sample(DOOR_STREAM, pool)
+
+    def sample(self, stream: int, pool: int) -> int:
+        """
+        Hand out the next entry of a content pool.
+
+        Entries come from a per-world shuffle of the pool, one position at
+        a time in the order they are handed out, so no entry repeats until
+        the pool is used up by rooms the player actually sees. The result
+        is stored in the room's column, which keeps rebuilding a room
+        independent of the order rooms are built in.
+
+        Args:
+            stream (int): The stream the pool belongs to.
+            pool (int): The number of entries in the pool.
+
+        Returns:
+            int: The index of the entry, or NONE if the pool is empty.
+        """
+        if pool == 0:
+            return NONE
+        key = (stream, pool)
+        permutation = self.samplers.get(key)
+        if permutation is None:
+            permutation = IndexPermutation(
+                pool, derive_seed(self.seed, stream)
+            )
+            self.samplers[key] = permutation
+        position = self.positions.get(key, 0)
+        self.positions[key] = position + 1
+        return permutation[position]
+
+    def record(self, room_id: int, change: str, value=True) -> None:
+        """
+        Remember a change a player made to a room.
+
+        Changes with a flag ('looted', 'fought') are kept in the flags
+        column. Any other change is kept by the room itself and paged out
+        with its region.
+
+        Args:
+            room_id (int): The id of the room.
+            change (str): What changed, for example 'looted' or 'fought'.
+            value (optional): The new value, JSON serializable unless the
+            change has a flag (default is True).
+
+        Returns:
+            None
+        """
+        flag = FLAGS.get(change)
+        with self.lock:
+            if flag is not None and isinstance(value, bool):
+                if value:
+                    self.flags[room_id] |= flag
+                else:
+                    self.flags[room_id] &= ~flag & 0xFF
+            else:
+                self.room(room_id).changes[change] = value
+
+    def changes(self, room_id: int) -> dict:
+        """
+        Return the changes players made to a room.
+
+        Args:
+            room_id (int): The id of the room.
+
+        Returns:
+            dict: The recorded changes, empty if there are none.
+        """
+        changes = {
+            change: True for change, flag in FLAGS.items()
+            if self.flags[room_id] & flag
+        }
+        # A room that was never built has no other changes
+        if self.trader_index[room_id] != UNSET:
+            changes.update(self.room(room_id).changes)
+        return changes
+
+    def to_dict(self) -> dict:
+        """
+        Convert the world into a JSON serializable dictionary.
+
+        Only what cannot be derived from the seed is saved: the columns,
+        how far each content shuffle was handed out, and the changes kept
+        by rooms, whether they are in memory or paged out.
+
+        Args:
+            None
+
+        Returns:
+            dict: The saved world.
+        """
+        with self.lock:
+            changes = {}
+            for region_id in range(self.rooms.region_of(len(self) - 1) + 1):
+                region = self.rooms.regions.rooms.get(region_id)
+                if region is not None:
+                    states = self._states(region)
+                elif self.store is not None:
+                    states = self.store.peek(region_id) or {}
+                else:
+                    states = {}
+                for room_id, state in states.items():
+                    changes[str(room_id)] = state
+            return {
+                'seed': self.seed,
+                'columns': {
+                    name: getattr(self, name).tolist()
+                    for name in SAVED_COLUMNS
+                },
+                'positions': [
+                    [stream, pool, position]
+                    for (stream, pool), position in self.positions.items()
+                ],
+                'changes': changes
+            }
+
+    def restore(self, world_data: dict) -> None:
+        """
+        Replace the world with one saved by to_dict.
+
+        Every room is dropped from memory and from the store. The restored
+        rooms are built from the world's current content version.
+
+        Args:
+            world_data (dict): The saved world.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.seed = world_data['seed']
+            columns = world_data['columns']
+            for name in SAVED_COLUMNS:
+                typecode = getattr(self, name).typecode
+                setattr(self, name, array(typecode, columns[name]))
+            self.versions = [self.content]
+            self.content_version = array('I', [0]) * len(self)
+            self.samplers = {}
+            self.positions = {
+                (stream, pool): position
+                for stream, pool, position in world_data['positions']
+            }
+            self.rooms = RegionCache(
+                self.rooms.region_size, self.rooms.regions.capacity,
+                self._page_in, self._page_out
+            )
+            if self.store is not None:
+                self.store.close()
+                self.store = None
+            for room_id, state in world_data['changes'].items():
+                room_id = int(room_id)
+                self.rooms.region(room_id).states[room_id] = dict(state)
@@ -0,0 +1,65 @@
+from rpg.sampler import IndexPermutation, ShuffleBag
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestIndexPermutation(unittest.TestCase):
+
+    def test_every_index_once_per_pass(self):
+        """
+        Test that each pass over the pool visits every index once.
+        """
+        for size in [1, 2, 3, 17, 106, 1000]:
+            permutation = IndexPermutation(size, 42)
+            first = [permutation[position] for position in range(size)]
+            second = [permutation[position]
+                      for position in range(size, 2 * size)]
+            self.assertEqual(sorted(first), list(range(size)))
+            self.assertEqual(sorted(second), list(range(size)))
+
+    def test_passes_and_seeds_differ(self):
+        """
+        Test that passes and seeds shuffle the pool differently.
+        """
+        permutation = IndexPermutation(106, 1)
+        first = [permutation[position] for position in range(106)]
+        second = [permutation[position] for position in range(106, 212)]
+        other = [IndexPermutation(106, 2)[position]
+                 for position in range(106)]
+        self.assertNotEqual(first, second)
+        self.assertNotEqual(first, other)
+        self.assertNotEqual(first, list(range(106)))
+
+    def test_empty_pool(self):
+        """
+        Test that an empty pool cannot be shuffled.
+        """
+        with self.assertRaises(ValueError):
+            IndexPermutation(0, 1)
+
+
+class TestShuffleBag(unittest.TestCase):
+
+    def test_no_repeats_until_exhausted(self):
+        """
+        Test that a bag hands out every item before repeating one.
+        """
+        items = [f"Door {number}" for number in range(10)]
+        bag = ShuffleBag(items, 7)
+        drawn = [bag.draw() for _ in range(10)]
+        self.assertEqual(sorted(drawn), sorted(items))
+        self.assertEqual(items, [f"Door {number}" for number in range(10)])
+        self.assertIn(bag.draw(), items)
+
+    def test_empty_bag(self):
+        """
+        Test that an empty bag hands out the default.
+        """
+        self.assertEqual(ShuffleBag([], 7).draw("A simple door."),
+                         "A simple door.")
+
+
+if __name__ == '__main__':
+    unittest.main()
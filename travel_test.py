@@ -0,0 +1,62 @@
+from rpg.travel import TravelIndex
+import unittest
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+class TestTravelIndex(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up an index of a small explored tree.
+
+            0 -> 1 -> 3 -> 5
+            0 -> 2 -> 4
+        """
+        self.index = TravelIndex()
+        self.index.visit(0, name="Starting room")
+        for room_id, from_id in [(1, 0), (2, 0), (3, 1), (4, 2), (5, 3)]:
+            self.index.visit(room_id, from_id, f"Room {room_id}")
+
+    def test_routes(self):
+        """
+        Test that routes go through the closest common room.
+        """
+        self.assertEqual(self.index.route(5, 4), [5, 3, 1, 0, 2, 4])
+        self.assertEqual(self.index.route(4, 5), [4, 2, 0, 1, 3, 5])
+        self.assertEqual(self.index.route(5, 1), [5, 3, 1])
+        self.assertEqual(self.index.route(0, 5), [0, 1, 3, 5])
+        self.assertEqual(self.index.route(3, 3), [3])
+
+    def test_first_visit_is_kept(self):
+        """
+        Test that visiting a room again does not change its route.
+        """
+        self.index.visit(5, 4)
+        self.assertEqual(self.index.route(0, 5), [0, 1, 3, 5])
+        self.assertEqual(len(self.index), 6)
+        self.assertEqual(self.index.name(0), "Starting room")
+
+    def test_unknown_rooms(self):
+        """
+        Test that there is no route to unexplored or unconnected rooms.
+        """
+        self.assertIsNone(self.index.route(0, 9))
+        self.index.visit(7, 8)
+        self.assertIn(7, self.index)
+        self.assertIsNone(self.index.route(7, 0))
+
+    def test_long_route(self):
+        """
+        Test that a deep route is found by walking it once.
+        """
+        index = TravelIndex()
+        index.visit(0)
+        for room_id in range(1, 10000):
+            index.visit(room_id, room_id - 1)
+        self.assertEqual(index.route(9999, 0), list(range(9999, -1, -1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
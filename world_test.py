@@ -0,0 +1,307 @@
+from rpg.world import World, derive_seed, START_ROOM_ID
+from rpg.content import ContentRegistry, get_registry
+from rpg.player import player
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+def snapshot(built):
+    """
+    Summarize everything generated about a room.
+    """
+    return (
+        built.name,
+        built.description,
+        [character.name for character in built.npcs],
+        [trader.name for trader in built.traders],
+        [(name, door.description, door._destination.room_id)
+         for name, door in built.doors.items()],
+    )
+
+
+class TestWorld(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a world with a fixed seed and explore two levels of it.
+        """
+        self.world = World(seed=42)
+        start = self.world.room(START_ROOM_ID)
+        start.add_doors([])
+        self.first = start.doors["Door 1"].destination
+        self.first.add_doors([])
+
+    def test_derive_seed(self):
+        """
+        Test that derived seeds are stable and differ between inputs.
+        """
+        self.assertEqual(derive_seed(1, 2), derive_seed(1, 2))
+        self.assertNotEqual(derive_seed(1, 2), derive_seed(2, 1))
+        self.assertNotEqual(derive_seed(1, 2), derive_seed(1, 3))
+
+    def test_same_seed_same_world(self):
+        """
+        Test that two worlds with one seed generate the same rooms.
+        """
+        other = World(seed=42)
+        other.room(START_ROOM_ID).add_doors([])
+        first = other.room(self.first.room_id)
+        first.add_doors([])
+        self.assertEqual(snapshot(first), snapshot(self.first))
+
+    def test_release_and_regenerate(self):
+        """
+        Test that a released room is rebuilt identically, doors included.
+        """
+        before = snapshot(self.first)
+        self.assertTrue(self.world.release(self.first.room_id))
+        rebuilt = self.world.room(self.first.room_id)
+        self.assertIsNot(rebuilt, self.first)
+        self.assertEqual(snapshot(rebuilt), before)
+
+    def test_doors_do_not_keep_rooms(self):
+        """
+        Test that a door leads to the world's current copy of a room.
+        """
+        door = self.world.room(START_ROOM_ID).doors["Door 1"]
+        self.world.release(self.first.room_id)
+        self.assertIs(door.destination,
+                      self.world.rooms[self.first.room_id])
+
+    def test_distinct_ids(self):
+        """
+        Test that every door leads to a room with its own id and name.
+        """
+        start = self.world.room(START_ROOM_ID)
+        ids = [door._destination.room_id for door in start.doors.values()]
+        ids += [door._destination.room_id
+                for door in self.first.doors.values()]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertNotIn(START_ROOM_ID, ids)
+        self.assertEqual(self.first.name, f"Room {self.first.room_id}")
+
+    def test_descriptions_do_not_repeat(self):
+        """
+        Test that rooms only share a description once the pool is used up.
+        """
+        world = World(seed=11)
+        pool = len(get_registry().room_descriptions)
+        while len(world) < pool:
+            world.discover(len(world) - 1)
+        descriptions = [world.room(room_id).description
+                        for room_id in range(pool)]
+        self.assertEqual(len(set(descriptions)), pool)
+
+    def test_walk_does_not_repeat(self):
+        """
+        Test that a player walking through doors sees no description twice
+        before the pool is used up, however many rooms the doors allocate.
+        """
+        world = World(seed=11)
+        content = get_registry()
+        pool = len(content.room_descriptions)
+        current = START_ROOM_ID
+        descriptions = [world.room(current).description]
+        doors = []
+        while len(descriptions) < pool:
+            world.discover(current)
+            doors += [built.description
+                      for built in world.room(current).doors.values()]
+            current = world.neighbours(current)[-1]
+            descriptions.append(world.room(current).description)
+        self.assertGreater(len(world), 2 * pool)
+        self.assertEqual(len(set(descriptions)), pool)
+        door_pool = len(content.door_descriptions)
+        self.assertEqual(len(set(doors[:door_pool])),
+                         min(len(doors), door_pool))
+
+    def test_unused_content_versions_are_not_kept(self):
+        """
+        Test that only content versions rooms were created with are kept.
+        """
+        world = World(seed=11)
+        base = world.content
+        for version in range(1, 5):
+            world.content = ContentRegistry.from_data({}, version=version)
+        self.assertEqual(len(world.versions), 1)
+        self.assertIs(world.content_of(START_ROOM_ID), base)
+
+        world.discover(START_ROOM_ID)
+        self.assertEqual(len(world.versions), 2)
+        self.assertIs(world.content_of(len(world) - 1), world.content)
+        self.assertIs(world.content_of(START_ROOM_ID), base)
+
+    def test_explored(self):
+        """
+        Test that doors know whether their room has been built.
+        """
+        doors = list(self.world.room(START_ROOM_ID).doors.values())
+        self.assertTrue(doors[0].explored)
+        self.assertFalse(doors[1].explored)
+
+    def test_starting_room_has_every_trader(self):
+        """
+        Test that the starting room offers every trader.
+        """
+        start = self.world.room(START_ROOM_ID)
+        self.assertEqual([trader.name for trader in start.traders],
+                         [trader['name'] for trader in
+                          get_registry().traders])
+
+    def test_room_is_a_view(self):
+        """
+        Test that a room reads its description from the world's columns.
+        """
+        index = self.world.description_index[self.first.room_id]
+        self.assertEqual(self.first.description,
+                         get_registry().room_descriptions[index])
+        self.assertEqual(list(self.world.neighbours(self.first.room_id)),
+                         [door._destination.room_id
+                          for door in self.first.doors.values()])
+
+    def test_discover_without_rooms(self):
+        """
+        Test that a large world is explored through its columns alone.
+        """
+        world = World(seed=7)
+        frontier = [START_ROOM_ID]
+        while len(world) < 10000:
+            room_id = frontier.pop(0)
+            world.discover(room_id)
+            frontier.extend(world.neighbours(room_id))
+        self.assertEqual(len(world.rooms), 0)
+        columns = (world.description_index, world.trader_index,
+                   world.flags, world.content_version, world.door_start,
+                   world.door_count, world.entry_door)
+        bytes_per_room = sum(column.itemsize for column in columns)
+        self.assertLessEqual(bytes_per_room, 32)
+        self.assertTrue(all(len(column) == len(world)
+                            for column in columns))
+
+    @patch('random.randint', return_value=1)
+    @patch('builtins.input', return_value='-1')
+    @patch('builtins.print')
+    def test_player_changes_are_recorded(self, mock_print, mock_input,
+                                         mock_randint):
+        """
+        Test that the world remembers what a player changed in a room.
+        """
+        hero = player(self.first)
+        hero.look_for_items()
+        self.assertEqual(self.world.changes(self.first.room_id),
+                         {'looted': True})
+        self.assertEqual(self.world.changes(START_ROOM_ID), {})
+
+    @patch('builtins.print')
+    def test_fights_are_kept_per_room(self, mock_print):
+        """
+        Test that fighting in one room leaves its siblings untouched.
+        """
+        doors = list(self.world.room(START_ROOM_ID).doors.values())
+        hero = player(doors[0].destination)
+        hero.fought_in_room[hero.room_key] = True
+        hero.current_room = doors[1].destination
+        self.assertEqual(hero.room_key, doors[1]._destination.room_id)
+        with patch('random.randint', return_value=0):
+            hero.look_for_fight()
+        mock_print.assert_called_once_with(
+            "     There are no monsters to fight right now.")
+        self.assertEqual(list(hero.fought_in_room), [self.first.room_id])
+
+    @patch('random.randint', return_value=2)
+    @patch('builtins.input', return_value='-1')
+    @patch('builtins.print')
+    def test_encounters_are_kept(self, mock_print, mock_input,
+                                 mock_randint):
+        """
+        Test that backing out of a fight leaves the same monsters waiting
+        in the room, even after it was dropped from memory.
+        """
+        hero = player(self.first)
+        hero.look_for_fight()
+        met = self.world.changes(self.first.room_id)['monsters']
+        self.assertEqual(len(met), 2)
+
+        self.world.release(self.first.room_id)
+        hero.current_room = self.world.room(self.first.room_id)
+        hero.defeated_enemy.append(met[0])
+        mock_print.reset_mock()
+        hero.look_for_fight()
+        self.assertEqual(mock_randint.call_count, 1)
+        mock_print.assert_any_call("     \nYou encounter 1 monster(s)!")
+        self.assertTrue(any(call.args[0].startswith(f"(0) {met[1]}:")
+                            for call in mock_print.call_args_list))
+
+    @patch('builtins.print')
+    def test_fast_travel(self, mock_print):
+        """
+        Test that a player travels back to a room explored earlier.
+        """
+        hero = player(self.world.room(START_ROOM_ID))
+        with patch('builtins.input', return_value='0'):
+            hero.interact()
+        self.assertIs(hero.current_room, self.first)
+        with patch('builtins.input', return_value='1'):
+            hero.interact()
+        deeper = hero.current_room.room_id
+        self.assertEqual(hero.explored.route(deeper, START_ROOM_ID),
+                         [deeper, self.first.room_id, START_ROOM_ID])
+
+        with patch('builtins.input', return_value='0'):
+            hero.fast_travel()
+        self.assertIs(hero.current_room, self.world.room(START_ROOM_ID))
+        mock_print.assert_any_call("  \nYou retrace your steps through 2 "
+                                   "rooms")
+        self.assertEqual(len(hero.visited_rooms), 3)
+
+    @patch('builtins.print')
+    def test_reentering_does_not_pay(self, mock_print):
+        """
+        Test that walking into an explored room again neither pays a coin
+        nor counts as visiting a new room.
+        """
+        hero = player(self.world.room(START_ROOM_ID))
+        with patch('builtins.input', return_value='0'):
+            hero.interact()
+        coins = hero.coins
+        visited = list(hero.visited_rooms)
+        for _ in range(4):
+            with patch('builtins.input', return_value='0'):
+                hero.fast_travel()
+            self.assertEqual(hero.room_key, START_ROOM_ID)
+            with patch('builtins.input', return_value='0'):
+                hero.interact()
+            self.assertIs(hero.current_room, self.first)
+        self.assertEqual(hero.coins, coins)
+        self.assertEqual(hero.visited_rooms, visited)
+        self.assertEqual(visited, ["Starting room", self.first.name])
+
+    @patch('random.randint', return_value=1)
+    @patch('builtins.print')
+    def test_fast_travel_does_not_refill_rooms(self, mock_print,
+                                               mock_randint):
+        """
+        Test that travelling back to a searched room does not allow
+        searching it again.
+        """
+        hero = player(self.world.room(START_ROOM_ID))
+        with patch('builtins.input', return_value='0'):
+            hero.interact()
+        hero.look_for_items()
+        for _ in range(5):
+            with patch('builtins.input', return_value='0'):
+                hero.fast_travel()
+            self.assertTrue(hero.looked_for_items or
+                            hero.room_key == START_ROOM_ID)
+            hero.look_for_items()
+        self.assertEqual(self.world.changes(START_ROOM_ID), {'looted': True})
+        self.assertEqual(mock_randint.call_count, 2)
+        mock_print.assert_any_call(
+            "\nYou have already looked for items in this room.")
+
+
+if __name__ == '__main__':
+    unittest.main()